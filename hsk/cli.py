@@ -63,7 +63,10 @@ def main() -> None:
     # Initialize Engine
     try:
         data_engine = DataEngine()
-        engine = HSKTestEngine(level, data_engine, num_questions=num_questions)
+        # Lazy: questions are built as they are asked, a few ahead in the background
+        engine = HSKTestEngine(
+            level, data_engine, num_questions=num_questions, lazy=True, prefetch=3
+        )
     except FileNotFoundError as e:
         print(f"Error: {e}")
         print("Required data files not found. Please ensure data is installed.")
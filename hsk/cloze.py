@@ -0,0 +1,158 @@
+"""Cloze sentence selection shared by the test engine and ingestion.
+
+Sentence ranking only depends on the word and the level tier, so it is
+computed once per (word, tier) and cached on the word pool (see
+``WordPool.cloze_candidates``). Ingestion applies the same ranking while
+streaming the sentence corpus (``TopClozeSentences``), so level files ship
+each word's best sentences already in ranked order.
+"""
+
+import heapq
+from collections.abc import Sequence
+
+# RHETORICAL COMPLEXITY MARKERS (C2 Level)
+RHETORICAL_MARKERS = (
+    "与其",
+    "毋宁",
+    "甚至",
+    "即便",
+    "既然",
+    "不仅",
+    "岂",
+    "何必",
+    "固然",
+    "何况",
+    "所谓",
+    "诚然",
+)
+
+# REGISTER TRIGGER KEYWORDS (For Discrimination)
+REGISTER_TRIGGERS = (
+    "政治",
+    "理论",
+    "学术",
+    "机构",
+    "规则",
+    "逻辑",
+    "范畴",
+    "哲学",
+    "利益",
+    "关系",
+)
+
+# FACTOID BLACKLIST (Biology, Chemistry, Basic Physics)
+FACTOID_KEYWORDS = frozenset(
+    {
+        "二氧化碳",
+        "氧气",
+        "光合作用",
+        "肺",
+        "太阳系",
+        "原子",
+        "分子",
+        "科学发现",
+        "排出",
+        "吸收",
+    }
+)
+
+# Sentences offered per cloze question (one is picked at random)
+CLOZE_CANDIDATES = 3
+
+# Longest sentences kept when no sentence passes ``is_valid_cloze_sentence``
+FALLBACK_SENTENCES = 5
+
+
+def min_sentence_length(level: int) -> int:
+    """PRIORITIZE COMPLEXITY & CONTEXT: minimum cloze sentence length for a level."""
+    if level >= 7:
+        return 45  # C2 Level Prose
+    return 8
+
+
+def c2_score(s: str) -> int:
+    """v13 Scorer: Rhetoric + Register + Depth + Colon/Semicolon."""
+    score = len(s)
+    score += s.count("，") * 15
+    score += (s.count("：") + s.count("；")) * 25
+    score += sum(50 for m in RHETORICAL_MARKERS if m in s)
+    score += sum(30 for t in REGISTER_TRIGGERS if t in s)  # Bonus for academic context
+    return score
+
+
+def is_valid_cloze_sentence(hanzi: str, s: str, min_len: int) -> bool:
+    # Filter for sentences that have enough depth
+    if len(s) < min_len:
+        return False
+    # ANTI-LEAK: Word cannot appear more than once
+    if s.count(hanzi) > 1:
+        return False
+    # ANTI-FACTOID: Deprioritize simple scientific facts
+    return not any(k in s for k in FACTOID_KEYWORDS)
+
+
+def rank_cloze_sentences(hanzi: str, sentences: Sequence[str], min_len: int) -> list[str]:
+    """Returns ``hanzi``'s usable cloze sentences, best first."""
+    valid_sentences = [s for s in sentences if is_valid_cloze_sentence(hanzi, s, min_len)]
+
+    if not valid_sentences:
+        valid_sentences = [s for s in sentences if s.count(hanzi) == 1]
+        valid_sentences = sorted(valid_sentences, key=len, reverse=True)[:FALLBACK_SENTENCES]
+
+    if not valid_sentences:
+        valid_sentences = list(sentences[:1])
+
+    valid_sentences.sort(key=c2_score, reverse=True)
+    return valid_sentences
+
+
+class TopClozeSentences:
+    """Streaming top-``k`` of one word's sentences, in ``rank_cloze_sentences`` order.
+
+    ``ranked()`` equals ``rank_cloze_sentences(hanzi, offered, min_len)[:k]``
+    over every sentence offered, in offer order, while only a bounded heap of
+    ``max(k, FALLBACK_SENTENCES)`` sentences is held.
+    """
+
+    def __init__(self, hanzi: str, min_len: int, k: int):
+        self.hanzi = hanzi
+        self.min_len = min_len
+        self.k = k
+        self._capacity = max(k, FALLBACK_SENTENCES)
+        # Min-heap of (tier, rank, -sequence, sentence): the root is the worst kept
+        self._heap: list[tuple[int, int, int, str]] = []
+        self._offered = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def add(self, sentence: str) -> None:
+        # Tiers mirror rank_cloze_sentences: valid sentences (by C2 score), then
+        # single-occurrence fallbacks (by length), then anything (first offered)
+        if is_valid_cloze_sentence(self.hanzi, sentence, self.min_len):
+            entry = (2, c2_score(sentence), -self._offered, sentence)
+        elif sentence.count(self.hanzi) == 1:
+            entry = (1, len(sentence), -self._offered, sentence)
+        else:
+            entry = (0, 0, -self._offered, sentence)
+        self._offered += 1
+
+        if len(self._heap) < self._capacity:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def ranked(self) -> list[str]:
+        """The kept sentences a cloze question would draw from, best first."""
+        if not self._heap:
+            return []
+        best = sorted(self._heap, reverse=True)
+        tier = best[0][0]
+        if tier == 0:
+            return [best[0][3]]
+        kept = [entry for entry in best if entry[0] == tier]
+        if tier == 1:
+            kept = kept[:FALLBACK_SENTENCES]
+        # Stable, like rank_cloze_sentences: C2 score ties keep the order above
+        ranked = sorted((entry[3] for entry in kept), key=c2_score, reverse=True)
+        return ranked[: self.k]
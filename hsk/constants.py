@@ -23,6 +23,14 @@ HSK_EXAM_STRUCTURE = {
     9: 98,
 }
 
+# Exam modes: a short practice round or a full-length real exam
+MODE_PRACTICE = "practice"
+MODE_EXAM = "exam"
+PRACTICE_QUESTIONS = 10
+
+# HSK 3.0 groups levels 7-9 into a single Advanced Band with a shared syllabus
+ADVANCED_BAND_LEVELS = (7, 8, 9)
+
 # HSK Level Descriptions
 LEVEL_DESCRIPTIONS = {
     1: "Beginner - Understand and use simple Chinese words and phrases",
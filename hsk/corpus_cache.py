@@ -0,0 +1,135 @@
+"""Compiled corpus cache for parsed level data.
+
+Parsing ``level_N.json`` and rebuilding every ``Word``/``GrammarRule`` is the
+dominant cost of starting an exam (levels 7-9 are ~2.9 MB of indented JSON
+each). The parsed objects are pickled once into a cache directory and reused
+for as long as the JSON source is unchanged.
+
+Each cache file holds two pickles: a small header describing the source it was
+built from (and any other files the payload was built from, such as the
+sentence store), followed by the payload. The header is checked first so a
+stale cache is rejected without deserializing the payload.
+"""
+
+import contextlib
+import hashlib
+import os
+import pickle
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Optional
+
+# Bump whenever the pickled payload layout (or the models it contains) changes.
+CORPUS_FORMAT_VERSION = 3
+
+CACHE_SUFFIX = ".corpus"
+
+
+def file_digest(path: Path) -> str:
+    """Returns the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_path_for(source: Path, cache_dir: Path) -> Path:
+    return cache_dir / f"{source.stem}{CACHE_SUFFIX}"
+
+
+def _file_stamp(path: Path) -> dict[str, Any]:
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": file_digest(path)}
+
+
+def _source_header(source: Path, dependencies: Iterable[Path] = ()) -> dict[str, Any]:
+    return {
+        "version": CORPUS_FORMAT_VERSION,
+        **_file_stamp(source),
+        "dependencies": {str(path): _file_stamp(path) for path in dependencies},
+    }
+
+
+def _stamp_matches(stamp: Any, path: Path) -> bool:
+    if not isinstance(stamp, dict):
+        return False
+    stat = path.stat()
+    return bool(stamp.get("size") == stat.st_size and stamp.get("mtime_ns") == stat.st_mtime_ns)
+
+
+def _file_matches(stamp: Any, path: Path) -> bool:
+    if _stamp_matches(stamp, path):
+        return True
+
+    # Touched or copied but possibly unchanged: fall back to the content hash
+    return isinstance(stamp, dict) and stamp.get("digest") == file_digest(path)
+
+
+def _header_matches(header: Any, source: Path) -> bool:
+    if not isinstance(header, dict) or header.get("version") != CORPUS_FORMAT_VERSION:
+        return False
+    if not _file_matches(header, source):
+        return False
+    for path, stamp in header.get("dependencies", {}).items():
+        if not Path(path).exists() or not _file_matches(stamp, Path(path)):
+            return False
+    return True
+
+
+def source_digest(source: Path, cache_dir: Optional[Path] = None) -> str:
+    """Returns the content digest of ``source``.
+
+    Reuses the digest recorded in a current cache header when one exists, so
+    comparing sources does not require re-hashing them on every load.
+    """
+    if cache_dir is not None:
+        try:
+            with open(cache_path_for(source, cache_dir), "rb") as f:
+                header = pickle.load(f)
+            if header.get("version") == CORPUS_FORMAT_VERSION and _stamp_matches(header, source):
+                return str(header["digest"])
+        except Exception:
+            pass
+
+    return file_digest(source)
+
+
+def load_compiled(source: Path, cache_dir: Path) -> Optional[Any]:
+    """Returns the cached payload for ``source``, or None if missing or stale."""
+    path = cache_path_for(source, cache_dir)
+    if not path.exists():
+        return None
+
+    try:
+        with open(path, "rb") as f:
+            header = pickle.load(f)
+            if not _header_matches(header, source):
+                return None
+            return pickle.load(f)
+    except Exception:
+        # Any unreadable or truncated cache file is treated as a miss
+        return None
+
+
+def store_compiled(
+    source: Path, cache_dir: Path, payload: Any, dependencies: Iterable[Path] = ()
+) -> None:
+    """Writes ``payload`` to the cache for ``source``.
+
+    The entry is only reused while ``source`` and every file in ``dependencies``
+    are unchanged. The cache is best-effort: an unwritable cache directory
+    (e.g. a read-only install) silently disables it rather than failing the load.
+    """
+    path = cache_path_for(source, cache_dir)
+    tmp_path = path.with_suffix(f"{CACHE_SUFFIX}.{os.getpid()}.tmp")
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump(_source_header(source, dependencies), f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
@@ -0,0 +1,423 @@
+"""Process-wide registry of parsed level data.
+
+Every ``DataEngine`` pointed at the same data directory shares one
+``CorpusRegistry`` (one per compiled cache location), which parses each level
+once and hands out immutable ``LevelSnapshot`` objects. A node serving all nine
+levels therefore holds one copy of each level instead of one per engine. An
+optional memory budget, covering the snapshots and the word pools and indexes
+built over them, evicts least-recently-used levels; engines still holding an
+evicted snapshot keep it alive until they are dropped.
+
+Level files may reference their example sentences by ID in the shared
+sentence store (see ``hsk.sentence_store``); the store is read the first time
+such a level is parsed and kept for the other levels.
+"""
+
+import json
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Collection, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Optional
+
+from hsk.constants import ADVANCED_BAND_LEVELS
+from hsk.corpus_cache import load_compiled, source_digest, store_compiled
+from hsk.distractor_table import DistractorTable, load_distractor_table
+from hsk.models import GrammarRule, Word
+from hsk.sentence_store import (
+    SENTENCE_STORE_FILE,
+    STORE_DIGEST_KEY,
+    SentenceStore,
+    check_store_digest,
+    load_sentence_store,
+    uses_sentence_store,
+)
+from hsk.word_pool import WordPool
+
+
+@dataclass(frozen=True)
+class LevelSnapshot:
+    """Read-only parsed data for one level source."""
+
+    level: int  # Canonical level (lowest band level with identical content)
+    digest: str  # SHA-256 of the level source
+    words: Sequence[Word]  # A tuple, or a read-only view (see hsk.shared_corpus)
+    grammar_rules: tuple[GrammarRule, ...]
+    by_hanzi: Mapping[str, Word]  # Hanzi -> Word index over ``words``
+
+
+class CorpusRegistry:
+    """Loads and shares level snapshots for one data directory."""
+
+    def __init__(
+        self,
+        data_path: Path,
+        cache_path: Optional[Path] = None,
+        memory_budget: Optional[int] = None,
+    ):
+        self.data_path = data_path
+        self.cache_path = cache_path
+        self.memory_budget = memory_budget  # Bytes; None disables eviction
+
+        # Digest -> Snapshot in least- to most-recently-used order
+        self._snapshots: OrderedDict[str, LevelSnapshot] = OrderedDict()
+        self._snapshot_nbytes: dict[str, int] = {}
+        self._level_digests: dict[int, str] = {}
+        self._radicals: Optional[Mapping[str, str]] = None
+        # Source digests of a band -> WordPool built over their words
+        self._pools: dict[tuple[str, ...], WordPool] = {}
+        self._pool_nbytes: dict[tuple[str, ...], int] = {}
+        self._distractor_table: Optional[DistractorTable] = None
+        self._distractor_table_loaded = False
+        self._sentence_store: Optional[tuple[SentenceStore, str]] = None
+
+        # One lock per level so concurrent requests for a level trigger a single load
+        self._level_locks: dict[int, threading.Lock] = {}
+        self._guard = threading.RLock()
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated resident size of the snapshots and word pools currently held."""
+        with self._guard:
+            return self._measure()
+
+    def loaded_levels(self) -> list[int]:
+        with self._guard:
+            return sorted(
+                level for level, digest in self._level_digests.items() if digest in self._snapshots
+            )
+
+    def get_level(self, level: int) -> LevelSnapshot:
+        """Returns the snapshot for ``level``, loading it on first use."""
+        snapshot = self._lookup(level)
+        if snapshot is not None:
+            return snapshot
+
+        with self._level_lock(level):
+            snapshot = self._lookup(level)
+            if snapshot is None:
+                snapshot = self._load_level(level)
+            return snapshot
+
+    def get_radicals(self) -> Mapping[str, str]:
+        """Returns the read-only character-to-radical mapping."""
+        with self._guard:
+            if self._radicals is None:
+                self._radicals = MappingProxyType(self._load_radicals())
+            return self._radicals
+
+    def invalidate(self, level: int) -> None:
+        """Forgets ``level`` (and band levels sharing its data) so it is re-read."""
+        with self._level_lock(level), self._guard:
+            digest = self._level_digests.pop(level, None)
+            if digest is None:
+                return
+            for level_id, other in list(self._level_digests.items()):
+                if other == digest:
+                    del self._level_digests[level_id]
+            self._drop_snapshot(digest)
+
+    def get_word_pool(self, digests: tuple[str, ...], words: Sequence[Word]) -> WordPool:
+        """Returns the shared pool for the level sources ``digests`` (whose words are ``words``)."""
+        with self._guard:
+            pool = self._pools.get(digests)
+            if pool is None:
+                pool = WordPool(words, digests=digests)
+                self._pools[digests] = pool
+                if self.memory_budget is not None:
+                    self._evict(keep=digests)
+            return pool
+
+    def get_distractor_table(self) -> Optional[DistractorTable]:
+        """Returns the offline distractor table for this data directory, if one was built."""
+        with self._guard:
+            if not self._distractor_table_loaded:
+                self._distractor_table = load_distractor_table(self.data_path)
+                self._distractor_table_loaded = True
+            return self._distractor_table
+
+    def invalidate_radicals(self) -> None:
+        with self._guard:
+            self._radicals = None
+
+    def clear(self) -> None:
+        with self._guard:
+            self._snapshots.clear()
+            self._snapshot_nbytes.clear()
+            self._pools.clear()
+            self._pool_nbytes.clear()
+            self._distractor_table = None
+            self._distractor_table_loaded = False
+            self._level_digests.clear()
+            self._radicals = None
+            self._sentence_store = None
+
+    def _lookup(self, level: int) -> Optional[LevelSnapshot]:
+        with self._guard:
+            digest = self._level_digests.get(level)
+            if digest is None or digest not in self._snapshots:
+                return None
+            self._snapshots.move_to_end(digest)
+            return self._snapshots[digest]
+
+    def _level_lock(self, level: int) -> threading.Lock:
+        with self._guard:
+            if level not in self._level_locks:
+                self._level_locks[level] = threading.Lock()
+            return self._level_locks[level]
+
+    def _level_path(self, level: int) -> Path:
+        return self.data_path / f"level_{level}.json"
+
+    def _source_digest(self, level: int) -> str:
+        return source_digest(self._level_path(level), self.cache_path)
+
+    def _find_shared_source(self, level: int, digest: str) -> int:
+        """Returns the lowest band level whose source is identical to ``level``'s."""
+        for other in get_band_levels(level):
+            if other >= level:
+                break
+            if self._level_path(other).exists() and self._source_digest(other) == digest:
+                return other
+        return level
+
+    def _load_level(self, level: int) -> LevelSnapshot:
+        file_path = self._level_path(level)
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"Data file for level {level} not found: {file_path}")
+
+        digest = self._source_digest(level)
+        canonical = self._find_shared_source(level, digest)
+        if canonical != level:
+            snapshot = self.get_level(canonical)
+            with self._guard:
+                self._level_digests[level] = snapshot.digest
+            return snapshot
+
+        words, grammar = self._read_level(file_path, level)
+        snapshot = LevelSnapshot(
+            level=level,
+            digest=digest,
+            words=tuple(words),
+            grammar_rules=tuple(grammar),
+            by_hanzi=MappingProxyType({w.hanzi: w for w in words}),
+        )
+
+        with self._guard:
+            self._snapshots[digest] = snapshot
+            self._snapshots.move_to_end(digest)
+            self._level_digests[level] = digest
+            if self.memory_budget is not None:
+                self._evict(keep=(digest,))
+        return snapshot
+
+    def _read_level(self, file_path: Path, level: int) -> tuple[list[Word], list[GrammarRule]]:
+        """Reads a level from the compiled cache, or parses and caches the JSON."""
+        if self.cache_path:
+            cached = load_compiled(file_path, self.cache_path)
+            if cached is not None:
+                words, grammar = cached
+                return words, grammar
+
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                data = json.load(f)
+
+            words, grammar = self._parse_level(data, level)
+        except json.JSONDecodeError:
+            print(f"Error decoding JSON for level {level}")
+            raise
+        except KeyError as e:
+            print(f"Missing required field in data for level {level}: {e}")
+            raise
+
+        if self.cache_path:
+            # Sentences resolved from the store go stale with it, not just with the level file
+            dependencies = (
+                [self.data_path / SENTENCE_STORE_FILE] if uses_sentence_store(data) else []
+            )
+            store_compiled(file_path, self.cache_path, (words, grammar), dependencies)
+        return words, grammar
+
+    def _parse_level(
+        self, data: dict[str, Any], level: int
+    ) -> tuple[list[Word], list[GrammarRule]]:
+        """Builds the Word/GrammarRule objects for a decoded level file."""
+        store = None
+        if uses_sentence_store(data):
+            store = self._get_sentence_store(data, self._level_path(level))
+
+        # Load Words (Deduplicated)
+        words_data = data.get("vocabulary", [])
+        unique_words = {}
+        for w in words_data:
+            hanzi = w["hanzi"]
+            if hanzi not in unique_words:
+                unique_words[hanzi] = w
+
+        words = [
+            Word(
+                hanzi=w["hanzi"],
+                pinyin=w["pinyin"],
+                meaning=w["meaning"],
+                level=level,
+                radicals=w.get("radicals", []),
+                sentences=(
+                    store.resolve(w.get("sentences", []))
+                    if store is not None
+                    else w.get("sentences", [])
+                ),
+                pos=w.get("pos", []),
+                frequency=w.get("frequency", 0),
+            )
+            for w in unique_words.values()
+        ]
+
+        # Load Grammar
+        grammar_data = data.get("grammar", [])
+        grammar = [
+            GrammarRule(
+                name=g["name"],
+                description=g["description"],
+                structure=g["structure"],
+                level=level,
+                example=g["example"],
+            )
+            for g in grammar_data
+        ]
+
+        return words, grammar
+
+    def _get_sentence_store(self, data: dict[str, Any], source: Path) -> SentenceStore:
+        """Returns the sentence store ``data`` refers to, (re)loading it if needed."""
+        with self._guard:
+            if self._sentence_store is None or self._sentence_store[1] != data[STORE_DIGEST_KEY]:
+                self._sentence_store = load_sentence_store(self.data_path)
+            if self._sentence_store is None:
+                raise FileNotFoundError(f"{source} references a sentence store, but none exists")
+            store, digest = self._sentence_store
+            check_store_digest(data, digest, source)
+            return store
+
+    def _load_radicals(self) -> Mapping[str, str]:
+        file_path = self.data_path / "radicals.json"
+        if not file_path.exists():
+            # Warn but don't fail if radicals are optional for now
+            print(f"Warning: Radicals file not found: {file_path}")
+            return {}
+
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                radicals: dict[str, str] = json.load(f)
+                return radicals
+        except json.JSONDecodeError:
+            print("Error decoding radicals JSON")
+            return {}
+
+    def _drop_snapshot(self, digest: str) -> None:
+        self._snapshots.pop(digest, None)
+        self._snapshot_nbytes.pop(digest, None)
+        for key in [key for key in self._pools if digest in key]:
+            del self._pools[key]
+            self._pool_nbytes.pop(key, None)
+
+    def _measure(self) -> int:
+        # Sizing walks every object, so it is deferred until a budget needs it
+        for digest, snapshot in self._snapshots.items():
+            if digest not in self._snapshot_nbytes:
+                self._snapshot_nbytes[digest] = deep_sizeof(snapshot)
+        # Pools build their indexes lazily, so they are re-measured every time. Their
+        # words belong to the snapshots and are not counted again.
+        self._pool_nbytes = {
+            key: deep_sizeof(pool, exclude=pool.words) for key, pool in self._pools.items()
+        }
+        return sum(self._snapshot_nbytes.values()) + sum(self._pool_nbytes.values())
+
+    def _evict(self, keep: Collection[str]) -> None:
+        """Drops least-recently-used snapshots (other than ``keep``) until the budget is met.
+
+        Runs whenever a level or a word pool is added, so pools built after their
+        levels are counted too.
+        """
+        assert self.memory_budget is not None
+        total = self._measure()
+        for digest in list(self._snapshots):
+            if total <= self.memory_budget:
+                break
+            if digest in keep:
+                continue
+            total -= self._snapshot_nbytes.get(digest, 0)
+            total -= sum(n for key, n in self._pool_nbytes.items() if digest in key)
+            self._drop_snapshot(digest)
+            for level_id, other in list(self._level_digests.items()):
+                if other == digest:
+                    del self._level_digests[level_id]
+
+
+# (data directory, compiled cache directory) -> registry
+_registries: dict[tuple[Path, Optional[Path]], CorpusRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(
+    data_path: Path,
+    cache_path: Optional[Path] = None,
+    memory_budget: Optional[int] = None,
+) -> CorpusRegistry:
+    """Returns the process-wide registry for ``data_path`` and ``cache_path``.
+
+    Engines using a different cache location (or none) get their own registry.
+    ``memory_budget`` only applies when the registry is created; adjust it on the
+    returned registry to change it later.
+    """
+    key = (data_path.resolve(), cache_path.resolve() if cache_path else None)
+    with _registries_lock:
+        if key not in _registries:
+            _registries[key] = CorpusRegistry(data_path, cache_path, memory_budget)
+        return _registries[key]
+
+
+def get_band_levels(level: int) -> tuple[int, ...]:
+    """Returns the levels examined together with ``level`` (its HSK band)."""
+    if level in ADVANCED_BAND_LEVELS:
+        return ADVANCED_BAND_LEVELS
+    return (level,)
+
+
+def deep_sizeof(obj: Any, exclude: Iterable[Any] = ()) -> int:
+    """Estimates the memory held by ``obj`` and everything it references.
+
+    Objects reachable through several paths (e.g. shared or interned strings)
+    are counted once. Objects in ``exclude`` (and anything only reachable
+    through them) are not counted.
+    """
+    seen: set[int] = {id(o) for o in exclude}
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        if isinstance(current, (str, bytes, int, float, bool)) or current is None:
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+
+        if hasattr(current, "__dict__"):
+            stack.append(vars(current))
+        for cls in type(current).__mro__:
+            slots = getattr(cls, "__slots__", ())
+            for slot in (slots,) if isinstance(slots, str) else slots:
+                if slot not in ("__dict__", "__weakref__") and hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+    return total
@@ -1,95 +1,224 @@
-import json
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 from typing import Optional
 
+from hsk.corpus_registry import CorpusRegistry, LevelSnapshot, get_band_levels, get_registry
+from hsk.distractor_table import PoolRankings, distractor_tier
 from hsk.models import GrammarRule, Word
+from hsk.word_pool import WordPool
 
 
 class DataEngine:
-    """Handles loading and accessing HSK data."""
-
-    def __init__(self, data_dir: Optional[str] = None):
+    """Handles loading and accessing HSK data.
+
+    Parsed levels come from a ``CorpusRegistry`` shared by every engine using the
+    same data directory and compiled cache, so each engine only holds references
+    to read-only snapshots.
+    """
+
+    def __init__(
+        self,
+        data_dir: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        use_cache: bool = True,
+        registry: Optional[CorpusRegistry] = None,
+    ):
         if data_dir:
             self.data_path = Path(data_dir)
         else:
             # Default to 'data' directory relative to this file
             self.data_path = Path(__file__).parent / "data"
 
-        self.words: dict[int, list[Word]] = {}  # Level -> List[Word]
-        self.grammar_rules: dict[int, list[GrammarRule]] = {}  # Level -> List[GrammarRule]
-        self.radicals: dict[str, str] = {}  # Character -> Radical
+        # Compiled corpus cache (see hsk.corpus_cache), kept next to the sources by default
+        self.cache_path: Optional[Path] = None
+        if use_cache:
+            self.cache_path = Path(cache_dir) if cache_dir else self.data_path / ".cache"
+
+        self.registry = registry or get_registry(self.data_path, self.cache_path)
+
+        self.words: dict[int, Sequence[Word]] = {}  # Level -> List[Word]
+        self.grammar_rules: dict[int, Sequence[GrammarRule]] = {}  # Level -> List[GrammarRule]
+        self.radicals: Mapping[str, str] = {}  # Character -> Radical
+
+        # Levels whose source is byte-identical to a lower level of the same band share
+        # that level's parsed data instead of parsing their own copy.
+        self.level_aliases: dict[int, int] = {}  # Level -> Canonical Level
+
+        # Level -> (word list, Hanzi -> Word index); rebuilt if the list is replaced
+        self._word_indexes: dict[int, tuple[Sequence[Word], Mapping[str, Word]]] = {}
+
+        self._snapshots: dict[int, LevelSnapshot] = {}
+        # Band level -> (word list, pool) for words assigned directly rather than loaded
+        self._local_pools: dict[int, tuple[Sequence[Word], WordPool]] = {}
+
+        self._loaded_levels: set[int] = set()
+        self._radicals_loaded = False
 
     def load_level_data(self, level: int) -> None:
-        """Loads vocabulary and grammar for a specific level."""
-        file_path = self.data_path / f"level_{level}.json"
-
-        if not file_path.exists():
-            raise FileNotFoundError(f"Data file for level {level} not found: {file_path}")
-
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Load Words (Deduplicated)
-            words_data = data.get("vocabulary", [])
-            unique_words = {}
-            for w in words_data:
-                hanzi = w["hanzi"]
-                if hanzi not in unique_words:
-                    unique_words[hanzi] = w
-
-            self.words[level] = [
-                Word(
-                    hanzi=w["hanzi"],
-                    pinyin=w["pinyin"],
-                    meaning=w["meaning"],
-                    level=level,
-                    radicals=w.get("radicals", []),
-                    sentences=w.get("sentences", []),
-                    pos=w.get("pos", []),
-                    frequency=w.get("frequency", 0),
-                )
-                for w in unique_words.values()
-            ]
-
-            # Load Grammar
-            grammar_data = data.get("grammar", [])
-            self.grammar_rules[level] = [
-                GrammarRule(
-                    name=g["name"],
-                    description=g["description"],
-                    structure=g["structure"],
-                    level=level,
-                    example=g["example"],
-                )
-                for g in grammar_data
-            ]
-
-        except json.JSONDecodeError:
-            print(f"Error decoding JSON for level {level}")
-            raise
-        except KeyError as e:
-            print(f"Missing required field in data for level {level}: {e}")
-            raise
+        """Loads vocabulary and grammar for a specific level.
 
-    def load_radicals(self) -> None:
-        """Loads character-to-radical mapping."""
-        file_path = self.data_path / "radicals.json"
-        if not file_path.exists():
-            # Warn but don't fail if radicals are optional for now
-            print(f"Warning: Radicals file not found: {file_path}")
+        Already-loaded levels are skipped; use ``reload``/``invalidate`` to pick up
+        changed data. Concurrent loads of a level are coalesced by the registry.
+        """
+        if level in self._loaded_levels:
             return
 
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                self.radicals = json.load(f)
-        except json.JSONDecodeError:
-            print("Error decoding radicals JSON")
+        snapshot = self.registry.get_level(level)
+        self.words[level] = snapshot.words
+        self.grammar_rules[level] = snapshot.grammar_rules
+        self._word_indexes[level] = (snapshot.words, snapshot.by_hanzi)
+        self._snapshots[level] = snapshot
+        if snapshot.level != level:
+            self.level_aliases[level] = snapshot.level
+        self._loaded_levels.add(level)
+
+    def invalidate(self, level: int) -> None:
+        """Drops a loaded level (and any levels sharing its data) so it is re-read.
+
+        The level is also dropped from the shared registry; other engines keep
+        their current snapshot until they reload it.
+        """
+        self.registry.invalidate(level)
+
+        canonical = self.canonical_level(level)
+        dependents = [lvl for lvl, other in self.level_aliases.items() if other == canonical]
+        for level_id in {level, canonical, *dependents}:
+            self._loaded_levels.discard(level_id)
+            self.words.pop(level_id, None)
+            self.grammar_rules.pop(level_id, None)
+            self.level_aliases.pop(level_id, None)
+            self._word_indexes.pop(level_id, None)
+            self._snapshots.pop(level_id, None)
+
+    def reload(self, level: Optional[int] = None) -> None:
+        """Re-reads one level, or every loaded level plus radicals when ``level`` is None."""
+        if level is not None:
+            self.invalidate(level)
+            self.load_level_data(level)
+            return
+
+        levels = sorted(self._loaded_levels)
+        for level_id in levels:
+            self.invalidate(level_id)
+        for level_id in levels:
+            self.load_level_data(level_id)
 
-    def get_words_for_level(self, level: int) -> list[Word]:
+        self.registry.invalidate_radicals()
+        self._radicals_loaded = False
+        self.load_radicals()
+
+    def load_radicals(self) -> None:
+        """Loads character-to-radical mapping (once per engine, see ``reload``)."""
+        if self._radicals_loaded:
+            return
+        self.radicals = self.registry.get_radicals()
+        self._radicals_loaded = True
+
+    def get_words_for_level(self, level: int) -> Sequence[Word]:
         return self.words.get(level, [])
 
-    def get_grammar_for_level(self, level: int) -> list[GrammarRule]:
+    def get_words_for_band(self, level: int) -> Sequence[Word]:
+        """Returns the deduplicated vocabulary of every loaded level in ``level``'s band.
+
+        Levels sharing a canonical source contribute their word list only once.
+        """
+        sources = []
+        seen_lists = set()
+        for level_id in get_band_levels(level):
+            words = self.words.get(level_id)
+            if words is not None and id(words) not in seen_lists:
+                seen_lists.add(id(words))
+                sources.append(words)
+
+        if len(sources) == 1:
+            return sources[0]
+
+        word_map: dict[str, Word] = {}
+        for words in sources:
+            for w in words:
+                word_map.setdefault(w.hanzi, w)
+        return list(word_map.values())
+
+    def lookup_word(self, hanzi: str, level: Optional[int] = None) -> Optional[Word]:
+        """Finds a loaded word by hanzi in O(1).
+
+        Searches only ``level`` when given, otherwise the lowest loaded level
+        containing the word. Words of a band level sharing another level's data
+        are returned with the requested ``level``.
+        """
+        levels = [level] if level is not None else sorted(self.words)
+        for level_id in levels:
+            word = self._word_index(level_id).get(hanzi)
+            if word is not None:
+                if word.level != level_id and word.level == self.level_aliases.get(level_id):
+                    return word._replace(level=level_id)
+                return word
+        return None
+
+    def get_levels_for_hanzi(self, hanzi: str) -> list[int]:
+        """Returns every loaded level whose vocabulary contains ``hanzi``."""
+        return [level_id for level_id in sorted(self.words) if hanzi in self._word_index(level_id)]
+
+    def _word_index(self, level: int) -> Mapping[str, Word]:
+        words = self.words.get(level, ())
+        entry = self._word_indexes.get(level)
+        if entry is None or entry[0] is not words:
+            # Words assigned directly (rather than loaded) are indexed on first lookup
+            index: dict[str, Word] = {}
+            for w in words:
+                index.setdefault(w.hanzi, w)
+            entry = (words, index)
+            self._word_indexes[level] = entry
+        return entry[1]
+
+    def get_word_pool(self, level: int) -> WordPool:
+        """Returns the indexed pool over ``get_words_for_band(level)``.
+
+        Pools over registry-loaded levels are shared by every engine; pools over
+        words assigned directly to ``self.words`` are kept per engine.
+        """
+        words = self.get_words_for_band(level)
+
+        digests = []
+        for level_id in get_band_levels(level):
+            if level_id not in self.words:
+                continue
+            snapshot = self._snapshots.get(level_id)
+            if snapshot is None or snapshot.words is not self.words[level_id]:
+                break
+            if snapshot.digest not in digests:
+                digests.append(snapshot.digest)
+        else:
+            if digests:
+                return self.registry.get_word_pool(tuple(digests), words)
+
+        entry = self._local_pools.get(level)
+        if entry is None or entry[0] is not words:
+            entry = (words, WordPool(words))
+            self._local_pools[level] = entry
+        return entry[1]
+
+    def get_distractor_rankings(self, level: int) -> Optional[PoolRankings]:
+        """Returns the offline distractor rankings for ``level``'s word pool, if current.
+
+        Rankings are indexed like ``get_word_pool(level).words``; a table built
+        from other level sources is not returned.
+        """
+        pool = self.get_word_pool(level)
+        table = self.registry.get_distractor_table()
+        if table is None or pool.digests is None:
+            return None
+
+        rankings = table.get(pool.digests, distractor_tier(level), self.canonical_level(level))
+        if rankings is None or len(rankings) != len(pool):
+            return None
+        return rankings
+
+    def canonical_level(self, level: int) -> int:
+        """Returns the level whose parsed data ``level`` shares (itself if unshared)."""
+        return self.level_aliases.get(level, level)
+
+    def get_grammar_for_level(self, level: int) -> Sequence[GrammarRule]:
         return self.grammar_rules.get(level, [])
 
     def get_radical_hint(self, character: str) -> Optional[str]:
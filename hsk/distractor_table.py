@@ -0,0 +1,142 @@
+"""Precomputed nearest-distractor table.
+
+``scripts/build_distractor_table.py`` ranks every word's distractor
+candidates offline (with the same tier scorers ``HSKTestEngine`` uses) and
+writes the top-K per word to ``distractors.json``. At exam time the engine
+then reads a word's stored ranking instead of scoring candidates.
+
+Rankings are stored per word pool, identified by the digests of the level
+sources the pool was built from, so a table built from different data is
+ignored rather than misapplied. Each ranking is a flat ``[index, score, ...]``
+list of pool indices, best first.
+
+Tier 3 samples distractors from the whole top score tier, so a word whose tier
+holds more than K candidates is listed as truncated and ranked live instead.
+"""
+
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+DISTRACTOR_TABLE_VERSION = 2
+DISTRACTOR_TABLE_FILE = "distractors.json"
+DEFAULT_TOP_K = 12
+
+
+def distractor_tier(level: int) -> int:
+    """Returns the distractor discrimination tier (1-3) used for an exam level."""
+    if level >= 7:
+        return 3
+    elif 4 <= level <= 6:
+        return 2
+    return 1
+
+
+@dataclass(frozen=True)
+class PoolRankings:
+    """Stored rankings for one pool; ``rankings[i]`` belongs to the pool's i-th word."""
+
+    top_k: int
+    rankings: Sequence[Sequence[int]]
+    # Pool indices whose sampling tier did not fit in the stored top-K
+    truncated: frozenset[int] = frozenset()
+
+    def __len__(self) -> int:
+        return len(self.rankings)
+
+    def ranking(self, index: int) -> list[tuple[int, int]]:
+        """Returns the stored ``(candidate index, score)`` pairs for a word, best first."""
+        flat = self.rankings[index]
+        return list(zip(flat[::2], flat[1::2]))
+
+    def is_truncated(self, index: int) -> bool:
+        """True if the stored ranking cuts off part of the word's sampling tier."""
+        return index in self.truncated
+
+
+class DistractorTable:
+    """Stored top-K distractor rankings, keyed by pool sources, tier and target level."""
+
+    def __init__(self, top_k: int = DEFAULT_TOP_K):
+        self.top_k = top_k
+        self._rankings: dict[tuple[tuple[str, ...], int, int], list[list[int]]] = {}
+        self._truncated: dict[tuple[tuple[str, ...], int, int], list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rankings)
+
+    def add(
+        self,
+        digests: Sequence[str],
+        tier: int,
+        target_level: int,
+        rankings: list[list[int]],
+        truncated: Sequence[int] = (),
+    ) -> None:
+        key = (tuple(digests), tier, target_level)
+        self._rankings[key] = rankings
+        self._truncated[key] = sorted(truncated)
+
+    def get(self, digests: Sequence[str], tier: int, target_level: int) -> Optional[PoolRankings]:
+        """Returns the per-word rankings for a pool, or None if none were built."""
+        key = (tuple(digests), tier, target_level)
+        rankings = self._rankings.get(key)
+        if rankings is None:
+            return None
+        return PoolRankings(
+            top_k=self.top_k, rankings=rankings, truncated=frozenset(self._truncated[key])
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": DISTRACTOR_TABLE_VERSION,
+            "top_k": self.top_k,
+            "pools": [
+                {
+                    "digests": list(digests),
+                    "tier": tier,
+                    "target_level": target_level,
+                    "rankings": rankings,
+                    "truncated": self._truncated[(digests, tier, target_level)],
+                }
+                for (digests, tier, target_level), rankings in self._rankings.items()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Optional["DistractorTable"]:
+        if data.get("version") != DISTRACTOR_TABLE_VERSION:
+            return None
+        table = cls(top_k=data["top_k"])
+        for pool in data.get("pools", []):
+            table.add(
+                pool["digests"],
+                pool["tier"],
+                pool["target_level"],
+                pool["rankings"],
+                pool["truncated"],
+            )
+        return table
+
+
+def load_distractor_table(data_path: Path) -> Optional[DistractorTable]:
+    """Loads the table from ``data_path``; None if it is missing or unreadable."""
+    file_path = data_path / DISTRACTOR_TABLE_FILE
+    if not file_path.exists():
+        return None
+
+    try:
+        with open(file_path, encoding="utf-8") as f:
+            return DistractorTable.from_dict(json.load(f))
+    except (json.JSONDecodeError, KeyError):
+        print(f"Warning: Ignoring unreadable distractor table: {file_path}")
+        return None
+
+
+def write_distractor_table(table: DistractorTable, data_path: Path) -> Path:
+    file_path = data_path / DISTRACTOR_TABLE_FILE
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(table.to_dict(), f, separators=(",", ":"))
+    return file_path
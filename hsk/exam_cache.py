@@ -0,0 +1,63 @@
+"""Bounded cache of generated exams.
+
+A seeded exam is fully determined by its level, question count, seed and
+the corpus it was drawn from, so re-requesting the same form can reuse the
+generated questions instead of regenerating them.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from hsk.models import Question
+
+DEFAULT_EXAM_CACHE_SIZE = 256
+
+# (level, num_questions, seed, corpus digests)
+ExamKey = tuple[int, int, int, tuple[str, ...]]
+
+
+class ExamCache:
+    """Thread-safe LRU cache of question lists keyed by ``ExamKey``."""
+
+    def __init__(self, maxsize: int = DEFAULT_EXAM_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._exams: OrderedDict[ExamKey, tuple[Question, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._exams)
+
+    def get(self, key: ExamKey) -> Optional[list[Question]]:
+        with self._lock:
+            questions = self._exams.get(key)
+            if questions is None:
+                self.misses += 1
+                return None
+            self._exams.move_to_end(key)
+            self.hits += 1
+            return list(questions)
+
+    def put(self, key: ExamKey, questions: list[Question]) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._exams[key] = tuple(questions)
+            self._exams.move_to_end(key)
+            while len(self._exams) > self.maxsize:
+                self._exams.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._exams.clear()
+            self.hits = self.misses = 0
+
+
+_exam_cache = ExamCache()
+
+
+def get_exam_cache() -> ExamCache:
+    """Returns the process-wide exam cache used by seeded ``HSKTestEngine`` exams."""
+    return _exam_cache
@@ -1,23 +1,60 @@
+import sys
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import NamedTuple, Optional
 
 
-@dataclass
-class Word:
-    """Represents an HSK vocabulary word."""
+def _interned(values: Iterable[str]) -> tuple[str, ...]:
+    """Returns ``values`` as a tuple of interned strings (shared across words)."""
+    return tuple(sys.intern(v) for v in values)
+
 
+class _WordFields(NamedTuple):
     hanzi: str
     pinyin: str
     meaning: str
     level: int
-    radicals: list[str] = field(default_factory=list)
-    sentences: list[str] = field(default_factory=list)
-    pos: list[str] = field(default_factory=list)
+    radicals: tuple[str, ...] = ()
+    sentences: tuple[str, ...] = ()
+    pos: tuple[str, ...] = ()
     frequency: int = 0
 
 
-@dataclass
-class GrammarRule:
+class Word(_WordFields):
+    """Represents an HSK vocabulary word.
+
+    Immutable and tuple-backed (no per-instance ``__dict__``) since a loaded
+    band holds thousands of them. Sequence fields are stored as tuples, with
+    radicals and POS tags interned so every word shares the same strings.
+    """
+
+    __slots__ = ()
+
+    def __new__(
+        cls,
+        hanzi: str,
+        pinyin: str,
+        meaning: str,
+        level: int,
+        radicals: Iterable[str] = (),
+        sentences: Iterable[str] = (),
+        pos: Iterable[str] = (),
+        frequency: int = 0,
+    ) -> "Word":
+        return super().__new__(
+            cls,
+            hanzi,
+            pinyin,
+            meaning,
+            level,
+            _interned(radicals),
+            tuple(sentences),
+            _interned(pos),
+            frequency,
+        )
+
+
+class GrammarRule(NamedTuple):
     """Represents an HSK grammar point."""
 
     name: str
@@ -0,0 +1,133 @@
+"""Multi-process exam generation.
+
+Question generation is pure Python and CPU-bound, so large batches are
+spread over a process pool. Each worker loads the corpus once (through the
+pool initializer) and then generates seed ranges of exams with
+``generate_exams``. Because exam ``i`` of a batch only depends on its seed,
+the merged output is identical whatever the worker count or chunking.
+
+With ``shared_corpus=True`` the parent exports the compiled corpus and its
+indexes to shared memory once (see ``hsk.shared_corpus``) and workers attach
+to it instead of loading their own copy, which matters for ``spawn``/
+``forkserver`` pools where nothing is inherited.
+"""
+
+import math
+import multiprocessing
+import os
+import random
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Optional
+
+from hsk.corpus_registry import get_band_levels
+from hsk.data_engine import DataEngine
+from hsk.models import Question
+from hsk.shared_corpus import SharedCorpus
+from hsk.test_engine import generate_exams
+
+# Jobs per worker, so a slow chunk does not leave the other workers idle
+CHUNKS_PER_WORKER = 4
+
+# (level, first seed, exam count, questions per exam)
+ExamJob = tuple[int, int, int, Optional[int]]
+
+_worker_engine: Optional[DataEngine] = None
+_worker_corpus: Optional[SharedCorpus] = None
+
+
+def _init_worker(
+    data_dir: Optional[str], levels: tuple[int, ...], corpus_name: Optional[str] = None
+) -> None:
+    """Pool initializer: loads every level the worker's jobs will need, once."""
+    global _worker_engine, _worker_corpus
+    if corpus_name is not None:
+        # Zero-copy views over the parent's export; nothing to parse
+        _worker_corpus = SharedCorpus.attach(corpus_name)
+        _worker_engine = _worker_corpus.data_engine()
+        return
+
+    _worker_engine = DataEngine(data_dir)
+    for level in levels:
+        for level_id in get_band_levels(level):
+            _worker_engine.load_level_data(level_id)
+    _worker_engine.load_radicals()
+
+
+def _run_job(job: ExamJob) -> list[list[Question]]:
+    level, seed, count, num_questions = job
+    return list(generate_exams(level, count, num_questions, seed, data_engine=_worker_engine))
+
+
+def split_jobs(
+    levels: Iterable[int],
+    count: int,
+    seed: int,
+    num_questions: Optional[int] = None,
+    chunk_size: int = 1,
+) -> list[ExamJob]:
+    """Splits ``count`` exams per level into seed ranges of ``chunk_size`` exams.
+
+    Every level uses seeds ``seed`` to ``seed + count - 1``; jobs are ordered by
+    level, then seed.
+    """
+    jobs = []
+    for level in levels:
+        for start in range(0, count, chunk_size):
+            jobs.append((level, seed + start, min(chunk_size, count - start), num_questions))
+    return jobs
+
+
+def generate_exams_parallel(
+    levels: Iterable[int],
+    count: int,
+    num_questions: Optional[int] = None,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+    data_dir: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+    mp_context: Optional[str] = None,
+    shared_corpus: bool = False,
+) -> Iterator[tuple[int, list[Question]]]:
+    """Yields ``(level, questions)`` for ``count`` exams per level, generated in parallel.
+
+    Exams come back in level order, then seed order, matching a serial
+    ``generate_exams(level, count, num_questions, seed)`` per level. Without a
+    ``seed`` a random base seed is drawn, so workers never repeat each other's
+    exams. ``mp_context`` names the start method (``"fork"``, ``"spawn"``, ...).
+    """
+    levels = tuple(levels)
+    if seed is None:
+        seed = random.randrange(2**32)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(count * len(levels) / (workers * CHUNKS_PER_WORKER)))
+
+    jobs = split_jobs(levels, count, seed, num_questions, chunk_size)
+    if data_dir is not None:
+        data_dir = str(Path(data_dir))
+
+    with ExitStack() as stack:
+        corpus_name = None
+        if shared_corpus:
+            corpus = SharedCorpus.create(DataEngine(data_dir))
+            stack.callback(corpus.unlink)
+            stack.callback(corpus.close)
+            corpus_name = corpus.name
+
+        context = multiprocessing.get_context(mp_context) if mp_context else None
+        executor = stack.enter_context(
+            ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(data_dir, levels, corpus_name),
+            )
+        )
+        # map() returns results in submission order, whichever worker finishes first
+        for job, exams in zip(jobs, executor.map(_run_job, jobs)):
+            for questions in exams:
+                yield job[0], questions
@@ -0,0 +1,184 @@
+"""Pre-fork worker mode for the exam server.
+
+The parent process loads every level and builds every lazily computed index
+(word pools, feature and inverted indexes, selection and cloze rankings,
+the distractor table) once, then forks workers that share those pages
+copy-on-write. Before forking, ``gc.freeze()`` moves the corpus into the
+permanent generation so the workers' garbage collections do not touch its
+objects, which would dirty (and privately copy) the shared pages.
+
+Sessions live in the worker that started them, so a client should keep one
+persistent (keep-alive) connection per session, or sit behind a sticky load
+balancer. Linux/POSIX only (``os.fork``). SIGTERM or Ctrl-C on the parent
+stops the workers before it exits.
+
+Run with ``python -m hsk.prefork --workers 4 --port 8080``.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import os
+import signal
+import socket
+import time
+from pathlib import Path
+from types import FrameType
+from typing import Optional
+
+from hsk.cloze import min_sentence_length
+from hsk.data_engine import DataEngine
+from hsk.server import ExamServer
+
+LEVELS = range(1, 10)
+
+
+def warm_corpus(data_engine: DataEngine) -> None:
+    """Loads every level and builds every lazily computed index the exams use."""
+    for level in LEVELS:
+        data_engine.load_level_data(level)
+    data_engine.load_radicals()
+
+    for level in LEVELS:
+        pool = data_engine.get_word_pool(level)
+        pool.build_indexes()
+        target_level = data_engine.canonical_level(level)
+        pool.target_words(target_level)
+        if level >= 7:
+            pool.advanced_selection(target_level)
+        min_len = min_sentence_length(level)
+        for word in pool.words:
+            if word.sentences:
+                pool.cloze_candidates(word, min_len)
+        data_engine.get_distractor_rankings(level)
+
+
+def freeze_heap() -> None:
+    """Collects garbage, then moves every surviving object out of the collector's reach."""
+    gc.collect()
+    gc.freeze()
+
+
+def memory_usage(pid: Optional[int] = None) -> Optional[dict[str, int]]:
+    """Returns a process's ``Rss``/``Pss``/``Private_*`` totals in kB (None if unavailable).
+
+    ``Private_Dirty`` is the worker's own overhead: pages it has written to
+    and therefore no longer shares with the parent.
+    """
+    path = Path(f"/proc/{pid or 'self'}/smaps_rollup")
+    try:
+        lines = path.read_text().splitlines()
+    except OSError:
+        return None
+
+    usage = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        fields = value.split()
+        if fields and fields[0].isdigit():
+            usage[name] = int(fields[0])
+    return usage
+
+
+def format_usage(label: str, usage: Optional[dict[str, int]]) -> str:
+    if usage is None:
+        return f"{label}: memory usage unavailable"
+    return (
+        f"{label}: RSS {usage.get('Rss', 0) / 1024:.1f} MB, "
+        f"PSS {usage.get('Pss', 0) / 1024:.1f} MB, "
+        f"private {usage.get('Private_Dirty', 0) / 1024:.1f} MB"
+    )
+
+
+def _run_worker(listener: socket.socket, data_engine: DataEngine) -> None:
+    async def serve() -> None:
+        server = ExamServer(data_engine)
+        async with await asyncio.start_server(server.handle_connection, sock=listener) as srv:
+            await srv.serve_forever()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve())
+
+
+class PreforkServer:
+    """Forks ``workers`` exam servers sharing one pre-built, frozen corpus."""
+
+    def __init__(
+        self,
+        workers: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        freeze: bool = True,
+    ):
+        if not hasattr(os, "fork"):
+            raise RuntimeError("Pre-fork mode requires os.fork (POSIX)")
+        self.workers = workers or os.cpu_count() or 1
+        self.host = host
+        self.port = port
+        self.freeze = freeze
+        self.pids: list[int] = []
+
+    def start(self) -> socket.socket:
+        """Builds the corpus, binds the listening socket and forks the workers."""
+        data_engine = DataEngine()
+        start = time.perf_counter()
+        warm_corpus(data_engine)
+        if self.freeze:
+            freeze_heap()
+        print(f"Corpus ready in {time.perf_counter() - start:.1f}s")
+        print(format_usage("Parent", memory_usage()))
+
+        listener = socket.create_server((self.host, self.port))
+        listener.setblocking(False)
+        for _ in range(self.workers):
+            pid = os.fork()
+            if pid == 0:
+                # Workers must not inherit the parent's shutdown handler
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                _run_worker(listener, data_engine)
+                os._exit(0)
+            self.pids.append(pid)
+        return listener
+
+    def report(self) -> None:
+        for pid in self.pids:
+            print(format_usage(f"Worker {pid}", memory_usage(pid)))
+
+    def stop(self) -> None:
+        pids, self.pids = self.pids, []
+        for pid in pids:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+        for pid in pids:
+            with contextlib.suppress(ChildProcessError):
+                os.waitpid(pid, 0)
+
+    def _handle_sigterm(self, signum: int, frame: Optional[FrameType]) -> None:
+        self.stop()
+        raise SystemExit(0)
+
+    def serve_forever(self) -> None:
+        previous = signal.signal(signal.SIGTERM, self._handle_sigterm)
+        listener = self.start()
+        print(f"Serving HSK exams on http://{self.host}:{self.port} ({self.workers} workers)")
+        try:
+            time.sleep(1)
+            self.report()
+            os.wait()  # Returns when any worker exits
+        except KeyboardInterrupt:
+            pass
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+            self.stop()
+            listener.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-fork HSK exam server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=0, help="defaults to the CPU count")
+    parser.add_argument("--no-freeze", action="store_true", help="skip gc.freeze()")
+    args = parser.parse_args()
+    PreforkServer(args.workers, args.host, args.port, freeze=not args.no_freeze).serve_forever()
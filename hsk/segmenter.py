@@ -0,0 +1,77 @@
+"""Dictionary segmentation of Chinese sentences.
+
+Sentence linking (``scripts/ingest_data.py``) and the level audits split a
+sentence into HSK words by greedy longest match: at each position take the
+longest dictionary word starting there, or a single character if none does.
+The dictionary is held as a character trie, so each position is resolved by
+walking the trie along the text, and the walk stops as soon as no dictionary
+word continues the prefix. There is no maximum word length and no substring
+is built until a word is emitted.
+"""
+
+from collections.abc import Iterable
+from typing import Any, Optional
+
+# Key marking the end of a word in a trie node; never a character of the text
+_WORD = ""
+
+
+class Segmenter:
+    """Greedy longest-match (MaxMatch) segmenter over a dictionary trie."""
+
+    def __init__(self, words: Iterable[str] = ()):
+        self._root: dict[str, Any] = {}
+        self._size = 0
+        self.max_word_length = 0
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        if not word:
+            return
+        node = self._root
+        for char in word:
+            node = node.setdefault(char, {})
+        if _WORD not in node:
+            node[_WORD] = word
+            self._size += 1
+            self.max_word_length = max(self.max_word_length, len(word))
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str) or not word:
+            return False
+        node = self._root
+        for char in word:
+            child: Optional[dict[str, Any]] = node.get(char)
+            if child is None:
+                return False
+            node = child
+        return _WORD in node
+
+    def __len__(self) -> int:
+        return self._size
+
+    def longest_match(self, text: str, start: int = 0) -> str:
+        """Returns the longest dictionary word at ``text[start:]`` ("" if there is none)."""
+        node = self._root
+        match = ""
+        for i in range(start, len(text)):
+            child: Optional[dict[str, Any]] = node.get(text[i])
+            if child is None:
+                break
+            node = child
+            match = node.get(_WORD, match)
+        return match
+
+    def segment(self, text: str) -> list[str]:
+        """Splits ``text`` into dictionary words, leaving unknown characters as single tokens."""
+        longest_match = self.longest_match
+        tokens: list[str] = []
+        append = tokens.append
+        n = len(text)
+        start = 0
+        while start < n:
+            token = longest_match(text, start) or text[start]
+            append(token)
+            start += len(token)
+        return tokens
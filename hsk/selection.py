@@ -0,0 +1,54 @@
+"""Target word selection rankings shared across exams.
+
+Which words an exam may target only depends on the word pool and the
+target level, so the rankings here are computed once per pool and cached
+on it (see ``WordPool.advanced_selection``). Exams just slice and sample.
+"""
+
+from collections.abc import Iterable
+
+from hsk.models import Word
+
+# ACADEMIC/FORMAL KEYWORDS for C2 Selection
+ACADEMIC_KEYWORDS = (
+    "哲学",
+    "政治",
+    "经济",
+    "体系",
+    "范畴",
+    "逻辑",
+    "理论",
+    "机制",
+    "策略",
+    "规律",
+    "固然",
+    "诚然",
+)
+
+# BLACKLIST INTERJECTIONS/COLLOQUIALISM
+BLACKLISTED_POS = frozenset({"e", "y", "o"})
+
+# Advanced exams sample from the top ``num_questions * SELECTION_POOL_FACTOR`` words
+SELECTION_POOL_FACTOR = 5
+
+
+def _advanced_sort_key(w: Word) -> tuple[bool, bool, bool, int]:
+    meaning = w.meaning.lower()
+    return (
+        len(w.sentences) > 0,
+        any(k in meaning or k in w.hanzi for k in ACADEMIC_KEYWORDS),
+        len(w.hanzi) >= 2,  # Prioritize compound words for C2
+        -w.frequency,
+    )
+
+
+def rank_advanced_targets(target_words: Iterable[Word]) -> list[Word]:
+    """Returns the eligible level 7-9 targets, best first.
+
+    L9 should prefer high-register concepts and compounds: interjections
+    and colloquial particles are dropped, and the rest are weighted by
+    valid word depth and complexity.
+    """
+    filtered_pool = [w for w in target_words if not (w.pos and BLACKLISTED_POS.intersection(w.pos))]
+    filtered_pool.sort(key=_advanced_sort_key, reverse=True)
+    return filtered_pool
@@ -0,0 +1,153 @@
+"""Deduplicated example sentence table shared by the level files.
+
+A sentence linked to several words used to be embedded in each of their
+vocabulary entries, and the identical 7-9 band files repeated it twice more.
+Level files now list sentence IDs instead (``"sentences": [12, 408]``) that
+index one global ``sentence_store.json``, and name the store they were
+written against by its SHA-256 (``"sentence_store": "<digest>"``) so a level
+file is never resolved against a different table.
+
+The store is only read when a level referencing it is parsed, once per data
+directory, and every word resolves an ID to the same string object. Level
+files with inline sentence strings are still accepted.
+"""
+
+import hashlib
+import json
+import re
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Optional
+
+SENTENCE_STORE_VERSION = 1
+SENTENCE_STORE_FILE = "sentence_store.json"
+
+# Level file key naming the store digest its sentence IDs refer to
+STORE_DIGEST_KEY = "sentence_store"
+
+# An indented JSON array of integers (newlines only occur between tokens)
+_INT_ARRAY = re.compile(r"\[\n\s+(-?\d+(?:,\n\s+-?\d+)*)\n\s+\]")
+
+
+class SentenceStore:
+    """An append-only table of unique sentences addressed by integer ID."""
+
+    def __init__(self, sentences: Iterable[str] = ()):
+        self.sentences: list[str] = []
+        self._ids: dict[str, int] = {}
+        for sentence in sentences:
+            self.add(sentence)
+
+    def __len__(self) -> int:
+        return len(self.sentences)
+
+    def __getitem__(self, sentence_id: int) -> str:
+        return self.sentences[sentence_id]
+
+    def add(self, sentence: str) -> int:
+        """Returns ``sentence``'s ID, storing it first if it is new."""
+        sentence_id = self._ids.get(sentence)
+        if sentence_id is None:
+            sentence_id = self._ids[sentence] = len(self.sentences)
+            self.sentences.append(sentence)
+        return sentence_id
+
+    def resolve(self, ids: Iterable[int]) -> tuple[str, ...]:
+        sentences = self.sentences
+        return tuple(sentences[i] for i in ids)
+
+    def dumps(self) -> str:
+        """The store's file content."""
+        return json.dumps(
+            {"version": SENTENCE_STORE_VERSION, "sentences": self.sentences},
+            indent=0,
+            ensure_ascii=False,
+        )
+
+    @property
+    def digest(self) -> str:
+        return hashlib.sha256(self.dumps().encode("utf-8")).hexdigest()
+
+
+def load_sentence_store(data_path: Path) -> Optional[tuple[SentenceStore, str]]:
+    """Loads the store in ``data_path`` with its file digest; None if there is none."""
+    file_path = data_path / SENTENCE_STORE_FILE
+    try:
+        raw = file_path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+    data = json.loads(raw)
+    if data.get("version") != SENTENCE_STORE_VERSION:
+        raise ValueError(f"Unsupported sentence store version in {file_path}")
+    store = SentenceStore()
+    # Stored sentences are unique already; skip add()'s dedupe
+    store.sentences = data["sentences"]
+    return store, hashlib.sha256(raw).hexdigest()
+
+
+def write_sentence_store(store: SentenceStore, data_path: Path) -> Path:
+    file_path = data_path / SENTENCE_STORE_FILE
+    file_path.write_text(store.dumps(), encoding="utf-8")
+    return file_path
+
+
+def uses_sentence_store(level_data: dict[str, Any]) -> bool:
+    return STORE_DIGEST_KEY in level_data
+
+
+def check_store_digest(level_data: dict[str, Any], digest: str, source: Path) -> None:
+    """Raises ValueError if ``level_data`` was written against a different store."""
+    expected = level_data[STORE_DIGEST_KEY]
+    if expected != digest:
+        raise ValueError(
+            f"{source} references sentence store {expected[:12]}, "
+            f"but {SENTENCE_STORE_FILE} is {digest[:12]}; rebuild the data"
+        )
+
+
+def read_level_file(file_path: Path) -> dict[str, Any]:
+    """Reads a level file for scripts, with sentence IDs replaced by their text."""
+    with open(file_path, encoding="utf-8") as f:
+        data: dict[str, Any] = json.load(f)
+    if not uses_sentence_store(data):
+        return data
+
+    loaded = load_sentence_store(file_path.parent)
+    if loaded is None:
+        raise FileNotFoundError(f"{file_path} needs {SENTENCE_STORE_FILE}, which is missing")
+    store, digest = loaded
+    check_store_digest(data, digest, file_path)
+    for word in data.get("vocabulary", []):
+        word["sentences"] = list(store.resolve(word.get("sentences", [])))
+    return data
+
+
+def dumps_level(data: dict[str, Any]) -> str:
+    """Formats a level file: indented JSON, with sentence ID lists kept on one line."""
+    text = json.dumps(data, indent=4, ensure_ascii=False)
+    return _INT_ARRAY.sub(lambda m: "[" + re.sub(r",\n\s+", ", ", m.group(1)) + "]", text)
+
+
+def build_sentence_store(
+    levels_data: dict[int, dict[str, Any]],
+) -> tuple[SentenceStore, dict[int, dict[str, Any]]]:
+    """Moves the levels' inline sentences into one store.
+
+    Returns the store and a copy of ``levels_data`` whose words list sentence
+    IDs and which names the store's digest. IDs follow first appearance in
+    level order, so identical level files stay identical.
+    """
+    store = SentenceStore()
+    referencing: dict[int, dict[str, Any]] = {}
+    for level, data in levels_data.items():
+        vocabulary = [
+            dict(word, sentences=[store.add(s) for s in word.get("sentences", [])])
+            for word in data.get("vocabulary", [])
+        ]
+        referencing[level] = {**data, "vocabulary": vocabulary}
+
+    digest = store.digest
+    for level, data in referencing.items():
+        referencing[level] = {STORE_DIGEST_KEY: digest, **data}
+    return store, referencing
@@ -0,0 +1,311 @@
+"""Asyncio HTTP/JSON exam session server (stdlib only).
+
+All sessions share one ``DataEngine``, so the corpus and its indexes are
+held once per process however many exams are running. Building questions is
+CPU-bound, so it runs on a thread pool and the event loop only parses
+requests and routes them.
+
+Endpoints (request and response bodies are JSON):
+
+- ``POST /exams`` with ``{"level": 9, "mode": "exam", "seed": 1}`` (mode
+  and seed optional) starts a session and returns its ``session_id``
+- ``GET /exams/<id>/next`` returns the next question (without its answer),
+  or ``{"done": true}`` once the exam is over
+- ``POST /exams/<id>/answer`` with ``{"answer": "..."}`` grades the current
+  question
+- ``GET /exams/<id>/result`` returns the ``TestResult``
+- ``DELETE /exams/<id>`` ends the session and frees it
+
+Sessions idle for longer than ``session_ttl`` seconds are dropped, so
+abandoned exams do not hold slots under ``max_sessions`` forever.
+
+Run with ``python -m hsk.server --port 8080``.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import asdict
+from http import HTTPStatus
+from typing import Any, Callable, Optional, TypeVar
+
+from hsk.constants import MODE_PRACTICE
+from hsk.data_engine import DataEngine
+from hsk.models import Question
+from hsk.test_engine import HSKTestEngine
+from hsk.warm_pool import questions_for_mode
+
+MAX_BODY_BYTES = 64 * 1024
+DEFAULT_MAX_SESSIONS = 10_000
+DEFAULT_SESSION_TTL = 60 * 60  # Seconds a session may sit idle
+
+T = TypeVar("T")
+
+
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: Optional[str] = None):
+        super().__init__(message or status.phrase)
+        self.status = status
+        self.message = message or status.phrase
+
+
+class ExamSession:
+    """One user's exam: the engine plus the question awaiting an answer."""
+
+    def __init__(self, engine: HSKTestEngine):
+        self.engine = engine
+        self.current: Optional[Question] = None
+        self.asked = 0
+        self.last_used = time.monotonic()
+        # Serializes a session's requests; engines are not safe to share concurrently
+        self.lock = asyncio.Lock()
+
+
+def question_to_dict(question: Question, number: int) -> dict[str, Any]:
+    """The client view of a question: everything except the answer."""
+    return {
+        "number": number,
+        "id": question.id,
+        "type": question.type,
+        "prompt": question.prompt,
+        "options": question.options,
+        "hint": question.hint,
+        "level": question.level,
+    }
+
+
+class ExamServer:
+    """Routes exam session requests over one shared ``DataEngine``."""
+
+    def __init__(
+        self,
+        data_engine: Optional[DataEngine] = None,
+        executor: Optional[Executor] = None,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        session_ttl: float = DEFAULT_SESSION_TTL,
+    ):
+        self.data_engine = data_engine or DataEngine()
+        self.executor = executor or ThreadPoolExecutor(thread_name_prefix="hsk-exam")
+        self.max_sessions = max_sessions
+        self.session_ttl = session_ttl
+        # Session ID -> Session in least- to most-recently-used order
+        self.sessions: OrderedDict[str, ExamSession] = OrderedDict()
+        # Starts past the session cap check whose engine is still being built
+        self._pending_starts = 0
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    def _session(self, session_id: str) -> ExamSession:
+        self.expire_sessions()
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown session: {session_id}")
+        session.last_used = time.monotonic()
+        self.sessions.move_to_end(session_id)
+        return session
+
+    def expire_sessions(self) -> int:
+        """Drops sessions idle for longer than ``session_ttl``; returns how many."""
+        deadline = time.monotonic() - self.session_ttl
+        expired = 0
+        while self.sessions:
+            session_id, session = next(iter(self.sessions.items()))
+            if session.last_used > deadline:
+                break
+            del self.sessions[session_id]
+            expired += 1
+        return expired
+
+    async def start_exam(self, body: dict[str, Any]) -> dict[str, Any]:
+        try:
+            level = int(body["level"])
+            mode = str(body.get("mode", MODE_PRACTICE))
+            num_questions = questions_for_mode(level, mode)
+            seed = None if body.get("seed") is None else int(body["seed"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Invalid exam request: {e}") from e
+        if not 1 <= level <= 9:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Level must be between 1 and 9")
+        self.expire_sessions()
+        if len(self.sessions) + self._pending_starts >= self.max_sessions:
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "Too many active sessions")
+
+        # Reserve the slot before awaiting so concurrent starts respect the cap
+        self._pending_starts += 1
+        try:
+            # Lazy: only targets are chosen here; questions are built as they are asked
+            engine = await self._run(
+                lambda: HSKTestEngine(level, self.data_engine, num_questions, seed=seed, lazy=True)
+            )
+        finally:
+            self._pending_starts -= 1
+        session_id = uuid.uuid4().hex
+        self.sessions[session_id] = ExamSession(engine)
+        return {
+            "session_id": session_id,
+            "level": level,
+            "mode": mode,
+            "total_questions": engine.total_questions,
+        }
+
+    async def next_question(self, session_id: str) -> dict[str, Any]:
+        session = self._session(session_id)
+        async with session.lock:
+            if session.current is None:
+                question = await self._run(session.engine.get_next_question)
+                if question is None:
+                    return {"done": True}
+                session.current = question
+                session.asked += 1
+            # Until answered, the current question is repeated rather than skipped
+            return question_to_dict(session.current, session.asked)
+
+    async def submit_answer(self, session_id: str, body: dict[str, Any]) -> dict[str, Any]:
+        session = self._session(session_id)
+        answer = body.get("answer")
+        if not isinstance(answer, str):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Expected a string 'answer'")
+        async with session.lock:
+            question = session.current
+            if question is None:
+                raise HTTPError(HTTPStatus.CONFLICT, "No question awaiting an answer")
+            correct = session.engine.submit_answer(question, answer)
+            session.current = None
+        return {"correct": correct, "correct_answer": question.correct_answer}
+
+    async def result(self, session_id: str) -> dict[str, Any]:
+        session = self._session(session_id)
+        async with session.lock:
+            return asdict(session.engine.calculate_result())
+
+    async def dispatch(self, method: str, path: str, body: dict[str, Any]) -> dict[str, Any]:
+        parts = [p for p in path.split("?", 1)[0].split("/") if p]
+        if parts == ["exams"] and method == "POST":
+            return await self.start_exam(body)
+        if len(parts) == 3 and parts[0] == "exams":
+            session_id, action = parts[1], parts[2]
+            if action == "next" and method == "GET":
+                return await self.next_question(session_id)
+            if action == "answer" and method == "POST":
+                return await self.submit_answer(session_id, body)
+            if action == "result" and method == "GET":
+                return await self.result(session_id)
+        if len(parts) == 2 and parts[0] == "exams" and method == "DELETE":
+            self._session(parts[1])
+            del self.sessions[parts[1]]
+            return {"deleted": True}
+        raise HTTPError(HTTPStatus.NOT_FOUND)
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serves HTTP/1.1 requests on one connection until the client closes it."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, keep_alive, body = await self._read_request(request_line, reader)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except Exception as e:
+                    # The stream may be out of sync with request boundaries: answer and close
+                    error = e if isinstance(e, HTTPError) else HTTPError(HTTPStatus.BAD_REQUEST)
+                    self._write_response(writer, error.status, {"error": error.message}, False)
+                    await writer.drain()
+                    break
+                try:
+                    status, payload = HTTPStatus.OK, await self.dispatch(method, path, body)
+                except HTTPError as e:
+                    status, payload = e.status, {"error": e.message}
+                except Exception as e:
+                    print(f"Error handling {method} {path}: {e!r}")
+                    status = HTTPStatus.INTERNAL_SERVER_ERROR
+                    payload = {"error": status.phrase}
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(
+        self, request_line: bytes, reader: asyncio.StreamReader
+    ) -> tuple[str, str, bool, dict[str, Any]]:
+        try:
+            method, path, version = request_line.decode("latin-1").split()
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST) from e
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST) from e
+        if length > MAX_BODY_BYTES:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        body: dict[str, Any] = {}
+        if length:
+            try:
+                body = json.loads(await reader.readexactly(length))
+            except ValueError:  # Malformed JSON or not UTF-8
+                body = {}
+        return method.upper(), path, keep_alive, body if isinstance(body, dict) else {}
+
+    @staticmethod
+    def _write_response(
+        writer: asyncio.StreamWriter, status: HTTPStatus, payload: Any, keep_alive: bool
+    ) -> None:
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + data)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8080) -> None:
+    server = ExamServer()
+    # Parse every level before accepting connections, so no request pays for it
+    await server._run(_preload, server.data_engine)
+    async with await server.start(host, port) as listener:
+        print(f"Serving HSK exams on http://{host}:{port}")
+        await listener.serve_forever()
+
+
+def _preload(data_engine: DataEngine) -> None:
+    for level in range(1, 10):
+        data_engine.load_level_data(level)
+    data_engine.load_radicals()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HSK exam session server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port))
@@ -0,0 +1,851 @@
+"""Compiled corpus in shared memory for spawn-based worker pools.
+
+Forked workers share the parent's parsed corpus copy-on-write (see
+``hsk.prefork``), but spawned workers start empty and would each re-parse
+every level. ``SharedCorpus`` instead exports the compiled corpus (words,
+sentences, POS tags, radicals, grammar) together with each word pool's
+indexes (feature postings, (POS, length) buckets, hanzi positions, target
+selections, distractor rankings) into one flat buffer, held in a
+``multiprocessing.shared_memory`` block or a memory-mapped file.
+
+The layout is offset based, so workers read it in place:
+
+- a string table (``str_offsets`` into the UTF-8 ``str_data`` blob, plus
+  ``str_sorted``, the string ids in sort order for lookups by value)
+- ``words``: fixed-size records of string ids and ``lists`` offsets
+- ``lists``: every variable-length integer list as ``[count, items...]``
+- per level and per pool sections of uint32 arrays; lookup tables are sorted
+  by string id, so a key is resolved to its id once and then searched with
+  integer comparisons
+- a JSON directory at the end naming each section's offset and length
+
+``SharedCorpus.data_engine()`` returns a ``DataEngine`` whose registry serves
+levels and word pools as read-only views over the buffer, so
+``HSKTestEngine`` uses it unchanged. Words and features are decoded on first
+access (and then kept, so each word has one identity); the indexes are never
+copied.
+"""
+
+import contextlib
+import json
+import mmap
+import struct
+import sys
+import threading
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any, Callable, Optional, TypedDict, TypeVar, Union, overload
+
+from hsk.corpus_registry import CorpusRegistry, LevelSnapshot, get_band_levels
+from hsk.data_engine import DataEngine
+from hsk.distractor_table import DistractorTable, PoolRankings, distractor_tier
+from hsk.models import GrammarRule, Word
+from hsk.word_pool import InvertedIndexes, WordFeatures, WordPool, meaning_keywords
+
+CORPUS_LAYOUT_VERSION = 2
+MAGIC = b"HSKCORP\0"
+_HEADER = struct.Struct("<8sQQ")  # Magic, directory offset, directory length
+_ALIGN = 8
+
+# Word record fields (uint32 each)
+HANZI, PINYIN, MEANING, LEVEL, FREQUENCY, RADICALS, SENTENCES, POS, KEYWORDS = range(9)
+WORD_FIELDS = 9
+GRAMMAR_FIELDS = 5  # name, description, structure, level, example
+
+LEVELS = range(1, 10)
+
+SHM_DIR = Path("/dev/shm")  # Where Linux exposes POSIX shared memory blocks
+
+T = TypeVar("T")
+
+
+class LevelEntry(TypedDict, total=False):
+    """A level's section names, or (``alias``) the band level whose data it shares."""
+
+    level: int
+    alias: int
+    digest: str
+    words: str
+    hanzi: str
+    grammar: str
+
+
+class PoolEntry(TypedDict):
+    """A word pool's section names; ``targets``/``selections`` are keyed by target level."""
+
+    digests: list[str]
+    words: str
+    hanzi: str
+    keywords: str
+    chars: str
+    radicals: str
+    pos_length: str
+    lengths: str
+    targets: dict[str, str]
+    selections: dict[str, str]
+
+
+class RankingEntry(TypedDict):
+    """Distractor rankings for one (pool, tier, target level)."""
+
+    digests: list[str]
+    tier: int
+    target_level: int
+    top_k: int
+    truncated: list[int]
+    offsets: str
+
+
+class CorpusDirectory(TypedDict):
+    """The JSON directory at the end of a packed corpus."""
+
+    version: int
+    byteorder: str
+    data_path: str
+    words: int
+    strings: int
+    radicals: int
+    levels: list[LevelEntry]
+    pools: list[PoolEntry]
+    rankings: list[RankingEntry]
+    sections: dict[str, list[int]]  # Name -> [offset, length]
+
+
+def _bisect(count: int, key_at: Callable[[int], Any], key: Any) -> Optional[int]:
+    """Returns the position of ``key`` among ``count`` sorted keys, or None."""
+    lo, hi = 0, count
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if key_at(mid) < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo < count and key_at(lo) == key:
+        return lo
+    return None
+
+
+class _LayoutWriter:
+    """Accumulates strings, lists and sections, then packs them into one buffer."""
+
+    def __init__(self) -> None:
+        self._strings: dict[str, int] = {}
+        self._lists = array("I")
+        self._list_refs: dict[tuple[int, ...], int] = {}
+        self._sections: dict[str, bytes] = {}
+
+    def sid(self, value: str) -> int:
+        sid = self._strings.get(value)
+        if sid is None:
+            sid = self._strings[value] = len(self._strings)
+        return sid
+
+    def list_ref(self, items: Iterable[int]) -> int:
+        """Stores a list once (identical lists share storage) and returns its offset."""
+        key = tuple(items)
+        ref = self._list_refs.get(key)
+        if ref is None:
+            ref = self._list_refs[key] = len(self._lists)
+            self._lists.append(len(key))
+            self._lists.extend(key)
+        return ref
+
+    def string_list_ref(self, values: Iterable[str]) -> int:
+        return self.list_ref(self.sid(v) for v in values)
+
+    def add(self, name: str, values: Iterable[int]) -> str:
+        self._sections[name] = array("I", values).tobytes()
+        return name
+
+    def pack(
+        self,
+        data_path: str,
+        words: int,
+        radicals: int,
+        levels: list[LevelEntry],
+        pools: list[PoolEntry],
+        rankings: list[RankingEntry],
+    ) -> bytes:
+        strings = sorted(self._strings, key=self._strings.__getitem__)
+        encoded = [s.encode("utf-8") for s in strings]
+        offsets = array("I", [0])
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+        by_value = sorted(range(len(strings)), key=strings.__getitem__)
+
+        sections = {
+            "str_offsets": offsets.tobytes(),
+            "str_data": b"".join(encoded),
+            "str_sorted": array("I", by_value).tobytes(),
+            "lists": self._lists.tobytes(),
+            **self._sections,
+        }
+
+        out = bytearray(_HEADER.size)
+        table: dict[str, list[int]] = {}
+        for name, data in sections.items():
+            out.extend(b"\0" * (-len(out) % _ALIGN))
+            table[name] = [len(out), len(data)]
+            out.extend(data)
+
+        directory: CorpusDirectory = {
+            "version": CORPUS_LAYOUT_VERSION,
+            "byteorder": sys.byteorder,
+            "data_path": data_path,
+            "words": words,
+            "strings": len(strings),
+            "radicals": radicals,
+            "levels": levels,
+            "pools": pools,
+            "rankings": rankings,
+            "sections": table,
+        }
+        meta = json.dumps(directory, separators=(",", ":")).encode("utf-8")
+        _HEADER.pack_into(out, 0, MAGIC, len(out), len(meta))
+        out.extend(meta)
+        return bytes(out)
+
+
+def export_corpus(
+    data_engine: Optional[DataEngine] = None, levels: Iterable[int] = LEVELS
+) -> bytes:
+    """Packs every level, its word pool and indexes, and the radicals into one buffer."""
+    data_engine = data_engine or DataEngine()
+    levels = tuple(levels)
+    for level in levels:
+        for level_id in get_band_levels(level):
+            data_engine.load_level_data(level_id)
+    data_engine.load_radicals()
+
+    writer = _LayoutWriter()
+    word_ids: dict[int, int] = {}  # id(Word) -> word id; shared words are stored once
+    records = array("I")
+
+    def wid(word: Word) -> int:
+        key = id(word)
+        if key not in word_ids:
+            word_ids[key] = len(word_ids)
+            records.extend(
+                (
+                    writer.sid(word.hanzi),
+                    writer.sid(word.pinyin),
+                    writer.sid(word.meaning),
+                    word.level,
+                    word.frequency,
+                    writer.string_list_ref(word.radicals),
+                    writer.string_list_ref(word.sentences),
+                    writer.string_list_ref(word.pos),
+                    writer.string_list_ref(sorted(meaning_keywords(word.meaning))),
+                )
+            )
+        return word_ids[key]
+
+    def hanzi_order(words: Sequence[Word]) -> list[int]:
+        return sorted(range(len(words)), key=lambda i: writer.sid(words[i].hanzi))
+
+    level_dirs: list[LevelEntry] = []
+    for level in levels:
+        snapshot = data_engine.registry.get_level(level)
+        if snapshot.level != level:
+            level_dirs.append({"level": level, "alias": snapshot.level})
+            continue
+        ids = [wid(w) for w in snapshot.words]
+        grammar: list[int] = []
+        for rule in snapshot.grammar_rules:
+            grammar.extend(
+                (
+                    writer.sid(rule.name),
+                    writer.sid(rule.description),
+                    writer.sid(rule.structure),
+                    rule.level,
+                    writer.sid(rule.example),
+                )
+            )
+        level_dirs.append(
+            {
+                "level": level,
+                "digest": snapshot.digest,
+                "words": writer.add(f"level{level}.words", ids),
+                "hanzi": writer.add(f"level{level}.hanzi", hanzi_order(snapshot.words)),
+                "grammar": writer.add(f"level{level}.grammar", grammar),
+            }
+        )
+
+    def postings(name: str, index: Mapping[tuple[str, int], Sequence[int]]) -> str:
+        triples = sorted(
+            (writer.sid(feature), length, writer.list_ref(indices))
+            for (feature, length), indices in index.items()
+        )
+        return writer.add(name, (value for triple in triples for value in triple))
+
+    pool_dirs: list[PoolEntry] = []
+    ranking_dirs: list[RankingEntry] = []
+    for level in levels:
+        pool = data_engine.get_word_pool(level)
+        target_level = data_engine.canonical_level(level)
+        if pool.digests is None:
+            continue
+
+        existing: Optional[PoolEntry] = next(
+            (p for p in pool_dirs if p["digests"] == list(pool.digests)), None
+        )
+        if existing is None:
+            name = f"pool{len(pool_dirs)}"
+            pool.build_indexes()
+            pos_length, lengths = pool._buckets()
+            existing = {
+                "digests": list(pool.digests),
+                "words": writer.add(f"{name}.words", (wid(w) for w in pool.words)),
+                "hanzi": writer.add(f"{name}.hanzi", hanzi_order(pool.words)),
+                "keywords": postings(f"{name}.keywords", pool.inverted.keywords),
+                "chars": postings(f"{name}.chars", pool.inverted.chars),
+                "radicals": postings(f"{name}.radicals", pool.inverted.radicals),
+                "pos_length": postings(f"{name}.pos_length", pos_length),
+                "lengths": writer.add(
+                    f"{name}.lengths",
+                    (
+                        value
+                        for length in sorted(lengths)
+                        for value in (length, writer.list_ref(lengths[length]))
+                    ),
+                ),
+                "targets": {},
+                "selections": {},
+            }
+            pool_dirs.append(existing)
+
+        name = existing["words"].rsplit(".", 1)[0]
+        if str(target_level) not in existing["targets"]:
+            positions = {id(w): i for i, w in enumerate(pool.words)}
+            existing["targets"][str(target_level)] = writer.add(
+                f"{name}.targets{target_level}",
+                (positions[id(w)] for w in pool.target_words(target_level)),
+            )
+            if level >= 7:
+                existing["selections"][str(target_level)] = writer.add(
+                    f"{name}.selection{target_level}",
+                    (positions[id(w)] for w in pool.advanced_selection(target_level)),
+                )
+
+        rankings = data_engine.get_distractor_rankings(level)
+        tier = distractor_tier(level)
+        key = (list(pool.digests), tier, target_level)
+        if rankings is not None and not any(
+            (r["digests"], r["tier"], r["target_level"]) == key for r in ranking_dirs
+        ):
+            ranking_dirs.append(
+                {
+                    "digests": list(pool.digests),
+                    "tier": tier,
+                    "target_level": target_level,
+                    "top_k": rankings.top_k,
+                    "truncated": sorted(rankings.truncated),
+                    "offsets": writer.add(
+                        f"rankings{len(ranking_dirs)}",
+                        (writer.list_ref(r) for r in rankings.rankings),
+                    ),
+                }
+            )
+
+    radicals = sorted((writer.sid(k), writer.sid(v)) for k, v in data_engine.radicals.items())
+    writer.add("radicals", (sid for pair in radicals for sid in pair))
+    writer.add("words", records)
+
+    return writer.pack(
+        data_path=str(data_engine.data_path),
+        words=len(word_ids),
+        radicals=len(radicals),
+        levels=level_dirs,
+        pools=pool_dirs,
+        rankings=ranking_dirs,
+    )
+
+
+class CorpusView:
+    """Read-only, zero-copy access to a packed corpus buffer."""
+
+    def __init__(self, buffer: memoryview, owner: object = None):
+        magic, directory_offset, directory_length = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a packed HSK corpus")
+        self.directory: CorpusDirectory = json.loads(
+            bytes(buffer[directory_offset : directory_offset + directory_length])
+        )
+        if self.directory["version"] != CORPUS_LAYOUT_VERSION:
+            raise ValueError(f"Unsupported corpus layout version {self.directory['version']}")
+        if self.directory["byteorder"] != sys.byteorder:
+            raise ValueError("Packed corpus was built on a machine with another byte order")
+
+        self._buffer = buffer
+        # Every view holds this CorpusView, so the mapping (``owner``) outlives them all
+        self._owner = owner
+        self._str_offsets = self.u32("str_offsets")
+        self._str_data = self.section("str_data")
+        self._str_sorted = self.u32("str_sorted")
+        self._lists = self.u32("lists")
+        self._words = self.u32("words")
+
+        self._lock = threading.Lock()
+        # Decoded on first access, so every view hands out one object per word
+        self._decoded_words: list[Optional[Word]] = [None] * self.directory["words"]
+        self._decoded_features: list[Optional[WordFeatures]] = [None] * self.directory["words"]
+        self._sids: dict[str, Optional[int]] = {}
+        self._strings: list[Optional[str]] = [None] * (len(self._str_offsets) - 1)
+
+    def section(self, name: str) -> memoryview:
+        offset, length = self.directory["sections"][name]
+        return self._buffer[offset : offset + length]
+
+    def u32(self, name: str) -> memoryview:
+        return self.section(name).cast("I")
+
+    def string(self, sid: int) -> str:
+        value = self._strings[sid]
+        if value is None:
+            offsets = self._str_offsets
+            value = str(self._str_data[offsets[sid] : offsets[sid + 1]], "utf-8")
+            self._strings[sid] = value
+        return value
+
+    def find_string(self, value: str) -> Optional[int]:
+        """Returns the string id of ``value`` (binary search; results are memoized)."""
+        if value in self._sids:
+            return self._sids[value]
+        sorted_ids = self._str_sorted
+        pos = _bisect(len(sorted_ids), lambda i: self.string(sorted_ids[i]), value)
+        sid = None if pos is None else sorted_ids[pos]
+        self._sids[value] = sid
+        return sid
+
+    def list_at(self, ref: int) -> memoryview:
+        count = self._lists[ref]
+        return self._lists[ref + 1 : ref + 1 + count]
+
+    def strings_at(self, ref: int) -> tuple[str, ...]:
+        return tuple(self.string(sid) for sid in self.list_at(ref))
+
+    def word_hanzi(self, wid: int) -> str:
+        return self.string(self.word_hanzi_id(wid))
+
+    def word_hanzi_id(self, wid: int) -> int:
+        return self._words[wid * WORD_FIELDS + HANZI]
+
+    def word(self, wid: int) -> Word:
+        word = self._decoded_words[wid]
+        if word is None:
+            with self._lock:
+                word = self._decoded_words[wid]
+                if word is None:
+                    record = self._words[wid * WORD_FIELDS : (wid + 1) * WORD_FIELDS]
+                    word = Word(
+                        hanzi=self.string(record[HANZI]),
+                        pinyin=self.string(record[PINYIN]),
+                        meaning=self.string(record[MEANING]),
+                        level=record[LEVEL],
+                        radicals=self.strings_at(record[RADICALS]),
+                        sentences=self.strings_at(record[SENTENCES]),
+                        pos=self.strings_at(record[POS]),
+                        frequency=record[FREQUENCY],
+                    )
+                    self._decoded_words[wid] = word
+        return word
+
+    def features(self, wid: int) -> WordFeatures:
+        features = self._decoded_features[wid]
+        if features is None:
+            record = self._words[wid * WORD_FIELDS : (wid + 1) * WORD_FIELDS]
+            features = WordFeatures(
+                keywords=frozenset(self.strings_at(record[KEYWORDS])),
+                chars=frozenset(self.string(record[HANZI])),
+                radicals=frozenset(self.strings_at(record[RADICALS])),
+                pos=frozenset(self.strings_at(record[POS])),
+            )
+            self._decoded_features[wid] = features
+        return features
+
+    def grammar(self, name: str) -> tuple[GrammarRule, ...]:
+        values = self.u32(name)
+        return tuple(
+            GrammarRule(
+                name=self.string(values[i]),
+                description=self.string(values[i + 1]),
+                structure=self.string(values[i + 2]),
+                level=values[i + 3],
+                example=self.string(values[i + 4]),
+            )
+            for i in range(0, len(values), GRAMMAR_FIELDS)
+        )
+
+
+class _LazySequence(Sequence[T]):
+    """A read-only sequence over ``ids`` whose items are produced by ``item``."""
+
+    def __init__(self, ids: memoryview, item: Callable[[int], T]):
+        self._ids = ids
+        self._item = item
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, list[T]]:
+        if isinstance(index, slice):
+            return [self._item(i) for i in self._ids[index]]
+        return self._item(self._ids[index])
+
+    def __iter__(self) -> Iterator[T]:
+        return (self._item(i) for i in self._ids)
+
+
+class SharedWords(_LazySequence[Word]):
+    """Words of a level or pool, decoded from the shared buffer on first access."""
+
+    def __init__(self, view: CorpusView, ids: memoryview):
+        super().__init__(ids, view.word)
+
+
+class SharedHanziIndex(Mapping[str, Word]):
+    """Hanzi -> Word lookups by binary search over positions sorted by hanzi string id."""
+
+    def __init__(self, view: CorpusView, ids: memoryview, order: memoryview):
+        self._view = view
+        self._ids = ids
+        self._order = order
+
+    def position(self, hanzi: str) -> Optional[int]:
+        sid = self._view.find_string(hanzi)
+        if sid is None:
+            return None
+        order, ids, hanzi_id = self._order, self._ids, self._view.word_hanzi_id
+        found = _bisect(len(order), lambda i: hanzi_id(ids[order[i]]), sid)
+        return None if found is None else order[found]
+
+    def __getitem__(self, hanzi: str) -> Word:
+        position = self.position(hanzi)
+        if position is None:
+            raise KeyError(hanzi)
+        return self._view.word(self._ids[position])
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._view.word_hanzi(self._ids[i]) for i in self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+
+class SharedStringMap(Mapping[str, str]):
+    """A str -> str mapping stored as (key, value) string id pairs sorted by key id."""
+
+    def __init__(self, view: CorpusView, pairs: memoryview):
+        self._view = view
+        self._pairs = pairs
+
+    def __getitem__(self, key: str) -> str:
+        sid = self._view.find_string(key)
+        if sid is None:
+            raise KeyError(key)
+        pairs = self._pairs
+        found = _bisect(len(pairs) // 2, lambda i: pairs[2 * i], sid)
+        if found is None:
+            raise KeyError(key)
+        return self._view.string(pairs[2 * found + 1])
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._view.string(self._pairs[i]) for i in range(0, len(self._pairs), 2))
+
+    def __len__(self) -> int:
+        return len(self._pairs) // 2
+
+
+class SharedPostings(Mapping[tuple[str, int], Sequence[int]]):
+    """(feature, hanzi length) -> pool indices, as sorted (string id, length, list) triples."""
+
+    def __init__(self, view: CorpusView, triples: memoryview):
+        self._view = view
+        self._triples = triples
+
+    def __getitem__(self, key: tuple[str, int]) -> Sequence[int]:
+        feature, length = key
+        sid = self._view.find_string(feature)
+        if sid is None:
+            raise KeyError(key)
+        triples = self._triples
+        found = _bisect(
+            len(triples) // 3, lambda i: (triples[3 * i], triples[3 * i + 1]), (sid, length)
+        )
+        if found is None:
+            raise KeyError(key)
+        return self._view.list_at(triples[3 * found + 2])
+
+    def __iter__(self) -> Iterator[tuple[str, int]]:
+        triples = self._triples
+        for i in range(0, len(triples), 3):
+            yield self._view.string(triples[i]), triples[i + 1]
+
+    def __len__(self) -> int:
+        return len(self._triples) // 3
+
+
+class SharedLengthPostings(Mapping[int, Sequence[int]]):
+    """Hanzi length -> pool indices, stored as sorted (length, list) pairs."""
+
+    def __init__(self, view: CorpusView, pairs: memoryview):
+        self._view = view
+        self._pairs = pairs
+
+    def __getitem__(self, length: int) -> Sequence[int]:
+        pairs = self._pairs
+        found = _bisect(len(pairs) // 2, lambda i: pairs[2 * i], length)
+        if found is None:
+            raise KeyError(length)
+        return self._view.list_at(pairs[2 * found + 1])
+
+    def __iter__(self) -> Iterator[int]:
+        return (self._pairs[i] for i in range(0, len(self._pairs), 2))
+
+    def __len__(self) -> int:
+        return len(self._pairs) // 2
+
+
+class SharedInvertedIndexes(InvertedIndexes):
+    """``InvertedIndexes`` whose postings are read from the shared buffer."""
+
+    def __init__(self, view: CorpusView, pool_dir: PoolEntry):
+        self.keywords = SharedPostings(view, view.u32(pool_dir["keywords"]))
+        self.chars = SharedPostings(view, view.u32(pool_dir["chars"]))
+        self.radicals = SharedPostings(view, view.u32(pool_dir["radicals"]))
+
+
+class SharedWordPool(WordPool):
+    """A ``WordPool`` whose words and indexes are views over the shared buffer."""
+
+    def __init__(self, view: CorpusView, pool_dir: PoolEntry):
+        super().__init__((), digests=tuple(pool_dir["digests"]))
+        ids = view.u32(pool_dir["words"])
+        self._view = view
+        self._ids = ids
+        self.words = SharedWords(view, ids)
+        self._features = _LazySequence(ids, view.features)
+        self._inverted = SharedInvertedIndexes(view, pool_dir)
+        self._pos_length_buckets = SharedPostings(view, view.u32(pool_dir["pos_length"]))
+        self._length_buckets = SharedLengthPostings(view, view.u32(pool_dir["lengths"]))
+        self._hanzi = SharedHanziIndex(view, ids, view.u32(pool_dir["hanzi"]))
+        self._stored_targets = pool_dir["targets"]
+        self._stored_selections = pool_dir["selections"]
+
+    def index_of(self, hanzi: str) -> Optional[int]:
+        return self._hanzi.position(hanzi)
+
+    def _stored_words(self, name: str) -> tuple[Word, ...]:
+        words = self.words
+        return tuple(words[i] for i in self._view.u32(name))
+
+    def target_words(self, target_level: int) -> tuple[Word, ...]:
+        targets = self._target_words.get(target_level)
+        if targets is None:
+            name = self._stored_targets.get(str(target_level))
+            if name is None:
+                return super().target_words(target_level)
+            targets = self._target_words[target_level] = self._stored_words(name)
+        return targets
+
+    def advanced_selection(self, target_level: int) -> tuple[Word, ...]:
+        ranked = self._advanced_selection.get(target_level)
+        if ranked is None:
+            name = self._stored_selections.get(str(target_level))
+            if name is None:
+                return super().advanced_selection(target_level)
+            ranked = self._advanced_selection[target_level] = self._stored_words(name)
+        return ranked
+
+
+class SharedDistractorTable(DistractorTable):
+    """Distractor rankings read from the shared buffer."""
+
+    def __init__(self, view: CorpusView):
+        super().__init__()
+        self._view = view
+        self._shared = {
+            (tuple(entry["digests"]), entry["tier"], entry["target_level"]): entry
+            for entry in view.directory["rankings"]
+        }
+
+    def __len__(self) -> int:
+        return len(self._shared)
+
+    def get(self, digests: Sequence[str], tier: int, target_level: int) -> Optional[PoolRankings]:
+        entry = self._shared.get((tuple(digests), tier, target_level))
+        if entry is None:
+            return None
+        view = self._view
+        rankings = _LazySequence(view.u32(entry["offsets"]), view.list_at)
+        return PoolRankings(
+            top_k=entry["top_k"], rankings=rankings, truncated=frozenset(entry["truncated"])
+        )
+
+
+class SharedCorpusRegistry(CorpusRegistry):
+    """A ``CorpusRegistry`` serving levels, pools and rankings from a ``CorpusView``."""
+
+    def __init__(self, view: CorpusView):
+        super().__init__(Path(view.directory["data_path"]))
+        self.view = view
+        self._level_dirs = {entry["level"]: entry for entry in view.directory["levels"]}
+        self._pool_dirs = {tuple(entry["digests"]): entry for entry in view.directory["pools"]}
+
+    def _load_level(self, level: int) -> LevelSnapshot:
+        entry = self._level_dirs.get(level)
+        if entry is None:
+            raise FileNotFoundError(f"Level {level} is not in the shared corpus")
+
+        if "alias" in entry:
+            snapshot = self.get_level(entry["alias"])
+            with self._guard:
+                self._level_digests[level] = snapshot.digest
+            return snapshot
+
+        view = self.view
+        ids = view.u32(entry["words"])
+        snapshot = LevelSnapshot(
+            level=level,
+            digest=entry["digest"],
+            words=SharedWords(view, ids),
+            grammar_rules=view.grammar(entry["grammar"]),
+            by_hanzi=SharedHanziIndex(view, ids, view.u32(entry["hanzi"])),
+        )
+        with self._guard:
+            self._snapshots[snapshot.digest] = snapshot
+            self._level_digests[level] = snapshot.digest
+        return snapshot
+
+    def _load_radicals(self) -> Mapping[str, str]:
+        return SharedStringMap(self.view, self.view.u32("radicals"))
+
+    def get_word_pool(self, digests: tuple[str, ...], words: Sequence[Word]) -> WordPool:
+        with self._guard:
+            pool = self._pools.get(digests)
+            if pool is None and digests in self._pool_dirs:
+                pool = self._pools[digests] = SharedWordPool(self.view, self._pool_dirs[digests])
+        return pool or super().get_word_pool(digests, words)
+
+    def get_distractor_table(self) -> Optional[DistractorTable]:
+        with self._guard:
+            if not self._distractor_table_loaded:
+                self._distractor_table = SharedDistractorTable(self.view)
+                self._distractor_table_loaded = True
+            return self._distractor_table
+
+
+def _map_read_only(shm: SharedMemory, size: int) -> mmap.mmap:
+    """Maps a shared memory block read-only, independently of ``shm``'s own mapping.
+
+    ``SharedMemory.close()`` fails while views of its buffer are alive (and
+    retries noisily on garbage collection), so views are taken from a separate
+    read-only mapping, which simply stays mapped until the last view is gone.
+    POSIX blocks are mapped through their file under ``/dev/shm`` (Linux);
+    elsewhere, share the corpus through a file (``write_file``/``open_file``).
+    """
+    if sys.platform == "win32":
+        return mmap.mmap(-1, size, tagname=shm.name, access=mmap.ACCESS_READ)
+    with open(SHM_DIR / shm.name.lstrip("/"), "rb") as f:
+        return mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+
+
+class SharedCorpus:
+    """A packed corpus in shared memory or a memory-mapped file.
+
+    The creating process calls ``create()`` and passes ``name`` to workers,
+    which call ``attach(name)``; ``write_file()``/``open_file()`` do the same
+    through a file. ``data_engine()`` returns an engine reading the corpus in
+    place. Views are read-only: the mapping itself is. Leaving a ``with`` block
+    closes the corpus, and unlinks the block in the process that created it.
+    """
+
+    def __init__(self, mapped: mmap.mmap, shm: Optional[SharedMemory] = None):
+        self._mmap = mapped
+        self._shm = shm
+        self.view = CorpusView(memoryview(mapped), owner=mapped)
+        self._data_engine: Optional[DataEngine] = None
+
+    @property
+    def name(self) -> Optional[str]:
+        return self._shm.name if self._shm is not None else None
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._mmap)
+
+    @classmethod
+    def create(
+        cls, data_engine: Optional[DataEngine] = None, name: Optional[str] = None
+    ) -> "SharedCorpus":
+        payload = export_corpus(data_engine)
+        shm = SharedMemory(name=name, create=True, size=len(payload))
+        buffer = shm.buf
+        assert buffer is not None  # Only None once the block is closed
+        buffer[: len(payload)] = payload
+        mapped = _map_read_only(shm, len(payload))
+        shm.close()  # Kept only to unlink the block
+        return cls(mapped, shm=shm)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedCorpus":
+        """Attaches to a block created by ``create()`` in a parent process.
+
+        Workers started through ``multiprocessing`` share the creator's
+        resource tracker; unrelated processes should map a file instead
+        (``open_file``), as their own tracker would unlink the block on exit.
+        """
+        shm = SharedMemory(name=name)
+        mapped = _map_read_only(shm, shm.size)
+        shm.close()
+        return cls(mapped)
+
+    @staticmethod
+    def write_file(path: Union[str, Path], data_engine: Optional[DataEngine] = None) -> Path:
+        path = Path(path)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(export_corpus(data_engine))
+        tmp_path.replace(path)
+        return path
+
+    @classmethod
+    def open_file(cls, path: Union[str, Path]) -> "SharedCorpus":
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def data_engine(self) -> DataEngine:
+        """Returns a ``DataEngine`` over the shared corpus (one per process)."""
+        if self._data_engine is None:
+            registry = SharedCorpusRegistry(self.view)
+            self._data_engine = DataEngine(
+                data_dir=str(registry.data_path), use_cache=False, registry=registry
+            )
+        return self._data_engine
+
+    def close(self) -> None:
+        """Detaches this process; engines still using the corpus keep it mapped until dropped."""
+        self._data_engine = None
+        # Unmapped once the remaining views are garbage collected
+        with contextlib.suppress(BufferError):
+            self._mmap.close()
+
+    def unlink(self) -> None:
+        """Destroys the shared memory block (creator only); mappings stay valid."""
+        if self._shm is not None:
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> "SharedCorpus":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+        self.unlink()  # A no-op unless this instance created the block
@@ -1,27 +1,65 @@
 import random
-from typing import Optional
+import threading
+from collections.abc import Iterator, MutableSequence, Sequence
+from typing import Any, Optional, Protocol, TypeVar, Union
 
+from hsk.cloze import min_sentence_length
 from hsk.constants import (
+    HSK_EXAM_STRUCTURE,
     PASSING_SCORE_PERCENTAGE,
     QUESTION_TYPE_FIB,
     QUESTION_TYPE_MC,
     QUESTION_TYPE_WRITING,
 )
+from hsk.corpus_registry import get_band_levels
 from hsk.data_engine import DataEngine
+from hsk.distractor_table import distractor_tier
+from hsk.exam_cache import ExamKey, get_exam_cache
 from hsk.models import GrammarRule, Question, TestResult, Word
+from hsk.selection import SELECTION_POOL_FACTOR
+
+# A planned exam question: a vocabulary target or a grammar fill-in
+ExamItem = Union[Word, GrammarRule]
+
+_T = TypeVar("_T")
+
+
+class Rng(Protocol):
+    """The generator methods exams draw on (a ``random.Random`` or the ``random`` module)."""
+
+    def choice(self, seq: Sequence[_T]) -> _T: ...
+
+    def sample(self, population: Sequence[_T], k: int) -> list[_T]: ...
+
+    def shuffle(self, x: MutableSequence[Any]) -> None: ...
+
+
+def make_rng(rng: Optional[Rng] = None, seed: Optional[int] = None) -> Rng:
+    """Returns ``rng``, else a generator seeded with ``seed``, else the ``random`` module."""
+    if rng is not None:
+        return rng
+    if seed is not None:
+        return random.Random(seed)
+    return random
 
 
 class QuestionGenerator:
     """Generates test questions based on HSK data."""
 
-    def __init__(self, data_engine: DataEngine):
+    def __init__(
+        self,
+        data_engine: DataEngine,
+        rng: Optional[Rng] = None,
+        seed: Optional[int] = None,
+    ):
         self.data_engine = data_engine
+        self.rng = make_rng(rng, seed)
 
     def generate_mc_question(self, word: Word, distractors: list[Word]) -> Question:
         """Generates a Multiple Choice question for a vocabulary word."""
         options = [d.meaning for d in distractors]
         options.append(word.meaning)
-        random.shuffle(options)
+        self.rng.shuffle(options)
 
         return Question(
             id=f"MC_{word.hanzi}",
@@ -57,123 +95,183 @@ class QuestionGenerator:
 
 
 class HSKTestEngine:
-    """Manages the HSK test session."""
-
-    def __init__(self, level: int, data_engine: DataEngine, num_questions: int = 10):
+    """Manages the HSK test session.
+
+    Exams are reproducible when a ``seed`` (or a seeded ``rng``, which takes
+    precedence) is given. Exams generated from a ``seed`` alone are served from
+    the process-wide exam cache when the same form is requested again.
+    """
+
+    def __init__(
+        self,
+        level: int,
+        data_engine: DataEngine,
+        num_questions: int = 10,
+        seed: Optional[int] = None,
+        rng: Optional[Rng] = None,
+        lazy: bool = False,
+        prefetch: int = 0,
+    ):
         self.level = level
+        # Lazy exams choose their targets up front but build each question on demand;
+        # ``prefetch`` > 0 builds that many questions ahead on a background thread
+        self.lazy = lazy
+        self.prefetch = prefetch
+        # Only a seed without an injected generator determines the exam
+        self.seed = seed if rng is None else None
         self.data_engine = data_engine
-        self.questions: list[Question] = []
+        self.questions: list[Question] = []  # Built so far (all of them unless lazy)
+        self._plan: list[ExamItem] = []
+        self._exam_cache_key: Optional[ExamKey] = None
+        self._materialize_lock = threading.Lock()
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_target = 0
+        self._prefetch_thread: Optional[threading.Thread] = None
         self.current_question_index = 0
         self.score = 0
         self.mistakes: list[Question] = []
+        # Source of all exam randomness (the global generator unless seeded or injected)
+        self.rng = make_rng(rng, seed)
 
         # v17.0 TIERED POOL LOADING
         # T1 & T2: Load strictly the target level for intra-level homogeneity
         # T3: Load the entire band 7-9
-        if self.level >= 7:
-            for level_id in range(7, 10):
-                self.data_engine.load_level_data(level_id)
-        else:
-            self.data_engine.load_level_data(level)
+        for level_id in get_band_levels(self.level):
+            self.data_engine.load_level_data(level_id)
 
         self.data_engine.load_radicals()
 
         # Aggregate words for the test engine pool (Target selection pool)
-        # We also need a distractor pool which might be the same or larger
-        if self.level >= 7:
-            word_map = {}
-            for level_id in range(7, 10):
-                for w in self.data_engine.get_words_for_level(level_id):
-                    word_map[w.hanzi] = w
-            self.words = list(word_map.values())
-        else:
-            self.words = self.data_engine.get_words_for_level(self.level)
+        # We also need a distractor pool which might be the same or larger.
+        # Band levels with identical sources share one parsed list, so their words
+        # carry the canonical level rather than the requested one.
+        self.pool = self.data_engine.get_word_pool(self.level)
+        self.words = self.pool.words
+        self.target_level = self.data_engine.canonical_level(self.level)
+        self.distractor_rankings = self.data_engine.get_distractor_rankings(self.level)
 
         self.grammar_rules = self.data_engine.get_grammar_for_level(self.level)
 
         self._generate_test(num_questions=num_questions)
 
     def _generate_test(self, num_questions: int) -> None:
-        questions = []
-        if not self.words:
-            self.questions = []
-            return
+        self._exam_cache_key = self._exam_key(num_questions)
+        if self._exam_cache_key is not None:
+            cached = get_exam_cache().get(self._exam_cache_key)
+            if cached is not None:
+                # Cached exams arrive fully built, with nothing left to plan
+                self.questions = cached
+                return
+
+        self._plan = self._plan_questions(num_questions)
+        if not self.lazy:
+            self._materialize_until(len(self._plan))
+
+    def _exam_key(self, num_questions: int) -> Optional[ExamKey]:
+        """Cache key of a seeded exam; None when the exam is not reproducible."""
+        if self.seed is None or self.pool.digests is None or num_questions <= 0:
+            return None
+        return (self.level, num_questions, self.seed, self.pool.digests)
+
+    @property
+    def total_questions(self) -> int:
+        """Number of questions in the exam, including ones not materialized yet."""
+        return len(self._plan) or len(self.questions)
+
+    def build_exam(self, num_questions: int, seed: Optional[int] = None) -> list[Question]:
+        """Builds a fresh exam from this engine's pool without touching the session.
+
+        With a ``seed`` the exam is drawn from ``random.Random(seed)``, which also
+        becomes the engine's generator; otherwise the engine's generator is used.
+        """
+        if seed is not None:
+            self.rng = random.Random(seed)
+        return [self._materialize(item) for item in self._plan_questions(num_questions)]
+
+    def _plan_questions(self, num_questions: int) -> list[ExamItem]:
+        """Chooses the exam's targets (and their order) without building any question."""
+        if not self.words or num_questions <= 0:
+            return []
 
         # v17.0 TARGET FILTERING: Strictly Level L words for the current test
-        target_words = [w for w in self.words if w.level == self.level]
+        target_words = self.pool.target_words(self.target_level)
 
         if self.level >= 7:
-            # ACADEMIC/FORMAL KEYWORDS for C2 Selection
-            academic_keywords = {
-                "哲学",
-                "政治",
-                "经济",
-                "体系",
-                "范畴",
-                "逻辑",
-                "理论",
-                "机制",
-                "策略",
-                "规律",
-                "固然",
-                "诚然",
-            }
-
-            filtered_pool = []
-            for w in target_words:
-                # BLACKLIST INTERJECTIONS/COLLOQUIALISM
-                if w.pos and any(p in ["e", "y", "o"] for p in w.pos):
-                    continue
-                # FILTER: L9 should prefer high-register concepts and compounds
-                filtered_pool.append(w)
-
-            # WEIGHTED SELECTION: Prioritize valid word depth & complexity
-            filtered_pool.sort(
-                key=lambda w: (
-                    len(w.sentences) > 0,
-                    any(k in w.meaning.lower() or k in w.hanzi for k in academic_keywords),
-                    len(w.hanzi) >= 2,  # Prioritize compound words for C2
-                    -w.frequency,
-                ),
-                reverse=True,
+            # The blacklist filter and weighted ranking are static per band (see hsk.selection)
+            ranked_pool = self.pool.advanced_selection(self.target_level)
+            selection_pool = ranked_pool[: num_questions * SELECTION_POOL_FACTOR]
+            selected_words = self.rng.sample(
+                selection_pool, min(len(selection_pool), num_questions)
             )
-
-            selection_pool = filtered_pool[: num_questions * 5]
-            selected_words = random.sample(selection_pool, min(len(selection_pool), num_questions))
         else:
             # Standard Levels (1-6) - Homogeneity selection
             words_with_sentences = [w for w in target_words if w.sentences]
             if len(words_with_sentences) >= num_questions:
-                random.shuffle(words_with_sentences)
+                self.rng.shuffle(words_with_sentences)
                 selected_words = words_with_sentences[:num_questions]
             else:
                 # Merge with words that don't have sentences if needed
                 other_words = [w for w in target_words if not w.sentences]
                 pool = words_with_sentences + other_words
-                random.shuffle(pool)
+                self.rng.shuffle(pool)
                 selected_words = pool[:num_questions]
 
         # Ensure Unique Target Hanzi
         seen_hanzi = set()
-        final_selection = []
+        plan: list[ExamItem] = []
         for w in selected_words:
             if w.hanzi not in seen_hanzi:
-                final_selection.append(w)
+                plan.append(w)
                 seen_hanzi.add(w.hanzi)
 
-        for word in final_selection:
-            q = self._create_question_for_word(word)
-            if q:
-                questions.append(q)
-
         # Fill if needed
-        if len(questions) < num_questions and self.grammar_rules:
-            rule = random.choice(self.grammar_rules)
-            q = QuestionGenerator(self.data_engine).generate_fib_question(rule)
-            questions.append(q)
+        if len(plan) < num_questions and self.grammar_rules:
+            plan.append(self.rng.choice(self.grammar_rules))
+
+        self.rng.shuffle(plan)
+        return plan[:num_questions]
+
+    def _materialize(self, item: ExamItem) -> Question:
+        if isinstance(item, GrammarRule):
+            question = QuestionGenerator(self.data_engine, rng=self.rng).generate_fib_question(item)
+        else:
+            question = self._create_question_for_word(item)
+        # Band levels share one parsed level, whose words and rules carry its level number
+        question.level = self.level
+        return question
+
+    def _materialize_until(self, count: int) -> None:
+        """Builds planned questions, in order, until ``count`` of them exist.
 
-        random.shuffle(questions)
-        self.questions = questions[:num_questions]
+        Questions are always built in plan order under one lock, so a seeded exam
+        draws the same random numbers whether it is built eagerly, on demand, or
+        by the prefetch thread.
+        """
+        count = min(count, len(self._plan))
+        with self._materialize_lock:
+            while len(self.questions) < count:
+                self.questions.append(self._materialize(self._plan[len(self.questions)]))
+            complete = len(self.questions) == len(self._plan)
+        if complete and self._exam_cache_key is not None:
+            get_exam_cache().put(self._exam_cache_key, self.questions)
+            self._exam_cache_key = None
+
+    def _request_prefetch(self, count: int) -> None:
+        with self._prefetch_lock:
+            self._prefetch_target = max(self._prefetch_target, count)
+            if self._prefetch_thread is None:
+                self._prefetch_thread = threading.Thread(target=self._prefetch_loop, daemon=True)
+                self._prefetch_thread.start()
+
+    def _prefetch_loop(self) -> None:
+        while True:
+            with self._prefetch_lock:
+                if len(self.questions) >= min(self._prefetch_target, len(self._plan)):
+                    # Caught up: exit, and let the next request start a new thread
+                    self._prefetch_thread = None
+                    return
+            # One question at a time, so get_next_question never waits for more
+            self._materialize_until(len(self.questions) + 1)
 
     def _create_writing_question(self) -> Optional[Question]:
         """Generates a writing prompt based on Level standards."""
@@ -182,7 +280,7 @@ class HSKTestEngine:
 
         # Level 5: Vocab Composition (80 chars) - Use 3-5 words
         if self.level == 5:
-            target_words = random.sample(self.words, 5)
+            target_words = self.rng.sample(self.words, 5)
             words_str = "，".join([w.hanzi for w in target_words])
             prompt = (
                 "Writing Task (写作): Write a short paragraph "
@@ -204,7 +302,7 @@ class HSKTestEngine:
         elif self.level == 6:
             if not self.words:
                 return None
-            topic_word = random.choice(self.words)
+            topic_word = self.rng.choice(self.words)
             prompt = (
                 "Writing Task (写作): Write a narrative essay "
                 f"(~400 characters) surrounding the theme: 「{topic_word.hanzi}」"
@@ -223,7 +321,7 @@ class HSKTestEngine:
         elif self.level >= 7:
             if not self.words:
                 return None
-            topic_word = random.choice(self.words)
+            topic_word = self.rng.choice(self.words)
             prompt = (
                 "Writing Task (写作): Write an argumentative thesis "
                 f"(~600 characters) analyzing: 「{topic_word.hanzi}」"
@@ -243,90 +341,12 @@ class HSKTestEngine:
     def _create_question_for_word(self, word: Word) -> Question:
         # Standard: Cloze (Fill-in-Blank) using Sentence
         if word.sentences:
-            # RHETORICAL COMPLEXITY MARKERS (C2 Level)
-            rhetorical_markers = [
-                "与其",
-                "毋宁",
-                "甚至",
-                "即便",
-                "既然",
-                "不仅",
-                "岂",
-                "何必",
-                "固然",
-                "何况",
-                "所谓",
-                "诚然",
-            ]
-
-            # REGISTER TRIGGER KEYWORDS (For Discrimination)
-            register_triggers = [
-                "政治",
-                "理论",
-                "学术",
-                "机构",
-                "规则",
-                "逻辑",
-                "范畴",
-                "哲学",
-                "利益",
-                "关系",
-            ]
-
-            # FACTOID BLACKLIST (Biology, Chemistry, Basic Physics)
-            factoid_keywords = {
-                "二氧化碳",
-                "氧气",
-                "光合作用",
-                "肺",
-                "太阳系",
-                "原子",
-                "分子",
-                "科学发现",
-                "排出",
-                "吸收",
-            }
-
-            # PRIORITIZE COMPLEXITY & CONTEXT
-            min_len = 8
-            if self.level >= 7:
-                min_len = 45  # C2 Level Prose
-
-            # Filter for sentences that have enough depth
-            valid_sentences = []
-            for s in word.sentences:
-                if len(s) < min_len:
-                    continue
-                # ANTI-LEAK: Word cannot appear more than once
-                if s.count(word.hanzi) > 1:
-                    continue
-                # ANTI-FACTOID: Deprioritize simple scientific facts
-                if any(k in s for k in factoid_keywords):
-                    continue
-
-                valid_sentences.append(s)
-
-            if not valid_sentences:
-                valid_sentences = [s for s in word.sentences if s.count(word.hanzi) == 1]
-                valid_sentences = sorted(valid_sentences, key=len, reverse=True)[:5]
-
-            if not valid_sentences:
-                valid_sentences = word.sentences[:1]
-
-            # v13 Scorer: Rhetoric + Register + Dept + Colon/Semicolon
-            def c2_score(s: str) -> int:
-                score = len(s)
-                score += s.count("，") * 15
-                score += (s.count("：") + s.count("；")) * 25
-                score += sum(50 for m in rhetorical_markers if m in s)
-                score += sum(30 for t in register_triggers if t in s)  # Bonus for academic context
-                return score
-
-            valid_sentences.sort(key=c2_score, reverse=True)
+            # Sentences are ranked once per (word, tier) and cached on the pool
+            # (see hsk.cloze for the depth, anti-leak, anti-factoid and C2 criteria)
+            candidate_pool = self.pool.cloze_candidates(word, min_sentence_length(self.level))
 
             # Pick from top candidates
-            candidate_pool = valid_sentences[:3]
-            sentence = random.choice(candidate_pool)
+            sentence = self.rng.choice(candidate_pool)
 
             # Mask the word
             masked_sentence = sentence.replace(word.hanzi, "____", 1)
@@ -334,7 +354,7 @@ class HSKTestEngine:
             # Distractors: C2 Quality (Semantic Domain Alignment)
             distractors = self._get_distractors(word, 3, use_hanzi=True)
             options = distractors + [word.hanzi]
-            random.shuffle(options)
+            self.rng.shuffle(options)
 
             return Question(
                 id=f"CLOZE_{word.hanzi}",
@@ -352,7 +372,7 @@ class HSKTestEngine:
             # User wants "Real Exam".
             distractors = self._get_distractors(word, 3, use_hanzi=False)
             options = distractors + [word.meaning]
-            random.shuffle(options)
+            self.rng.shuffle(options)
 
             return Question(
                 id=f"MC_{word.hanzi}",
@@ -372,90 +392,165 @@ class HSKTestEngine:
         # 1. PARALLELISM POOL: Same Level, Same Length, Same POS
         # For High-Band (7-9), pool is level-locked (Strictly L9 for L9 test)
         # unless pool is too small, then Band-locked.
-        candidates = [w for w in self.words if w.hanzi != target.hanzi]
-
-        # Filter by POS (Strict Parallelism)
-        target_pos = set(target.pos) if target.pos else set()
-        if target_pos:
-            candidates = [w for w in candidates if w.pos and set(w.pos).intersection(target_pos)]
-
-        # Filter by Length (Visual Parallelism)
-        candidates = [w for w in candidates if len(w.hanzi) == len(target.hanzi)]
+        # Strict POS + visual (length) parallelism come from the pool's precomputed
+        # (POS, length) buckets; the tier scorers only visit candidates that share a
+        # scored feature with the target (see WordPool.overlapping_candidates).
 
         # 2. TIER-SPECIFIC DISCRIMINATION
-        if self.level >= 7:
-            return self._get_t3_distractors(target, candidates, count)
-        elif 4 <= self.level <= 6:
-            return self._get_t2_distractors(target, candidates, count)
-        else:
-            return self._get_t1_distractors(target, candidates, count)
+        # Rankings built offline (scripts/build_distractor_table.py) skip scoring entirely
+        ranked = self._stored_ranking(target, count)
+        if ranked is None:
+            ranked = self._rank_candidates(target, count)
+
+        if distractor_tier(self.level) == 3:
+            return self._sample_t3_distractors(ranked, count)
+        return [self.pool.words[i].hanzi for i, _ in ranked[:count]]
+
+    def _stored_ranking(self, target: Word, count: int) -> Optional[list[tuple[int, int]]]:
+        stored = self.distractor_rankings
+        if stored is None or count > stored.top_k:
+            return None
+        i = self.pool.index_of(target.hanzi)
+        if i is None or self.pool.words[i] is not target or stored.is_truncated(i):
+            return None
+        return stored.ranking(i)
+
+    def _rank_candidates(self, target: Word, limit: int) -> list[tuple[int, int]]:
+        """Ranks ``target``'s candidates as ``(pool index, score)`` pairs, best first.
 
-    def _get_t1_distractors(self, target: Word, candidates: list[Word], count: int) -> list[str]:
+        Holds at least the best ``limit`` candidates (T3 additionally keeps every
+        candidate its top-tier sampling could draw from).
+        """
+        tier = distractor_tier(self.level)
+        if tier == 3:
+            return self._rank_t3_candidates(target, limit)
+        elif tier == 2:
+            return self._rank_t2_candidates(target, limit)
+        return self._rank_t1_candidates(target, limit)
+
+    def _rank_t1_candidates(self, target: Word, limit: int) -> list[tuple[int, int]]:
         """Tier 1: Foundation (1-3) - Semantic Categories + Visual Traps."""
+        features = self.pool.features
         # Simple clustering based on meaning keywords (Category Lock)
-        target_keywords = set(target.meaning.lower().replace(";", " ").split())
-
-        scored = []
-        for w in candidates:
+        target_features = self.pool.features_of(target)
+        target_keywords = target_features.keywords
+        target_radicals = target_features.radicals
+
+        scores = {}
+        for i in self.pool.overlapping_candidates(
+            target, keywords=target_keywords, radicals=target_radicals
+        ):
+            f = features[i]
             # Category Score (Shared keywords like "color", "time", "action")
-            w_keywords = set(w.meaning.lower().replace(";", " ").split())
-            category_score = len(target_keywords.intersection(w_keywords)) * 100
+            category_score = len(target_keywords & f.keywords) * 100
             # Visual Trap (Shared radical)
-            visual_score = 50 if set(w.radicals).intersection(set(target.radicals)) else 0
-            scored.append((w, category_score + visual_score))
+            visual_score = 0 if target_radicals.isdisjoint(f.radicals) else 50
+            scores[i] = category_score + visual_score
 
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return [w[0].hanzi for w in scored[:count]]
+        return self._top_scored(target, scores, limit)
 
-    def _get_t2_distractors(self, target: Word, candidates: list[Word], count: int) -> list[str]:
+    def _rank_t2_candidates(self, target: Word, limit: int) -> list[tuple[int, int]]:
         """Tier 2: Proficiency (4-6) - Near-Synonyms + Usage scenarios."""
-        target_keywords = set(target.meaning.lower().replace(";", " ").split())
-
-        scored = []
-        for w in candidates:
+        features = self.pool.features
+        target_features = self.pool.features_of(target)
+        target_keywords = target_features.keywords
+        target_chars = target_features.chars
+
+        scores = {}
+        for i in self.pool.overlapping_candidates(
+            target, keywords=target_keywords, chars=target_chars
+        ):
+            f = features[i]
             # Synonymy Score (High keyword overlap)
-            w_keywords = set(w.meaning.lower().replace(";", " ").split())
-            synonym_score = len(target_keywords.intersection(w_keywords)) * 150
+            synonym_score = len(target_keywords & f.keywords) * 150
             # Sibling Check (shared character)
-            shared_char = len(set(w.hanzi).intersection(set(target.hanzi)))
-            kinship_bonus = 80 if shared_char > 0 else 0
-            scored.append((w, synonym_score + kinship_bonus))
+            kinship_bonus = 0 if target_chars.isdisjoint(f.chars) else 80
+            scores[i] = synonym_score + kinship_bonus
 
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return [w[0].hanzi for w in scored[:count]]
+        return self._top_scored(target, scores, limit)
 
-    def _get_t3_distractors(self, target: Word, candidates: list[Word], count: int) -> list[str]:
+    def _rank_t3_candidates(self, target: Word, limit: int) -> list[tuple[int, int]]:
         """Tier 3: Doctorate (7-9) - Morphological Siblings + Register."""
+        words, features = self.pool.words, self.pool.features
         # Force Morphological Siblings (Character Kinship)
-        target_chars = set(target.hanzi)
-        target_keywords = set(target.meaning.lower().replace(";", " ").split())
+        target_features = self.pool.features_of(target)
+        target_chars = target_features.chars
+        target_keywords = target_features.keywords
 
-        scored = []
-        for w in candidates:
-            # Sibling Bonus (ROOT CHARACTER MATCH)
-            shared_chars = len(set(w.hanzi).intersection(target_chars))
-            kinship_score = shared_chars * 250
-            # Semantic Domain (Technical overlapping)
-            w_keywords = set(w.meaning.lower().replace(";", " ").split())
-            domain_score = len(target_keywords.intersection(w_keywords)) * 100
+        def level_bonus(i: int) -> int:
             # Band Purity Bonus
-            level_bonus = 50 if w.level == self.level else 0
+            return 50 if words[i].level == self.target_level else 0
 
-            scored.append((w, kinship_score + domain_score + level_bonus))
-
-        scored.sort(key=lambda x: x[1], reverse=True)
+        scores = {}
+        for i in self.pool.overlapping_candidates(
+            target, keywords=target_keywords, chars=target_chars
+        ):
+            f = features[i]
+            # Sibling Bonus (ROOT CHARACTER MATCH)
+            kinship_score = len(target_chars & f.chars) * 250
+            # Semantic Domain (Technical overlapping)
+            domain_score = len(target_keywords & f.keywords) * 100
+            scores[i] = kinship_score + domain_score + level_bonus(i)
+
+        scored = sorted(scores.items(), key=lambda x: (-x[1], x[0]))
+
+        # Overlapping candidates score at least 100 and the rest at most 50 (level bonus
+        # only), so the rest only matter when the best score leaves room for them.
+        if not scored or scored[0][1] - 50 <= 50 or len(scored) < limit:
+            rest = [
+                (i, level_bonus(i))
+                for i in self.pool.iter_parallel_candidate_indices(target)
+                if i not in scores
+            ]
+            rest.sort(key=lambda x: -x[1])
+            scored += rest
+        return scored
 
+    def _sample_t3_distractors(self, ranked: list[tuple[int, int]], count: int) -> list[str]:
+        words = self.pool.words
         # Ensure we don't just pick based on level if kinship is high
         # Sample for variability among top tier
-        top_candidates = [x[0] for x in scored if x[1] >= scored[0][1] - 50]
+        top_candidates = [words[x[0]] for x in ranked if x[1] >= ranked[0][1] - 50]
         if len(top_candidates) >= count:
-            return [w.hanzi for w in random.sample(top_candidates, count)]
-        return [w[0].hanzi for w in scored[:count]]
+            return [w.hanzi for w in self.rng.sample(top_candidates, count)]
+        return [words[x[0]].hanzi for x in ranked[:count]]
+
+    def _top_scored(
+        self, target: Word, scores: dict[int, int], count: int
+    ) -> list[tuple[int, int]]:
+        """Returns the ``count`` best candidates, ties broken by pool order.
+
+        ``scores`` holds the candidates scoring above zero; any shortfall is filled
+        with zero-score candidates in pool order, matching a full stable sort.
+        """
+        ranked = [(i, scores[i]) for i in sorted(scores, key=lambda i: (-scores[i], i))[:count]]
+        if len(ranked) < count:
+            for i in self.pool.iter_parallel_candidate_indices(target):
+                if i not in scores:
+                    ranked.append((i, 0))
+                    if len(ranked) == count:
+                        break
+        return ranked
+
+    def find_word(self, hanzi: str) -> Optional[Word]:
+        """Returns the pool word for ``hanzi`` (O(1) via the DataEngine index).
+
+        The exam's own level is searched first, so its words report that level.
+        """
+        band = get_band_levels(self.level)
+        for level_id in (self.level, *(other for other in band if other != self.level)):
+            word = self.data_engine.lookup_word(hanzi, level_id)
+            if word is not None:
+                return word
+        return None
 
     def get_next_question(self) -> Optional[Question]:
-        if self.current_question_index < len(self.questions):
+        if self.current_question_index < self.total_questions:
+            self._materialize_until(self.current_question_index + 1)
             q = self.questions[self.current_question_index]
             self.current_question_index += 1
+            if self.prefetch > 0:
+                self._request_prefetch(self.current_question_index + self.prefetch)
             return q
         return None
 
@@ -491,7 +586,8 @@ class HSKTestEngine:
         return "No specific radical hint available."
 
     def calculate_result(self) -> TestResult:
-        percentage = int((self.score / len(self.questions)) * 100) if self.questions else 0
+        total = self.total_questions
+        percentage = int((self.score / total) * 100) if total else 0
         passed = percentage >= PASSING_SCORE_PERCENTAGE
 
         grammar_issues = []
@@ -505,8 +601,31 @@ class HSKTestEngine:
         return TestResult(
             level=self.level,
             score=percentage,
-            total_questions=len(self.questions),
+            total_questions=total,
             grammar_issues=list(set(grammar_issues)),  # unique
             passed=passed,
             details="Exam Ready" if passed else "Targeted Practice Required",
         )
+
+
+def generate_exams(
+    level: int,
+    count: int,
+    num_questions: Optional[int] = None,
+    seed: Optional[int] = None,
+    data_engine: Optional[DataEngine] = None,
+) -> Iterator[list[Question]]:
+    """Yields ``count`` exams for ``level`` as question lists, one at a time.
+
+    The word pool, its indexes and the cached selection and cloze rankings are
+    built once and shared by every exam, and nothing is retained between
+    exams, so memory stays flat however many are generated. With a ``seed``,
+    exam ``i`` is generated from ``random.Random(seed + i)``, so an exam only
+    depends on its own seed and batches can be split into seed ranges.
+    """
+    if num_questions is None:
+        num_questions = HSK_EXAM_STRUCTURE.get(level, 10)
+    engine = HSKTestEngine(level, data_engine or DataEngine(), num_questions=0)
+
+    for i in range(count):
+        yield engine.build_exam(num_questions, None if seed is None else seed + i)
@@ -0,0 +1,181 @@
+"""Warm pool of pre-generated exams.
+
+Exam starts arrive in bursts, so instead of generating an exam inside each
+request, ``ExamWarmPool`` keeps a few ready-made ``HSKTestEngine`` sessions
+per (level, mode) in bounded queues. Handing one out is a constant-time pop;
+a background thread refills whatever was taken.
+"""
+
+import random
+import threading
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Optional
+
+from hsk.constants import HSK_EXAM_STRUCTURE, MODE_EXAM, MODE_PRACTICE, PRACTICE_QUESTIONS
+from hsk.data_engine import DataEngine
+from hsk.test_engine import HSKTestEngine
+
+DEFAULT_POOL_SIZE = 4
+# Seconds the refill thread waits after a failed generation before retrying
+FAILURE_BACKOFF = 1.0
+
+# (level, mode)
+PoolKey = tuple[int, str]
+
+
+def questions_for_mode(level: int, mode: str) -> int:
+    """Returns the exam length for a mode (see ``MODE_PRACTICE``/``MODE_EXAM``)."""
+    if mode == MODE_PRACTICE:
+        return PRACTICE_QUESTIONS
+    if mode == MODE_EXAM:
+        return HSK_EXAM_STRUCTURE.get(level, 40)
+    raise ValueError(f"Unknown exam mode: {mode!r}")
+
+
+@dataclass
+class PoolStats:
+    """Hand-out metrics for one (level, mode) queue."""
+
+    hits: int = 0
+    misses: int = 0
+    generated: int = 0  # Exams built by the refill thread
+    failed: int = 0  # Refill attempts that raised
+    ready: int = 0  # Exams currently waiting in the queue
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ExamWarmPool:
+    """Keeps up to ``size`` ready exams per (level, mode) and refills them in the background.
+
+    Each pooled exam gets its own ``random.Random``, so sessions never share
+    generator state. Call ``start()`` to fill the queues and ``close()`` to stop
+    the refill thread.
+    """
+
+    def __init__(
+        self,
+        data_engine: DataEngine,
+        keys: Iterable[PoolKey],
+        size: int = DEFAULT_POOL_SIZE,
+    ):
+        self.data_engine = data_engine
+        self.size = size
+        self._queues: dict[PoolKey, deque[HSKTestEngine]] = {}
+        self._stats: dict[PoolKey, PoolStats] = {}
+        for level, mode in keys:
+            questions_for_mode(level, mode)  # Validate the mode up front
+            data_engine.load_level_data(level)  # ... and that the level has data
+            self._queues[(level, mode)] = deque()
+            self._stats[(level, mode)] = PoolStats()
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "ExamWarmPool":
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._refill_loop, daemon=True)
+                self._thread.start()
+        return self
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "ExamWarmPool":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def acquire(self, level: int, mode: str) -> HSKTestEngine:
+        """Returns a fresh exam session, from the pool when one is ready.
+
+        Keys outside the pool are generated on the spot and not counted in ``stats()``.
+        """
+        key = (level, mode)
+        with self._lock:
+            queue = self._queues.get(key)
+            stats = self._stats.get(key)
+            if queue and stats is not None:
+                stats.hits += 1
+                self._wakeup.notify_all()
+                return queue.popleft()
+            if stats is not None:
+                stats.misses += 1
+        # Unpooled key or empty queue: pay the generation cost in this call
+        return self._generate(key)
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until every queue is full; returns False on timeout."""
+        with self._lock:
+            return self._wakeup.wait_for(self._is_full, timeout)
+
+    def stats(self) -> dict[PoolKey, PoolStats]:
+        with self._lock:
+            snapshot = {}
+            for key, stats in self._stats.items():
+                queue = self._queues.get(key)
+                snapshot[key] = PoolStats(
+                    stats.hits,
+                    stats.misses,
+                    stats.generated,
+                    stats.failed,
+                    len(queue) if queue else 0,
+                )
+            return snapshot
+
+    def _generate(self, key: PoolKey) -> HSKTestEngine:
+        level, mode = key
+        return HSKTestEngine(
+            level,
+            self.data_engine,
+            num_questions=questions_for_mode(level, mode),
+            rng=random.Random(),
+        )
+
+    def _is_full(self) -> bool:
+        return all(len(queue) >= self.size for queue in self._queues.values())
+
+    def _next_to_refill(self) -> Optional[PoolKey]:
+        # Emptiest queue first, so a burst on one key does not starve the others
+        key, queue = min(self._queues.items(), key=lambda item: len(item[1]), default=(None, None))
+        if queue is None or len(queue) >= self.size:
+            return None
+        return key
+
+    def _refill_loop(self) -> None:
+        while True:
+            with self._lock:
+                key = self._next_to_refill()
+                while not self._closed and key is None:
+                    self._wakeup.notify_all()  # Wake wait_ready() callers
+                    self._wakeup.wait()
+                    key = self._next_to_refill()
+                if self._closed or key is None:
+                    return
+
+            try:
+                exam = self._generate(key)
+            except Exception as e:
+                # Keep the thread alive for the other keys; retry this one after a pause
+                print(f"Error refilling exam pool for {key}: {e!r}")
+                with self._lock:
+                    self._stats[key].failed += 1
+                    self._wakeup.wait_for(lambda: self._closed, FAILURE_BACKOFF)
+                continue
+            with self._lock:
+                self._queues[key].append(exam)
+                self._stats[key].generated += 1
@@ -0,0 +1,245 @@
+"""Word pools with precomputed lookup indexes for question generation.
+
+A ``WordPool`` wraps the (immutable) vocabulary an exam draws from. Indexes
+are built lazily on first use and then reused by every exam generated from the
+same pool; pools for registry-loaded levels are shared process-wide through
+``CorpusRegistry.get_word_pool``.
+"""
+
+import threading
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Optional
+
+from hsk.cloze import CLOZE_CANDIDATES, rank_cloze_sentences
+from hsk.models import Word
+from hsk.selection import rank_advanced_targets
+
+
+@dataclass(frozen=True)
+class WordFeatures:
+    """Tokenized features used by the distractor tier scorers."""
+
+    keywords: frozenset[str]  # Lower-cased meaning tokens
+    chars: frozenset[str]  # Characters of the hanzi
+    radicals: frozenset[str]
+    pos: frozenset[str]
+
+
+def meaning_keywords(meaning: str) -> frozenset[str]:
+    return frozenset(meaning.lower().replace(";", " ").split())
+
+
+def word_features(word: Word) -> WordFeatures:
+    return WordFeatures(
+        keywords=meaning_keywords(word.meaning),
+        chars=frozenset(word.hanzi),
+        radicals=frozenset(word.radicals),
+        pos=frozenset(word.pos),
+    )
+
+
+class InvertedIndexes:
+    """Feature -> pool index postings, keyed by (feature, hanzi length).
+
+    Keying by length applies the visual-parallelism filter up front, so a
+    lookup only touches words that could be candidates for the target.
+    """
+
+    def __init__(self, words: Sequence[Word], features: Sequence[WordFeatures]):
+        keywords: dict[tuple[str, int], list[int]] = {}
+        chars: dict[tuple[str, int], list[int]] = {}
+        radicals: dict[tuple[str, int], list[int]] = {}
+
+        for i, (w, f) in enumerate(zip(words, features)):
+            length = len(w.hanzi)
+            for keyword in f.keywords:
+                keywords.setdefault((keyword, length), []).append(i)
+            for char in f.chars:
+                chars.setdefault((char, length), []).append(i)
+            for radical in f.radicals:
+                radicals.setdefault((radical, length), []).append(i)
+
+        self.keywords: Mapping[tuple[str, int], Sequence[int]] = keywords
+        self.chars: Mapping[tuple[str, int], Sequence[int]] = chars
+        self.radicals: Mapping[tuple[str, int], Sequence[int]] = radicals
+
+
+class WordPool:
+    """An immutable word pool plus indexes shared across exams."""
+
+    def __init__(self, words: Sequence[Word], digests: Optional[tuple[str, ...]] = None):
+        # A tuple, or a read-only view for pools served from shared memory
+        self.words: Sequence[Word] = tuple(words)
+        # Digests of the level sources the pool was built from (None if not loaded from disk)
+        self.digests = digests
+        self._lock = threading.Lock()
+
+        # (POS tag, hanzi length) -> pool indices, ascending (i.e. in pool order)
+        self._pos_length_buckets: Optional[Mapping[tuple[str, int], Sequence[int]]] = None
+        # hanzi length -> pool indices, ascending
+        self._length_buckets: Optional[Mapping[int, Sequence[int]]] = None
+        # Feature table parallel to ``words``
+        self._features: Optional[Sequence[WordFeatures]] = None
+        self._positions: Optional[dict[str, int]] = None  # Hanzi -> pool index
+        self._inverted: Optional[InvertedIndexes] = None
+        # (pool index, minimum sentence length) -> top cloze sentences
+        self._cloze_candidates: dict[tuple[int, int], tuple[str, ...]] = {}
+        # Target level -> words of that level / ranked advanced targets
+        self._target_words: dict[int, tuple[Word, ...]] = {}
+        self._advanced_selection: dict[int, tuple[Word, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    @property
+    def features(self) -> Sequence[WordFeatures]:
+        """Per-word features, tokenized once per pool (indexed like ``words``)."""
+        if self._features is None:
+            with self._lock:
+                if self._features is None:
+                    self._features = tuple(word_features(w) for w in self.words)
+        return self._features
+
+    def index_of(self, hanzi: str) -> Optional[int]:
+        if self._positions is None:
+            with self._lock:
+                if self._positions is None:
+                    positions: dict[str, int] = {}
+                    for i, w in enumerate(self.words):
+                        positions.setdefault(w.hanzi, i)
+                    self._positions = positions
+        return self._positions.get(hanzi)
+
+    def features_of(self, word: Word) -> WordFeatures:
+        """Returns ``word``'s features, from the table when it belongs to the pool."""
+        i = self.index_of(word.hanzi)
+        if i is not None and self.words[i] is word:
+            return self.features[i]
+        return word_features(word)
+
+    @property
+    def inverted(self) -> InvertedIndexes:
+        if self._inverted is None:
+            features = self.features
+            with self._lock:
+                if self._inverted is None:
+                    self._inverted = InvertedIndexes(self.words, features)
+        return self._inverted
+
+    def overlapping_candidates(
+        self,
+        target: Word,
+        keywords: frozenset[str] = frozenset(),
+        chars: frozenset[str] = frozenset(),
+        radicals: frozenset[str] = frozenset(),
+    ) -> set[int]:
+        """Returns the parallel candidates sharing any of the given features with ``target``.
+
+        Only the matching postings are visited, so the cost scales with the
+        overlap rather than with the pool.
+        """
+        inverted = self.inverted
+        length = len(target.hanzi)
+
+        found: set[int] = set()
+        for postings, keys in (
+            (inverted.keywords, keywords),
+            (inverted.chars, chars),
+            (inverted.radicals, radicals),
+        ):
+            for key in keys:
+                found.update(postings.get((key, length), ()))
+
+        features = self.features
+        target_pos = frozenset(target.pos)
+        return {
+            i
+            for i in found
+            if self.words[i].hanzi != target.hanzi
+            and (not target_pos or not target_pos.isdisjoint(features[i].pos))
+        }
+
+    def cloze_candidates(self, word: Word, min_len: int) -> tuple[str, ...]:
+        """Returns ``word``'s top cloze sentences for a tier, ranked once and cached."""
+        i = self.index_of(word.hanzi)
+        if i is None or self.words[i] is not word:
+            return tuple(
+                rank_cloze_sentences(word.hanzi, word.sentences, min_len)[:CLOZE_CANDIDATES]
+            )
+
+        key = (i, min_len)
+        candidates = self._cloze_candidates.get(key)
+        if candidates is None:
+            ranked = rank_cloze_sentences(word.hanzi, word.sentences, min_len)
+            candidates = tuple(ranked[:CLOZE_CANDIDATES])
+            self._cloze_candidates[key] = candidates
+        return candidates
+
+    def build_indexes(self) -> None:
+        """Builds every lazily computed index now (e.g. before forking workers)."""
+        self.inverted  # noqa: B018 - builds the features as well
+        self.index_of("")
+        self._buckets()
+
+    def target_words(self, target_level: int) -> tuple[Word, ...]:
+        """Returns the pool's words of ``target_level``, in pool order."""
+        targets = self._target_words.get(target_level)
+        if targets is None:
+            targets = tuple(w for w in self.words if w.level == target_level)
+            self._target_words[target_level] = targets
+        return targets
+
+    def advanced_selection(self, target_level: int) -> tuple[Word, ...]:
+        """Returns the ranked level 7-9 exam targets for ``target_level``, computed once."""
+        ranked = self._advanced_selection.get(target_level)
+        if ranked is None:
+            ranked = tuple(rank_advanced_targets(self.target_words(target_level)))
+            self._advanced_selection[target_level] = ranked
+        return ranked
+
+    def parallel_candidates(self, target: Word) -> list[Word]:
+        """Returns the distractor candidates parallel to ``target``, in pool order.
+
+        Candidates have the same hanzi length and share at least one POS tag
+        with the target (any POS if the target has none), excluding the target.
+        """
+        return [self.words[i] for i in self.parallel_candidate_indices(target)]
+
+    def parallel_candidate_indices(self, target: Word) -> list[int]:
+        return list(self.iter_parallel_candidate_indices(target))
+
+    def iter_parallel_candidate_indices(self, target: Word) -> Iterator[int]:
+        """Lazily yields parallel candidate indices in pool order."""
+        pos_length_buckets, length_buckets = self._buckets()
+        length = len(target.hanzi)
+
+        if target.pos:
+            buckets = [
+                pos_length_buckets[key]
+                for key in {(tag, length) for tag in target.pos}
+                if key in pos_length_buckets
+            ]
+            # Words tagged with several of the target's POS appear in several buckets
+            indices = buckets[0] if len(buckets) == 1 else sorted(set().union(*buckets))
+        else:
+            indices = length_buckets.get(length, [])
+
+        return (i for i in indices if self.words[i].hanzi != target.hanzi)
+
+    def _buckets(
+        self,
+    ) -> tuple[Mapping[tuple[str, int], Sequence[int]], Mapping[int, Sequence[int]]]:
+        if self._pos_length_buckets is None or self._length_buckets is None:
+            with self._lock:
+                if self._pos_length_buckets is None or self._length_buckets is None:
+                    pos_length_buckets: dict[tuple[str, int], list[int]] = {}
+                    length_buckets: dict[int, list[int]] = {}
+                    for i, w in enumerate(self.words):
+                        length = len(w.hanzi)
+                        length_buckets.setdefault(length, []).append(i)
+                        for tag in set(w.pos):
+                            pos_length_buckets.setdefault((tag, length), []).append(i)
+                    self._length_buckets = length_buckets
+                    self._pos_length_buckets = pos_length_buckets
+        return self._pos_length_buckets, self._length_buckets
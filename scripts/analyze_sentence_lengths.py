@@ -1,10 +1,11 @@
-import json
 import statistics
+from pathlib import Path
+
+from hsk.sentence_store import read_level_file
 
 
 def analyze_lengths(file_path):
-    with open(file_path, encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_level_file(Path(file_path))
 
     vocab_list = data.get("vocabulary", [])
 
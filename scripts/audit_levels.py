@@ -1,6 +1,9 @@
 import json
 import pathlib
-from typing import Dict, List, Set
+from typing import Dict
+
+from hsk.segmenter import Segmenter
+from hsk.sentence_store import read_level_file
 
 DATA_DIR = pathlib.Path(__file__).parent.parent / "hsk" / "data"
 
@@ -26,60 +29,27 @@ def load_all_words() -> Dict[str, int]:
     return word_level_map
 
 
-def max_match_segment(text: str, dictionary: Set[str]) -> List[str]:
-    """Simple MaxMatch segmentation to find words in sentence."""
-    # This is a heuristic.
-    # Greedily match longest possible word from dictionary starting at current pos
-    start = 0
-    tokens = []
-    n = len(text)
-
-    while start < n:
-        matched = False
-        # Try to match lengths 4 down to 1
-        for length in range(4, 0, -1):
-            if start + length > n:
-                continue
-
-            sub = text[start : start + length]
-            if sub in dictionary:
-                tokens.append(sub)
-                start += length
-                matched = True
-                break
-
-        if not matched:
-            # Skip unknown char
-            tokens.append(text[start])
-            start += 1
-
-    return tokens
-
-
-def audit_level(target_level: int, word_level_map: Dict[str, int]):
+def audit_level(target_level: int, word_level_map: Dict[str, int], segmenter: Segmenter):
     path = DATA_DIR / f"level_{target_level}.json"
     if not path.exists():
         return
 
     print(f"\n--- Auditing Level {target_level} ---")
 
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_level_file(path)
 
     vocab = data.get("vocabulary", [])
 
     total_sentences = 0
     bad_sentences = 0
 
-    dictionary_keys = set(word_level_map.keys())
-
     for word_obj in vocab:
         sentences = word_obj.get("sentences", [])
         for sent in sentences:
             total_sentences += 1
 
             # Check vocab in this sentence
-            tokens = max_match_segment(sent, dictionary_keys)
+            tokens = segmenter.segment(sent)
 
             max_word_level = 0
             offender = ""
@@ -105,9 +75,10 @@ def audit_level(target_level: int, word_level_map: Dict[str, int]):
 
 def main():
     word_map = load_all_words()
+    segmenter = Segmenter(word_map)
     # Audit Levels 1, 2, 3 (Most sensitive to this issue)
     for i in [1, 2, 3]:
-        audit_level(i, word_map)
+        audit_level(i, word_map, segmenter)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,74 @@
+import random
+import time
+
+from hsk.data_engine import DataEngine
+from hsk.test_engine import HSKTestEngine
+
+# One representative level per distractor tier
+TIER_LEVELS = {"T1": 2, "T2": 5, "T3": 9}
+SAMPLE_SIZE = 300
+
+
+def _keywords(word):
+    return set(word.meaning.lower().replace(";", " ").split())
+
+
+def legacy_distractors(engine, target, count=3):
+    """The pre-index implementation: linear filter plus per-candidate tokenization."""
+    candidates = [w for w in engine.words if w.hanzi != target.hanzi]
+    target_pos = set(target.pos)
+    if target_pos:
+        candidates = [w for w in candidates if w.pos and set(w.pos).intersection(target_pos)]
+    candidates = [w for w in candidates if len(w.hanzi) == len(target.hanzi)]
+
+    scored = []
+    for w in candidates:
+        shared_keywords = len(_keywords(target) & _keywords(w))
+        if engine.level >= 7:
+            score = len(set(w.hanzi) & set(target.hanzi)) * 250 + shared_keywords * 100
+            score += 50 if w.level == engine.target_level else 0
+        elif engine.level >= 4:
+            score = shared_keywords * 150 + (80 if set(w.hanzi) & set(target.hanzi) else 0)
+        else:
+            score = shared_keywords * 100 + (50 if set(w.radicals) & set(target.radicals) else 0)
+        scored.append((w, score))
+
+    scored.sort(key=lambda x: x[1], reverse=True)
+    if engine.level >= 7:
+        top_candidates = [x[0] for x in scored if x[1] >= scored[0][1] - 50]
+        if len(top_candidates) >= count:
+            return [w.hanzi for w in random.sample(top_candidates, count)]
+    return [w[0].hanzi for w in scored[:count]]
+
+
+def time_per_call(func, targets):
+    start = time.perf_counter()
+    for target in targets:
+        func(target)
+    return (time.perf_counter() - start) / len(targets) * 1000
+
+
+def benchmark_distractors():
+    data_engine = DataEngine()
+    random.seed(0)
+
+    print(
+        f"{'Tier':<6}{'Level':>6}{'Pool':>7}{'Legacy (ms)':>13}{'Indexed (ms)':>14}{'Speedup':>9}"
+    )
+    for tier, level in TIER_LEVELS.items():
+        engine = HSKTestEngine(level, data_engine, num_questions=1)
+        targets = random.sample(list(engine.words), min(SAMPLE_SIZE, len(engine.words)))
+
+        # Warm the pool's lazily built indexes so only per-question cost is timed
+        engine._get_distractors(targets[0], 3)
+
+        legacy = time_per_call(lambda t, e=engine: legacy_distractors(e, t), targets)
+        indexed = time_per_call(lambda t, e=engine: e._get_distractors(t, 3), targets)
+        print(
+            f"{tier:<6}{level:>6}{len(engine.words):>7}{legacy:>13.3f}{indexed:>14.3f}"
+            f"{legacy / indexed:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_distractors()
@@ -0,0 +1,66 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from hsk.corpus_registry import deep_sizeof
+from hsk.models import Word
+from hsk.sentence_store import read_level_file
+
+DATA_DIR = Path(__file__).parent.parent / "hsk" / "data"
+
+
+@dataclass
+class LegacyWord:
+    """The pre-compaction Word layout (plain dataclass with list fields)."""
+
+    hanzi: str
+    pinyin: str
+    meaning: str
+    level: int
+    radicals: list[str] = field(default_factory=list)
+    sentences: list[str] = field(default_factory=list)
+    pos: list[str] = field(default_factory=list)
+    frequency: int = 0
+
+
+def build_words(cls, vocabulary, level):
+    return [
+        cls(
+            hanzi=w["hanzi"],
+            pinyin=w["pinyin"],
+            meaning=w["meaning"],
+            level=level,
+            radicals=list(w.get("radicals", [])),
+            sentences=list(w.get("sentences", [])),
+            pos=list(w.get("pos", [])),
+            frequency=w.get("frequency", 0),
+        )
+        for w in vocabulary
+    ]
+
+
+def benchmark_memory():
+    print(
+        f"{'Level':<6}{'Words':>7}{'Legacy (KB)':>14}{'Compact (KB)':>14}"
+        f"{'B/word':>9}{'B/word':>9}{'Saved':>8}"
+    )
+    for level in range(1, 10):
+        path = DATA_DIR / f"level_{level}.json"
+        if not path.exists():
+            continue
+
+        vocabulary = read_level_file(path).get("vocabulary", [])
+
+        # Deep size counts each distinct object once, so strings shared by
+        # interning are only charged to the first word that references them.
+        legacy = deep_sizeof(build_words(LegacyWord, vocabulary, level))
+        compact = deep_sizeof(build_words(Word, vocabulary, level))
+
+        print(
+            f"{level:<6}{len(vocabulary):>7}{legacy / 1024:>14.1f}{compact / 1024:>14.1f}"
+            f"{legacy / len(vocabulary):>9.0f}{compact / len(vocabulary):>9.0f}"
+            f"{1 - compact / legacy:>8.1%}"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_memory()
@@ -0,0 +1,34 @@
+import argparse
+import os
+import time
+
+from hsk.parallel import generate_exams_parallel
+from hsk.test_engine import generate_exams
+
+LEVELS = (1, 5, 9)
+
+
+def benchmark_parallel(count: int) -> None:
+    """Times serial vs process-pool generation of ``count`` exams per level."""
+    start = time.perf_counter()
+    serial = [(level, q) for level in LEVELS for q in generate_exams(level, count, seed=0)]
+    serial_time = time.perf_counter() - start
+    total = len(serial)
+    print(f"{'Workers':<9}{'Exams/s':>9}{'Speedup':>9}")
+    print(f"{'serial':<9}{total / serial_time:>9.0f}{1.0:>8.1f}x")
+
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, cpus} & set(range(1, cpus + 1)))
+    for workers in worker_counts:
+        start = time.perf_counter()
+        merged = list(generate_exams_parallel(LEVELS, count, seed=0, workers=workers))
+        elapsed = time.perf_counter() - start
+        assert merged == serial, "parallel merge must match serial generation"
+        print(f"{workers:<9}{total / elapsed:>9.0f}{serial_time / elapsed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=benchmark_parallel.__doc__)
+    parser.add_argument("--count", type=int, default=500, help="exams per level")
+    args = parser.parse_args()
+    benchmark_parallel(args.count)
@@ -0,0 +1,93 @@
+import argparse
+import gc
+import json
+import os
+
+from hsk.data_engine import DataEngine
+from hsk.prefork import freeze_heap, memory_usage, warm_corpus
+from hsk.test_engine import generate_exams
+
+WORKLOAD_LEVELS = (1, 5, 9)
+
+
+def _fork_worker(data_engine, exams):
+    """Forks a worker that generates exams, collects garbage and reports its memory."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        for level in WORKLOAD_LEVELS:
+            for _ in generate_exams(level, exams, seed=os.getpid(), data_engine=data_engine):
+                pass
+        gc.collect()  # A full collection walks (and dirties) every tracked object
+        with os.fdopen(write_fd, "w") as f:
+            json.dump(memory_usage(), f)
+        os._exit(0)
+
+    os.close(write_fd)
+    return pid, read_fd
+
+
+def _run_config(workers, exams, freeze):
+    data_engine = DataEngine()
+    warm_corpus(data_engine)
+    if freeze:
+        freeze_heap()
+    else:
+        gc.collect()
+    parent = memory_usage()
+
+    children = [_fork_worker(data_engine, exams) for _ in range(workers)]
+    usages = []
+    for pid, read_fd in children:
+        with os.fdopen(read_fd) as f:
+            usages.append(json.load(f))
+        os.waitpid(pid, 0)
+    return parent, usages
+
+
+def benchmark_prefork(workers, exams):
+    """Measures per-worker memory of forked workers sharing one pre-built corpus."""
+    if memory_usage() is None:
+        print("Requires /proc/<pid>/smaps_rollup (Linux)")
+        return
+
+    baseline = memory_usage()["Rss"]
+    print(f"{'Config':<12}{'Parent RSS':>12}{'Worker RSS':>12}{'Worker PSS':>12}{'Private':>10}")
+    for freeze in (False, True):
+        # Each configuration runs in its own child so gc.freeze() does not leak across
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            with os.fdopen(write_fd, "w") as f:
+                json.dump(_run_config(workers, exams, freeze), f)
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as f:
+            parent, usages = json.load(f)
+        os.waitpid(pid, 0)
+
+        def mean_mb(key, usages=usages):
+            return sum(u[key] for u in usages) / len(usages) / 1024
+
+        label = "gc.freeze" if freeze else "no freeze"
+        print(
+            f"{label:<12}{parent['Rss'] / 1024:>9.1f} MB{mean_mb('Rss'):>9.1f} MB"
+            f"{mean_mb('Pss'):>9.1f} MB{mean_mb('Private_Dirty'):>7.1f} MB"
+        )
+
+    corpus_mb = (parent["Rss"] - baseline) / 1024
+    print(
+        f"\nCorpus and indexes: ~{corpus_mb:.1f} MB per process when every worker loads its own;"
+        f"\nforked workers only add their private pages ({workers} workers, "
+        f"{exams} exams per level each)."
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=benchmark_prefork.__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--exams", type=int, default=50, help="exams per level per worker")
+    args = parser.parse_args()
+    benchmark_prefork(args.workers, args.exams)
@@ -0,0 +1,72 @@
+import argparse
+import time
+from pathlib import Path
+
+from hsk.segmenter import Segmenter
+from hsk.sentence_store import read_level_file
+
+DATA_DIR = Path(__file__).parent.parent / "hsk" / "data"
+
+
+def legacy_segment(text, dictionary):
+    """The pre-trie implementation: slice and probe lengths 4 down to 1 at every position."""
+    tokens = []
+    start = 0
+    n = len(text)
+    while start < n:
+        for length in range(4, 0, -1):
+            if start + length > n:
+                continue
+            sub = text[start : start + length]
+            if sub in dictionary:
+                tokens.append(sub)
+                start += length
+                break
+        else:
+            tokens.append(text[start])
+            start += 1
+    return tokens
+
+
+def load_corpus():
+    words, sentences = {}, []
+    for level in range(1, 10):
+        data = read_level_file(DATA_DIR / f"level_{level}.json")
+        for word in data["vocabulary"]:
+            words.setdefault(word["hanzi"], level)
+            sentences.extend(word.get("sentences", []))
+    return words, sentences
+
+
+def sentences_per_second(segment, sentences, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for sentence in sentences:
+            segment(sentence)
+    return rounds * len(sentences) / (time.perf_counter() - start)
+
+
+def benchmark_segmenter(rounds):
+    """Compares MaxMatch by substring probing with the trie segmenter on the shipped sentences."""
+    words, sentences = load_corpus()
+    start = time.perf_counter()
+    segmenter = Segmenter(words)
+    print(
+        f"{len(sentences)} sentences, {len(segmenter)} words "
+        f"(trie built in {(time.perf_counter() - start) * 1000:.0f} ms)"
+    )
+
+    mismatches = sum(segmenter.segment(s) != legacy_segment(s, words) for s in sentences)
+    print(f"Segmentations differing from the legacy MaxMatch: {mismatches}")
+
+    legacy = sentences_per_second(lambda s: legacy_segment(s, words), sentences, rounds)
+    trie = sentences_per_second(segmenter.segment, sentences, rounds)
+    print(f"Legacy MaxMatch: {legacy:>10,.0f} sentences/s")
+    print(f"Trie:            {trie:>10,.0f} sentences/s ({trie / legacy:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=benchmark_segmenter.__doc__)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    benchmark_segmenter(args.rounds)
@@ -0,0 +1,64 @@
+import random
+import time
+
+from hsk.constants import HSK_EXAM_STRUCTURE
+from hsk.data_engine import DataEngine
+from hsk.selection import ACADEMIC_KEYWORDS, SELECTION_POOL_FACTOR
+from hsk.test_engine import HSKTestEngine
+
+EXAMS = 50
+
+
+def legacy_selection(engine, num_questions):
+    """The pre-cache implementation: filter and sort the whole band on every exam."""
+    target_words = [w for w in engine.words if w.level == engine.target_level]
+    filtered_pool = []
+    for w in target_words:
+        if w.pos and any(p in ["e", "y", "o"] for p in w.pos):
+            continue
+        filtered_pool.append(w)
+    filtered_pool.sort(
+        key=lambda w: (
+            len(w.sentences) > 0,
+            any(k in w.meaning.lower() or k in w.hanzi for k in ACADEMIC_KEYWORDS),
+            len(w.hanzi) >= 2,
+            -w.frequency,
+        ),
+        reverse=True,
+    )
+    selection_pool = filtered_pool[: num_questions * SELECTION_POOL_FACTOR]
+    return random.sample(selection_pool, min(len(selection_pool), num_questions))
+
+
+def time_exams(engine, num_questions, select):
+    start = time.perf_counter()
+    for _ in range(EXAMS):
+        selected = select(num_questions)
+        for word in selected:
+            engine._create_question_for_word(word)
+    return (time.perf_counter() - start) / EXAMS * 1000
+
+
+def benchmark_selection():
+    data_engine = DataEngine()
+    random.seed(0)
+
+    print(f"{'Level':<6}{'Targets':>8}{'Legacy (ms)':>13}{'Cached (ms)':>13}{'Speedup':>9}")
+    for level in (7, 8, 9):
+        num_questions = HSK_EXAM_STRUCTURE[level]
+        # Warms the pool's indexes, distractor rankings and cloze candidates
+        engine = HSKTestEngine(level, data_engine, num_questions=num_questions)
+        pool = engine.pool
+
+        def cached_selection(n, pool=pool, target_level=engine.target_level):
+            selection_pool = pool.advanced_selection(target_level)[: n * SELECTION_POOL_FACTOR]
+            return random.sample(selection_pool, min(len(selection_pool), n))
+
+        legacy = time_exams(engine, num_questions, lambda n, e=engine: legacy_selection(e, n))
+        cached = time_exams(engine, num_questions, cached_selection)
+        targets = len(pool.target_words(engine.target_level))
+        print(f"{level:<6}{targets:>8}{legacy:>13.2f}{cached:>13.2f}{legacy / cached:>8.1f}x")
+
+
+if __name__ == "__main__":
+    benchmark_selection()
@@ -0,0 +1,81 @@
+import argparse
+import multiprocessing
+import time
+
+from hsk import parallel
+from hsk.data_engine import DataEngine
+from hsk.prefork import memory_usage
+from hsk.shared_corpus import SharedCorpus
+from hsk.test_engine import generate_exams
+
+LEVELS = tuple(range(1, 10))
+WORKLOAD_LEVELS = (1, 5, 9)
+
+
+def _spawned_worker(corpus_name, exams, results):
+    """Loads the corpus the way a pool worker does, generates exams and reports."""
+    start = time.perf_counter()
+    parallel._init_worker(None, LEVELS, corpus_name)
+    ready = time.perf_counter() - start
+
+    for level in WORKLOAD_LEVELS:
+        for _ in generate_exams(level, exams, seed=1, data_engine=parallel._worker_engine):
+            pass
+    results.put((ready, time.perf_counter() - start, memory_usage()))
+
+
+def _run_config(workers, exams, corpus_name):
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    processes = [
+        context.Process(target=_spawned_worker, args=(corpus_name, exams, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    reports = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return reports
+
+
+def benchmark_shared_corpus(workers, exams):
+    """Compares spawned workers parsing the corpus with workers attaching to shared memory."""
+    start = time.perf_counter()
+    corpus = SharedCorpus.create(DataEngine())
+    print(f"Export: {corpus.nbytes / 1024 / 1024:.1f} MB in {time.perf_counter() - start:.2f}s\n")
+
+    print(f"{'Config':<10}{'Ready':>10}{'Total':>10}{'RSS':>11}{'PSS':>11}{'Private':>11}")
+    try:
+        for label, name in (("parse", None), ("attach", corpus.name)):
+            reports = _run_config(workers, exams, name)
+
+            def mean(values):
+                values = list(values)
+                return sum(values) / len(values)
+
+            usages = [usage for _, _, usage in reports if usage is not None]
+            line = (
+                f"{label:<10}{mean(r[0] for r in reports) * 1000:>7.0f} ms"
+                f"{mean(r[1] for r in reports) * 1000:>7.0f} ms"
+            )
+            if usages:
+                for key in ("Rss", "Pss", "Private_Dirty"):
+                    line += f"{mean(u[key] for u in usages) / 1024:>8.1f} MB"
+            print(line)
+    finally:
+        corpus.close()
+        corpus.unlink()
+
+    print(
+        f"\nMeans over {workers} spawned workers; 'Total' adds {exams} exams for each of "
+        f"levels {WORKLOAD_LEVELS}."
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=benchmark_shared_corpus.__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--exams", type=int, default=50, help="exams per level per worker")
+    args = parser.parse_args()
+    benchmark_shared_corpus(args.workers, args.exams)
@@ -0,0 +1,56 @@
+import argparse
+import time
+
+from hsk.data_engine import DataEngine
+from hsk.distractor_table import (
+    DEFAULT_TOP_K,
+    DistractorTable,
+    distractor_tier,
+    write_distractor_table,
+)
+from hsk.test_engine import HSKTestEngine
+
+
+def build_distractor_table(top_k: int = DEFAULT_TOP_K) -> None:
+    """Ranks every word's distractors offline so exams only sample stored lists.
+
+    Run after scripts/ingest_data.py: the table is keyed by the level source
+    digests, so it is ignored (and exams fall back to live scoring) once the
+    level files change.
+    """
+    data_engine = DataEngine()
+    table = DistractorTable(top_k=top_k)
+
+    for level in range(1, 10):
+        # num_questions=0 builds the engine (pool, tier, target level) without an exam
+        engine = HSKTestEngine(level, data_engine, num_questions=0)
+        pool = engine.pool
+        tier = distractor_tier(level)
+        if pool.digests is None or table.get(pool.digests, tier, engine.target_level) is not None:
+            continue
+
+        start = time.perf_counter()
+        rankings = []
+        truncated = []
+        for i, word in enumerate(pool.words):
+            ranked = engine._rank_candidates(word, top_k)
+            # T3 samples its whole top tier, which must fit in the stored list
+            if tier == 3 and len(ranked) > top_k and ranked[top_k][1] >= ranked[0][1] - 50:
+                truncated.append(i)
+            rankings.append([value for pair in ranked[:top_k] for value in pair])
+        table.add(pool.digests, tier, engine.target_level, rankings, truncated)
+
+        print(
+            f"Level {level} (T{tier}): ranked {len(pool)} words "
+            f"({len(truncated)} truncated) in {time.perf_counter() - start:.1f}s"
+        )
+
+    path = write_distractor_table(table, data_engine.data_path)
+    print(f"Wrote {len(table)} pools to {path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=build_distractor_table.__doc__)
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K)
+    args = parser.parse_args()
+    build_distractor_table(top_k=args.top_k)
@@ -14,12 +14,12 @@ def generate_hsk9_audit_data():
 
     report = []
     for q in test_engine.questions:
-        target_word = next((w for w in test_engine.words if w.hanzi == q.correct_answer), None)
+        target_word = test_engine.find_word(q.correct_answer)
 
         # Calculate kinship for each option
         options_meta = []
         for opt in q.options:
-            opt_word = next((w for w in test_engine.words if w.hanzi == opt), None)
+            opt_word = test_engine.find_word(opt)
             shared = set(opt).intersection(set(q.correct_answer))
             options_meta.append(
                 {
@@ -1,23 +1,41 @@
+import argparse
 import json
+from typing import Optional
 
 from hsk.data_engine import DataEngine
+from hsk.parallel import generate_exams_parallel
 from hsk.test_engine import HSKTestEngine
 
+LEVELS = range(1, 10)
 
-def generate_dataset():
+
+def generate_dataset(
+    exams: int = 1,
+    num_questions: int = 10,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+):
     data_engine = DataEngine()
     dataset = {}
 
-    for level in range(1, 10):
+    # Questions are generated on a process pool; exams come back in level order
+    print(f"Generating {exams} exam(s) per level for levels 1-9...")
+    generated = {level: [] for level in LEVELS}
+    for level, questions in generate_exams_parallel(
+        LEVELS, exams, num_questions=num_questions, seed=seed, workers=workers
+    ):
+        generated[level].extend(questions)
+
+    for level in LEVELS:
         print(f"Generating Level {level}...")
         try:
-            # Generate 10 questions for the level
-            engine = HSKTestEngine(level=level, data_engine=data_engine, num_questions=10)
+            # Only used to look up target and option words
+            engine = HSKTestEngine(level=level, data_engine=data_engine, num_questions=0)
 
             level_questions = []
-            for q in engine.questions:
+            for q in generated[level]:
                 # Find the target word object to get the level and meaning context
-                target_word = next((w for w in engine.words if w.hanzi == q.correct_answer), None)
+                target_word = engine.find_word(q.correct_answer)
 
                 q_data = {
                     "question_id": q.id,
@@ -34,7 +52,7 @@ def generate_dataset():
                 # Enrich options with meanings for the external LLM to audit discrimination
                 enriched_options = []
                 for opt in q.options:
-                    opt_word = next((w for w in engine.words if w.hanzi == opt), None)
+                    opt_word = engine.find_word(opt)
                     enriched_options.append(
                         {
                             "hanzi": opt,
@@ -59,4 +77,10 @@ def generate_dataset():
 
 
 if __name__ == "__main__":
-    generate_dataset()
+    parser = argparse.ArgumentParser(description="Generate the universal HSK audit dataset.")
+    parser.add_argument("--exams", type=int, default=1, help="exams per level")
+    parser.add_argument("--questions", type=int, default=10, help="questions per exam")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    generate_dataset(args.exams, args.questions, args.seed, args.workers)
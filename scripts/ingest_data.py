@@ -1,17 +1,41 @@
+import argparse
 import csv
+import hashlib
+import io
 import json
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Optional
+
+from hsk.cloze import TopClozeSentences, min_sentence_length
+from hsk.corpus_cache import file_digest
+from hsk.segmenter import Segmenter
+from hsk.sentence_store import SENTENCE_STORE_FILE, build_sentence_store, dumps_level
 
 DATA_DIR = Path("hsk/data")
 RAW_VOCAB = DATA_DIR / "hsk30_raw.csv"
 RAW_GRAMMAR = DATA_DIR / "hsk30_grammar_raw.csv"
 RAW_DICT = DATA_DIR / "dictionary.txt"
+SENTENCES_FILE = DATA_DIR / "sentences.tsv"
+DRK_VOCAB = DATA_DIR / "drkameleon.json"
 
 OUTPUT_DIR = DATA_DIR
 
+# Stage outputs and the manifest of the last build (see BuildManifest)
+INGEST_CACHE_DIR = DATA_DIR / ".cache" / "ingest"
+# Bump when a stage's output format changes
+MANIFEST_VERSION = 1
+# Source the stage outputs depend on; editing it invalidates every stage
+STAGE_CODE = (
+    Path(__file__).resolve(),
+    Path(__file__).resolve().parent.parent / "hsk" / "segmenter.py",
+    Path(__file__).resolve().parent.parent / "hsk" / "cloze.py",
+)
+
 
-def load_radicals() -> Dict[str, str]:
+def load_radicals() -> dict[str, str]:
     """Loads character to radical mapping from dictionary.txt."""
     print("Loading radicals...")
     char_to_radical = {}
@@ -48,69 +72,133 @@ def process_data():
     radicals_map = load_radicals()
 
     # Storage for processed data
-    levels_data: Dict[int, Dict[str, List[Any]]] = {}  # level -> {vocab: [], grammar: []}
-    used_characters: Set[str] = set()
+    levels_data: dict[int, dict[str, list[Any]]] = {}  # level -> {vocab: [], grammar: []}
+    used_characters: set[str] = set()
 
 
-def tokenize_sentence(text: str, word_map: Dict[str, int]) -> List[str]:
+def tokenize_sentence(text: str, segmenter: Segmenter) -> list[str]:
     """
-    Tokenizes text using MaxMatch against the provided word_map.
-    Returns a list of token strings.
+    Tokenizes text by longest dictionary match (see hsk.segmenter).
+    Unknown characters become single-character tokens.
     """
-    tokens = []
-    start = 0
-    n = len(text)
+    return segmenter.segment(text)
 
-    while start < n:
-        matched_word = ""
-        step = 1
 
-        # Try lengths 4 down to 1
-        for length in range(4, 0, -1):
-            if start + length > n:
-                continue
+def get_max_level(tokens: list[str], word_map: dict[str, int]) -> int:
+    """Calculates max HSK level from tokens"""
+    max_lvl = 0
+    for t in tokens:
+        max_lvl = max(max_lvl, word_map.get(t, 0))
+    return max_lvl
+
 
-            sub = text[start : start + length]
-            if sub in word_map:
-                matched_word = sub
-                step = length
+MIN_SENTENCE_LENGTH = 6
+BLACKLIST_SENTENCE_IDS = {"43078", "22981"}  # 22981 is "有罢工。", 43078 is "半夜...挨..."
+# Best sentences kept per word (see hsk.cloze.TopClozeSentences)
+MAX_SENTENCES_PER_WORD = 5
+
+# Chunks per worker, so a slow chunk does not leave the other workers idle
+LINK_CHUNKS_PER_WORKER = 4
+
+# (path, start byte, end byte) of a run of whole TSV lines
+SentenceChunk = tuple[str, int, int]
+# (sentence, max word level, known-word tokens in sentence order)
+SegmentedSentence = tuple[str, int, list[str]]
+
+_link_segmenter: Optional[Segmenter] = None
+_link_word_levels: dict[str, int] = {}
+
+
+def split_byte_ranges(path: Path, chunks: int) -> list[tuple[int, int]]:
+    """Splits a file into at most ``chunks`` byte ranges that each start at a line start."""
+    size = path.stat().st_size
+    bounds = [0]
+    with open(path, "rb") as f:
+        for k in range(1, chunks):
+            target = size * k // chunks
+            if target <= bounds[-1]:
+                continue
+            # Finish the line holding byte target - 1; the next line starts the chunk
+            f.seek(target - 1)
+            f.readline()
+            position = f.tell()
+            if position >= size:
                 break
+            if position > bounds[-1]:
+                bounds.append(position)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def read_sentence_rows(path: str, start: int, end: int) -> Iterator[list[str]]:
+    """TSV rows of ``path[start:end]``, decoded exactly like a full-file ``open()``."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    # Fields never contain newlines, so rows cannot straddle a line-aligned boundary
+    return csv.reader(io.TextIOWrapper(io.BytesIO(data), encoding="utf-8"), delimiter="\t")
+
+
+def _init_link_worker(word_levels: dict[str, int]) -> None:
+    global _link_segmenter, _link_word_levels
+    _link_segmenter = Segmenter(word_levels)
+    _link_word_levels = word_levels
+
+
+def _segment_chunk(chunk: SentenceChunk) -> tuple[int, list[SegmentedSentence]]:
+    """Filters, tokenizes and levels one chunk's sentences; returns (rows read, sentences)."""
+    assert _link_segmenter is not None
+    rows = 0
+    segmented = []
+    for row in read_sentence_rows(*chunk):
+        rows += 1
+        if len(row) < 2:
+            continue
 
-        if matched_word:
-            tokens.append(matched_word)
-        else:
-            # If no match (unknown char), treat as single char token (or ignore?)
-            # For HSK linking, strictly we only care about matched words.
-            # But for "level check", unknown words are risky.
-            # We add single char as token to handle it.
-            tokens.append(text[start])
+        sentence_id = row[0]
+        sentence = row[1].strip()
 
-        start += step
+        if not sentence:
+            continue
 
-    return tokens
+        # Filters
+        if sentence_id in BLACKLIST_SENTENCE_IDS:
+            continue
+        if len(sentence) < MIN_SENTENCE_LENGTH:
+            continue
 
+        # Tokenize & Level Check
+        tokens = tokenize_sentence(sentence, _link_segmenter)
 
-def get_max_level(tokens: List[str], word_map: Dict[str, int]) -> int:
-    """Calculates max HSK level from tokens"""
-    max_lvl = 0
-    for t in tokens:
-        max_lvl = max(max_lvl, word_map.get(t, 0))
-    return max_lvl
+        # Current strict logic: max level of KNOWN words.
+        sent_max_level = get_max_level(tokens, _link_word_levels)
+        known = [token for token in tokens if token in _link_word_levels]
+        segmented.append((sentence, sent_max_level, known))
+    return rows, segmented
 
 
-def link_sentences(levels_data: Dict[int, Dict[str, List[Any]]]):
+def link_sentences(
+    levels_data: dict[int, dict[str, list[Any]]],
+    sentences_file: Path = SENTENCES_FILE,
+    workers: Optional[int] = None,
+):
     """
     Links sentences from sentences.tsv to vocabulary words.
     STRICT MODE: Only links if sentence_level <= word_level.
+
+    Each word keeps its ``MAX_SENTENCES_PER_WORD`` best sentences by the test
+    engine's cloze ranking (``hsk.cloze``), best first, rather than the first
+    ones in file order. The file is split into line-aligned byte ranges that a process pool
+    segments in parallel; sentences are then assigned to words chunk by chunk
+    in file order, so the result is identical to a serial run.
     """
     print("Linking sentences (Strict Mode)...")
-    SENTENCES_FILE = DATA_DIR / "sentences.tsv"
-    if not SENTENCES_FILE.exists():
-        print("Warning: sentences.tsv not found. Skipping.")
+    if not sentences_file.exists():
+        print(f"Warning: {sentences_file.name} not found. Skipping.")
         return
 
     # 1. Build Global Word Map (Hanzi -> Level) for Filtering
-    all_word_levels: Dict[str, int] = {}
+    all_word_levels: dict[str, int] = {}
     for level, data in levels_data.items():
         for w in data["vocabulary"]:
             if w["hanzi"]:
@@ -118,8 +206,9 @@ def link_sentences(levels_data: Dict[int, Dict[str, List[Any]]]):
                 if w["hanzi"] not in all_word_levels:
                     all_word_levels[w["hanzi"]] = level
 
-    # 2. Build Index: Char -> List of dicts
-    word_index: Dict[str, List[Dict[str, Any]]] = {}
+    # 2. Build Index: Hanzi -> sentence selectors (a hanzi may appear in several levels)
+    word_index: dict[str, list[TopClozeSentences]] = {}
+    selections: list[tuple[dict[str, Any], TopClozeSentences]] = []
     total_words = 0
     for level, data in levels_data.items():
         for word in data["vocabulary"]:
@@ -128,97 +217,200 @@ def link_sentences(levels_data: Dict[int, Dict[str, List[Any]]]):
             if not hanzi:
                 continue
 
-            first_char = hanzi[0]
-            if first_char not in word_index:
-                word_index[first_char] = []
-            word_index[first_char].append(word)
+            selector = TopClozeSentences(hanzi, min_sentence_length(level), MAX_SENTENCES_PER_WORD)
+            word_index.setdefault(hanzi, []).append(selector)
+            selections.append((word, selector))
             total_words += 1
 
     print(f"Indexed {total_words} words for matching.")
 
-    # 3. Stream Sentences
-    matched_count = 0
-    skipped_count = 0
-
-    MIN_SENTENCE_LENGTH = 6
-    BLACKLIST_SENTENCE_IDS = {"43078", "22981"}  # 22981 is "有罢工。", 43078 is "半夜...挨..."
-
-    with open(SENTENCES_FILE, encoding="utf-8") as f:
-        reader = csv.reader(f, delimiter="\t")
-        for i, row in enumerate(reader):
-            if len(row) < 2:
-                continue
-
-            sentence_id = row[0]
-            sentence = row[1].strip()
+    # 3. Segment chunks in parallel, merge in file order
+    if workers is None:
+        workers = os.cpu_count() or 1
+    path = str(sentences_file)
+    chunks = [
+        (path, start, end)
+        for start, end in split_byte_ranges(sentences_file, workers * LINK_CHUNKS_PER_WORKER)
+    ]
+
+    if workers == 1:
+        _init_link_worker(all_word_levels)
+        matched_count, skipped_count = _assign_sentences(
+            map(_segment_chunk, chunks), word_index, all_word_levels
+        )
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_link_worker, initargs=(all_word_levels,)
+        ) as executor:
+            # map() returns chunks in file order, whichever worker finishes first
+            matched_count, skipped_count = _assign_sentences(
+                executor.map(_segment_chunk, chunks), word_index, all_word_levels
+            )
 
-            if not sentence:
-                continue
+    for word, selector in selections:
+        word["sentences"] = selector.ranked()
 
-            # Filters
-            if sentence_id in BLACKLIST_SENTENCE_IDS:
-                continue
-            if len(sentence) < MIN_SENTENCE_LENGTH:
-                continue
+    print(f"Linked (Strict). Matches: {matched_count}. Skipped Links (Too Hard): {skipped_count}")
 
-            # 3a. Tokenize & Level Check
-            tokens = tokenize_sentence(sentence, all_word_levels)
 
-            # Filter: Check if sentence contains ANY unknown words?
-            # Current strict logic: max level of KNOWN words.
-            sent_max_level = get_max_level(tokens, all_word_levels)
+def _assign_sentences(
+    results: Iterable[tuple[int, list[SegmentedSentence]]],
+    word_index: dict[str, list[TopClozeSentences]],
+    all_word_levels: dict[str, int],
+) -> tuple[int, int]:
+    """Offers segmented sentences to words in file order; returns (matched, skipped) counts."""
+    matched_count = 0
+    skipped_count = 0
+    rows = 0
 
-            # 3b. Link to eligible words
+    for chunk_rows, segmented in results:
+        for sentence, sent_max_level, tokens in segmented:
             matched_words_in_sentence = set()
 
-            # Check distinct tokens
             for token in tokens:
-                if not token:
-                    continue
-
-                # word_index keys are the FIRST CHAR of the word.
-                # So we look up lists by token[0], then find exact match.
-                first_char = token[0]
+                for selector in word_index.get(token, ()):
+                    target_level = all_word_levels.get(token, 99)
+
+                    # STRICT LEVEL CHECK: Sentence Diff <= Word Level
+                    if sent_max_level <= target_level:
+                        if id(selector) not in matched_words_in_sentence:
+                            selector.add(sentence)
+                            matched_count += 1
+                            matched_words_in_sentence.add(id(selector))
+                    else:
+                        skipped_count += 1
 
-                if first_char in word_index:
-                    potential_words = word_index[first_char]
+        rows += chunk_rows
+        print(f"Processed {rows} sentences...")
 
-                    found_word_objs = [w for w in potential_words if w["hanzi"] == token]
+    return matched_count, skipped_count
 
-                    for word_obj in found_word_objs:
-                        target = word_obj["hanzi"]
-                        target_level = all_word_levels.get(target, 99)
 
-                        # STRICT LEVEL CHECK: Sentence Diff <= Word Level
-                        if sent_max_level <= target_level:
-                            if id(word_obj) not in matched_words_in_sentence:
-                                if len(word_obj["sentences"]) < 5:
-                                    word_obj["sentences"].append(sentence)
-                                    matched_count += 1
-                                matched_words_in_sentence.add(id(word_obj))
-                        else:
-                            skipped_count += 1
+class BuildManifest:
+    """Input digests and stage keys of the last build, kept in ``cache_dir``.
 
-            if i % 10000 == 0:
-                print(f"Processed {i} sentences...")
+    A stage's key hashes its input files, the keys of the stages it consumes
+    and the ingest code. When the key matches the one stored with the stage's
+    cached output, the output is reused instead of being rebuilt. Input files
+    whose size and mtime are unchanged reuse their recorded digest.
+    """
 
-    print(f"Linked (Strict). Matches: {matched_count}. Skipped Links (Too Hard): {skipped_count}")
+    def __init__(self, cache_dir: Path = INGEST_CACHE_DIR, force: bool = False):
+        self.cache_dir = cache_dir
+        self.path = cache_dir / "manifest.json"
+        self.previous: dict[str, Any] = {}
+        if not force:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self.previous = json.load(f)
+            except (OSError, ValueError):
+                pass
+            if self.previous.get("version") != MANIFEST_VERSION:
+                self.previous = {}
+        self.force = force
+        self.inputs: dict[str, dict[str, Any]] = {}
+        self.stages: dict[str, dict[str, Any]] = {}
+        self.outputs: dict[str, str] = {}
+        self.code = [self.input_digest(path) for path in STAGE_CODE]
+
+    def input_digest(self, path: Path) -> Optional[str]:
+        """Returns the SHA-256 of an input file (None if it does not exist)."""
+        if not path.exists():
+            return None
+        stat = path.stat()
+        previous = self.previous.get("inputs", {}).get(str(path))
+        if previous and (previous["size"], previous["mtime_ns"]) == (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            digest = str(previous["digest"])
+        else:
+            digest = file_digest(path)
+        self.inputs[str(path)] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "digest": digest,
+        }
+        return digest
+
+    def run_stage(
+        self, name: str, inputs: list[Path], upstream: list[str], build: Callable[[], Any]
+    ) -> Any:
+        """Returns the stage's cached output if its key is unchanged, else ``build()``."""
+        key = hashlib.sha256(
+            json.dumps(
+                [
+                    MANIFEST_VERSION,
+                    name,
+                    self.code,
+                    [self.input_digest(path) for path in inputs],
+                    [self.stages[stage]["key"] for stage in upstream],
+                ]
+            ).encode("utf-8")
+        ).hexdigest()
+        cache_file = self.cache_dir / f"{name}.json"
+        self.stages[name] = {"key": key, "output": cache_file.name}
+
+        if not self.force:
+            try:
+                with open(cache_file, encoding="utf-8") as f:
+                    cached = json.load(f)
+                # The key is stored with the output, so an interrupted build cannot mismatch them
+                if cached.get("key") == key:
+                    print(f"Stage '{name}' unchanged, reusing cached output.")
+                    return cached["output"]
+            except (OSError, ValueError):
+                pass
+
+        output = build()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".json.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "output": output}, f, ensure_ascii=False)
+        os.replace(tmp_file, cache_file)
+        return output
+
+    def write_output(self, path: Path, content: str) -> bool:
+        """Writes ``content`` to ``path`` unless the file already holds it.
+
+        Returns True if the file was written.
+        """
+        data = content.encode("utf-8")
+        self.outputs[path.name] = hashlib.sha256(data).hexdigest()
+        try:
+            if path.read_bytes() == data:
+                return False
+        except OSError:
+            pass
+        path.write_bytes(data)
+        return True
+
+    def save(self) -> None:
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": MANIFEST_VERSION,
+                    "inputs": self.inputs,
+                    "stages": self.stages,
+                    "outputs": self.outputs,
+                },
+                f,
+                indent=2,
+            )
 
 
-def process_data():
-    radicals_map = load_radicals()
+def _by_level(data: dict[str, Any]) -> dict[int, Any]:
+    """Restores the integer level keys of a stage output read back from JSON."""
+    return {int(level): value for level, value in data.items()}
 
-    # Storage for processed data
-    levels_data: Dict[int, Dict[str, List[Any]]] = {}  # level -> {vocab: [], grammar: []}
-    used_characters: Set[str] = set()
 
-    # Initialize levels 1-9
-    for i in range(1, 10):
-        levels_data[i] = {"vocabulary": [], "grammar": []}
+def build_vocabulary(radicals_map: dict[str, str]) -> dict[str, Any]:
+    """Reads drkameleon.json into per-level word entries and the characters they use."""
+    vocabulary: dict[int, list[dict[str, Any]]] = {level: [] for level in range(1, 10)}
+    used_characters: dict[str, None] = {}  # Ordered, so radicals.json is reproducible
 
     # 1. Process Vocabulary (from drkameleon.json)
     print("Processing Vocabulary from drkameleon.json...")
-    DRK_VOCAB = DATA_DIR / "drkameleon.json"
 
     with open(DRK_VOCAB, encoding="utf-8") as f:
         vocab_list = json.load(f)
@@ -271,13 +463,13 @@ def process_data():
         # Radicals
         word_radicals = []
         for char in hanzi:
-            used_characters.add(char)
+            used_characters[char] = None
             r = radicals_map.get(char)
             if r and r not in word_radicals:
                 word_radicals.append(r)
 
-        if hsk_new_level in levels_data:
-            levels_data[hsk_new_level]["vocabulary"].append(
+        if hsk_new_level in vocabulary:
+            vocabulary[hsk_new_level].append(
                 {
                     "hanzi": hanzi,
                     "pinyin": pinyin,
@@ -289,8 +481,27 @@ def process_data():
                 }
             )
 
-    # Link Sentences
-    link_sentences(levels_data)
+    return {"levels": vocabulary, "characters": list(used_characters)}
+
+
+def build_links(
+    vocabulary: dict[int, list[dict[str, Any]]], workers: Optional[int] = None
+) -> dict[int, list[list[str]]]:
+    """Links sentences to the vocabulary; returns each word's sentences, in vocabulary order."""
+    levels_data = {
+        level: {"vocabulary": [dict(word) for word in words], "grammar": []}
+        for level, words in vocabulary.items()
+    }
+    link_sentences(levels_data, workers=workers)
+    return {
+        level: [word["sentences"] for word in data["vocabulary"]]
+        for level, data in levels_data.items()
+    }
+
+
+def build_grammar() -> dict[int, list[dict[str, str]]]:
+    """Reads the grammar CSV into per-level grammar points."""
+    grammar: dict[int, list[dict[str, str]]] = {level: [] for level in range(1, 10)}
 
     # 2. Process Grammar (from CSV)
     print("Processing Grammar from CSV...")
@@ -308,8 +519,8 @@ def process_data():
                 except ValueError:
                     continue
 
-                if level in levels_data:
-                    levels_data[level]["grammar"].append(
+                if level in grammar:
+                    grammar[level].append(
                         {
                             "name": f"{row['Category']} - {row['Details']}",
                             "description": row["Group"],
@@ -319,37 +530,77 @@ def process_data():
                     )
     else:
         print("Warning: Grammar CSV not found.")
+    return grammar
+
+
+def process_data(workers: Optional[int] = None, force: bool = False):
+    """Builds the level files and radicals.json, reusing every stage whose inputs are unchanged."""
+    manifest = BuildManifest(force=force)
+
+    radicals_map = manifest.run_stage("radicals", [RAW_DICT], [], load_radicals)
+    vocabulary_output = manifest.run_stage(
+        "vocabulary", [DRK_VOCAB], ["radicals"], lambda: build_vocabulary(radicals_map)
+    )
+    vocabulary = _by_level(vocabulary_output["levels"])
+
+    # Link Sentences
+    links = _by_level(
+        manifest.run_stage(
+            "links", [SENTENCES_FILE], ["vocabulary"], lambda: build_links(vocabulary, workers)
+        )
+    )
+    grammar = _by_level(manifest.run_stage("grammar", [RAW_GRAMMAR], [], build_grammar))
+
+    # Storage for processed data
+    levels_data: dict[int, dict[str, list[Any]]] = {}  # level -> {vocab: [], grammar: []}
+    for level in range(1, 10):
+        words = [
+            dict(word, sentences=sentences)
+            for word, sentences in zip(vocabulary[level], links[level])
+        ]
+        levels_data[level] = {"vocabulary": words, "grammar": grammar[level]}
 
     # Duplicate Level 7 data to 8 and 9 (HSK 7-9 Advanced Band)
+    # The files stay byte-identical so DataEngine can detect the shared band by hash.
     if levels_data[7]["vocabulary"]:
         print("Distributing Advanced Band (Level 7) to Levels 8 and 9...")
         levels_data[8] = levels_data[7].copy()
         levels_data[9] = levels_data[7].copy()
 
-    # 3. Write Levels
+    # 3. Write the sentence store and the levels referencing it (only files whose content changed)
+    store, levels_data = build_sentence_store(levels_data)
+    manifest.write_output(OUTPUT_DIR / SENTENCE_STORE_FILE, store.dumps())
+    print(f"Sentence store: {len(store)} unique sentences.")
+
     print("Writing level files...")
     for level, data in levels_data.items():
         out_file = OUTPUT_DIR / f"level_{level}.json"
-        # Only write if we have data to avoid empty files overwriting logic if any
-        # But we want to generate all.
+        written = manifest.write_output(out_file, dumps_level(data))
         print(
-            f"Level {level}: {len(data['vocabulary'])} words, {len(data['grammar'])} grammar points."
+            f"Level {level}: {len(data['vocabulary'])} words, {len(data['grammar'])} grammar points"
+            f"{'' if written else ' (unchanged)'}."
         )
-        with open(out_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
 
     # 4. Write Radicals (Subset)
     print("Writing radicals.json...")
     final_radicals = {}
-    for char in used_characters:
+    for char in vocabulary_output["characters"]:
         if char in radicals_map:
             final_radicals[char] = radicals_map[char]
 
-    with open(OUTPUT_DIR / "radicals.json", "w", encoding="utf-8") as f:
-        json.dump(final_radicals, f, indent=2, ensure_ascii=False)
+    manifest.write_output(
+        OUTPUT_DIR / "radicals.json", json.dumps(final_radicals, indent=2, ensure_ascii=False)
+    )
+    manifest.save()
 
     print("Done.")
 
 
 if __name__ == "__main__":
-    process_data()
+    parser = argparse.ArgumentParser(description="Build hsk/data level files from raw sources")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="sentence linking processes (CPU count)"
+    )
+    parser.add_argument("--force", action="store_true", help="rebuild every stage")
+    args = parser.parse_args()
+    process_data(args.workers, args.force)
@@ -0,0 +1,42 @@
+import argparse
+from pathlib import Path
+
+from hsk.sentence_store import (
+    build_sentence_store,
+    dumps_level,
+    read_level_file,
+    write_sentence_store,
+)
+
+DATA_DIR = Path(__file__).parent.parent / "hsk" / "data"
+
+
+def migrate_sentence_store(data_dir: Path = DATA_DIR) -> None:
+    """Moves inline example sentences of the level files into sentence_store.json.
+
+    Safe to re-run: files already referencing the store are resolved first.
+    Rebuild the distractor table afterwards, since the level digests change.
+    """
+    paths = {level: data_dir / f"level_{level}.json" for level in range(1, 10)}
+    levels_data = {level: read_level_file(path) for level, path in paths.items() if path.exists()}
+    before = sum(path.stat().st_size for path in paths.values() if path.exists())
+
+    store, referencing = build_sentence_store(levels_data)
+    store_path = write_sentence_store(store, data_dir)
+    for level, data in referencing.items():
+        paths[level].write_text(dumps_level(data), encoding="utf-8")
+
+    after = sum(paths[level].stat().st_size for level in referencing)
+    linked = sum(len(w["sentences"]) for d in referencing.values() for w in d["vocabulary"])
+    print(f"{linked} sentence links, {len(store)} unique sentences")
+    print(
+        f"Level files: {before / 1024 / 1024:.1f} MB -> {after / 1024 / 1024:.1f} MB "
+        f"(+ {store_path.stat().st_size / 1024 / 1024:.1f} MB {store_path.name})"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=migrate_sentence_store.__doc__)
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR)
+    args = parser.parse_args()
+    migrate_sentence_store(args.data_dir)
@@ -25,7 +25,7 @@ def verify_v10_near_native():
         print(f"  Target:     {q.correct_answer}")
 
         # Check meaning keywords for academic weight
-        target_word = next((w for w in test_engine.words if w.hanzi == q.correct_answer), None)
+        target_word = test_engine.find_word(q.correct_answer)
         is_academic = (
             any(
                 k in target_word.meaning.lower() or k in target_word.hanzi for k in academic_markers
@@ -47,7 +47,7 @@ def verify_v10_near_native():
             for opt in q.options:
                 if opt == q.correct_answer:
                     continue
-                opt_word = next((w for w in test_engine.words if w.hanzi == opt), None)
+                opt_word = test_engine.find_word(opt)
                 if opt_word:
                     opt_keywords = set(
                         opt_word.meaning.lower().replace(";", "").replace(",", "").split()
@@ -35,7 +35,7 @@ def verify_v11_c2_standard():
             print("  [ALERT] Information Leak Detected!")
 
         # Check distractor semantic similarity
-        target_word = next((w for w in test_engine.words if w.hanzi == q.correct_answer), None)
+        target_word = test_engine.find_word(q.correct_answer)
         if target_word:
             target_keywords = set(
                 target_word.meaning.lower()
@@ -48,7 +48,7 @@ def verify_v11_c2_standard():
             for opt in q.options:
                 if opt == q.correct_answer:
                     continue
-                opt_word = next((w for w in test_engine.words if w.hanzi == opt), None)
+                opt_word = test_engine.find_word(opt)
                 if opt_word:
                     opt_keywords = set(
                         opt_word.meaning.lower()
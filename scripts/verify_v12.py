@@ -13,7 +13,7 @@ def verify_v12_precision_engine():
         print(f"Question {i + 1}:")
         print(f"  Target:       {q.correct_answer}")
 
-        target_word = next((w for w in test_engine.words if w.hanzi == q.correct_answer), None)
+        target_word = test_engine.find_word(q.correct_answer)
         if target_word:
             print(
                 f"  Target Level: {target_word.level} {'[PASS]' if target_word.level >= 7 else '[FAIL]'}"
@@ -38,7 +38,7 @@ def verify_v12_precision_engine():
             for opt in q.options:
                 if opt == q.correct_answer:
                     continue
-                opt_word = next((w for w in test_engine.words if w.hanzi == opt), None)
+                opt_word = test_engine.find_word(opt)
                 if opt_word:
                     opt_keywords = set(
                         opt_word.meaning.lower()
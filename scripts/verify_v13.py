@@ -11,7 +11,7 @@ def verify_v13_doctorate_standard():
         print(f"Question {i + 1}:")
         print(f"  Target:       {q.correct_answer}")
 
-        target_word = next((w for w in test_engine.words if w.hanzi == q.correct_answer), None)
+        target_word = test_engine.find_word(q.correct_answer)
         if target_word:
             print(
                 f"  Target Level: {target_word.level} {'[PASS]' if target_word.level == 9 else '[FAIL]'}"
@@ -36,7 +36,7 @@ def verify_v13_doctorate_standard():
             target_pos = set(target_word.pos) if target_word.pos else set()
             pos_matches = 0
             for opt in q.options:
-                opt_word = next((w for w in test_engine.words if w.hanzi == opt), None)
+                opt_word = test_engine.find_word(opt)
                 if opt_word and opt_word.pos:
                     if set(opt_word.pos).intersection(target_pos):
                         pos_matches += 1
@@ -20,7 +20,7 @@ def audit_level(level: int):
         # Get target POS and length
         target_hanzi = q.correct_answer
         # Finding the target word object
-        target_word = next((w for w in engine.words if w.hanzi == target_hanzi), None)
+        target_word = engine.find_word(target_hanzi)
 
         print(f"Q: {q.prompt[:50]}...")
         print(
@@ -35,7 +35,7 @@ def audit_level(level: int):
         target_pos_set = set(target_word.pos) if target_word and target_word.pos else set()
 
         for opt in q.options:
-            opt_word = next((w for w in engine.words if w.hanzi == opt), None)
+            opt_word = engine.find_word(opt)
             if not opt_word:
                 continue
 
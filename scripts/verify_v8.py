@@ -15,14 +15,14 @@ def verify_v8_logic():
         print(f"  Options:  {q.options}")
 
         # Check if any distractor shares a radical with target (Visual Trap)
-        target_word = next((w for w in test_engine.words if w.hanzi == q.correct_answer), None)
+        target_word = test_engine.find_word(q.correct_answer)
         if target_word:
             target_rads = set(target_word.radicals)
             traps = []
             for opt in q.options:
                 if opt == q.correct_answer:
                     continue
-                opt_word = next((w for w in test_engine.words if w.hanzi == opt), None)
+                opt_word = test_engine.find_word(opt)
                 if opt_word and set(opt_word.radicals).intersection(target_rads):
                     traps.append(opt)
             print(f"  Visual Traps Found: {traps}")
@@ -0,0 +1,19 @@
+import json
+
+import pytest
+
+
+@pytest.fixture
+def write_level(tmp_path):
+    """Writes a minimal ``level_N.json`` into ``tmp_path``: one noun per given hanzi."""
+
+    def write(level, *hanzi):
+        payload = {
+            "vocabulary": [
+                {"hanzi": h, "pinyin": "p", "meaning": "m", "pos": ["n"]} for h in hanzi
+            ],
+            "grammar": [],
+        }
+        (tmp_path / f"level_{level}.json").write_text(json.dumps(payload), encoding="utf-8")
+
+    return write
@@ -0,0 +1,66 @@
+import random
+
+from hsk.cloze import (
+    CLOZE_CANDIDATES,
+    TopClozeSentences,
+    c2_score,
+    min_sentence_length,
+    rank_cloze_sentences,
+)
+from hsk.data_engine import DataEngine
+from hsk.models import Word
+from hsk.word_pool import WordPool
+
+
+def test_rank_cloze_sentences_filters_and_orders():
+    long_plain = "我们今天去学校学习中文和数学课程吧"
+    long_rich = "甚至在学校里，我们也讨论理论问题吧"
+    leaked = "学校学校学校学校学校学校学校学校"
+    factoid = "学校里老师讲了光合作用的科学原理"
+
+    ranked = rank_cloze_sentences("学校", [long_plain, leaked, factoid, long_rich], 8)
+
+    assert ranked == [long_rich, long_plain]
+    assert c2_score(long_rich) > c2_score(long_plain)
+
+
+def test_rank_cloze_sentences_falls_back_to_short_sentences():
+    assert rank_cloze_sentences("学校", ("去学校", "学校学校"), 45) == ["去学校"]
+    assert rank_cloze_sentences("学校", ("学校学校",), 45) == ["学校学校"]
+
+
+def test_pool_caches_cloze_candidates_per_tier():
+    data_engine = DataEngine()
+    data_engine.load_level_data(9)
+    pool = data_engine.get_word_pool(9)
+    word = next(w for w in pool.words if len(w.sentences) > CLOZE_CANDIDATES)
+
+    for level in (1, 9):
+        min_len = min_sentence_length(level)
+        candidates = pool.cloze_candidates(word, min_len)
+        expected = rank_cloze_sentences(word.hanzi, word.sentences, min_len)[:CLOZE_CANDIDATES]
+        assert list(candidates) == expected
+        assert pool.cloze_candidates(word, min_len) is candidates
+
+    # Words outside the pool are ranked without polluting the cache
+    stranger = Word("外人", "wairen", "outsider", 9, sentences=["外人来了，外人走了"])
+    assert WordPool([]).cloze_candidates(stranger, 8) == ("外人来了，外人走了",)
+
+
+def test_top_cloze_sentences_streams_the_full_ranking():
+    data_engine = DataEngine()
+    data_engine.load_level_data(7)
+    corpus = [s for w in data_engine.words[7][:300] for s in w.sentences]
+    rng = random.Random(0)
+
+    for hanzi in ("我们", "的", "学校"):
+        for _ in range(20):
+            offered = rng.sample(corpus, rng.randint(0, 40))
+            offered += [hanzi * 2 + "。" * rng.randint(0, 50)]  # Leaks the answer
+            rng.shuffle(offered)
+            for min_len in (8, 45):
+                top = TopClozeSentences(hanzi, min_len, k=4)
+                for sentence in offered:
+                    top.add(sentence)
+                assert len(top) <= 5
+                assert top.ranked() == rank_cloze_sentences(hanzi, offered, min_len)[:4]
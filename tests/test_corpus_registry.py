@@ -0,0 +1,74 @@
+from hsk.corpus_registry import CorpusRegistry, deep_sizeof, get_registry
+from hsk.data_engine import DataEngine
+
+
+def test_engines_share_snapshots(tmp_path, write_level):
+    """Engines on the same data directory hold the same parsed level."""
+    write_level(1, "爱", "八")
+
+    first = DataEngine(data_dir=str(tmp_path), use_cache=False)
+    second = DataEngine(data_dir=str(tmp_path), use_cache=False)
+    first.load_level_data(1)
+    second.load_level_data(1)
+
+    assert first.registry is second.registry is get_registry(tmp_path)
+    assert first.get_words_for_level(1) is second.get_words_for_level(1)
+    assert isinstance(first.get_words_for_level(1), tuple)
+
+
+def test_memory_budget_evicts_least_recently_used(tmp_path, write_level):
+    for level, hanzi in [(1, "爱"), (2, "吧"), (3, "把")]:
+        write_level(level, hanzi)
+
+    registry = CorpusRegistry(tmp_path)
+    level_size = deep_sizeof(registry.get_level(1))
+    registry.memory_budget = int(level_size * 2.5)
+    registry.get_level(2)
+
+    registry.get_level(1)  # Touch level 1 so level 2 is least recently used
+    registry.get_level(3)
+
+    assert registry.loaded_levels() == [1, 3]
+    assert registry.nbytes <= registry.memory_budget
+
+
+def test_engines_with_different_cache_settings_get_separate_registries(tmp_path, write_level):
+    write_level(1, "爱")
+
+    cached = DataEngine(data_dir=str(tmp_path))
+    uncached = DataEngine(data_dir=str(tmp_path), use_cache=False)
+    elsewhere = DataEngine(data_dir=str(tmp_path), cache_dir=str(tmp_path / "other"))
+
+    assert uncached.registry.cache_path is None
+    assert elsewhere.registry.cache_path == tmp_path / "other"
+    assert len({id(cached.registry), id(uncached.registry), id(elsewhere.registry)}) == 3
+    assert DataEngine(data_dir=str(tmp_path), use_cache=False).registry is uncached.registry
+
+
+def test_memory_budget_counts_word_pools(tmp_path, write_level):
+    write_level(1, "爱", "八", "爸爸")
+
+    registry = CorpusRegistry(tmp_path)
+    snapshot = registry.get_level(1)
+    before = registry.nbytes
+
+    pool = registry.get_word_pool((snapshot.digest,), snapshot.words)
+    assert len(pool.features) == 3  # Builds an index, so the pool holds more than its words
+    assert registry.nbytes > before
+
+    registry.invalidate(1)
+    assert registry.nbytes == 0
+
+
+def test_memory_budget_applies_when_a_pool_is_built(tmp_path, write_level):
+    write_level(1, "爱", "八")
+    write_level(2, "吧", "把")
+
+    registry = CorpusRegistry(tmp_path)
+    registry.get_level(1)
+    snapshot = registry.get_level(2)
+    registry.memory_budget = registry.nbytes  # Room for the two levels, but no pools
+
+    registry.get_word_pool((snapshot.digest,), snapshot.words)
+
+    assert registry.loaded_levels() == [2]
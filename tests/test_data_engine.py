@@ -1,5 +1,10 @@
+import json
+import threading
+import time
+
 import pytest
 
+from hsk.corpus_registry import CorpusRegistry
 from hsk.data_engine import DataEngine
 
 
@@ -23,6 +28,34 @@ def test_load_level_1(data_engine):
     assert grammar[1].name == "动词 - 能愿动词"
 
 
+def test_loaded_words_are_compact(data_engine):
+    """Words are immutable, with tuple fields and shared POS/radical strings."""
+    data_engine.load_level_data(1)
+    first, second = data_engine.get_words_for_level(1)[:2]
+
+    assert isinstance(first.sentences, tuple)
+    assert not hasattr(first, "__dict__")
+    with pytest.raises(AttributeError):
+        first.hanzi = "X"
+
+    shared = set(first.pos) & set(second.pos)
+    for tag in shared:
+        assert first.pos[first.pos.index(tag)] is second.pos[second.pos.index(tag)]
+
+
+def test_lookup_word(data_engine):
+    """Loaded words are indexed by hanzi across levels."""
+    data_engine.load_level_data(1)
+    data_engine.load_level_data(2)
+
+    word = data_engine.lookup_word("爱")
+    assert word is not None
+    assert word.level == 1
+    assert data_engine.get_levels_for_hanzi("爱") == [1]
+    assert data_engine.lookup_word("爱", level=2) is None
+    assert data_engine.lookup_word("XYZ") is None
+
+
 def test_load_radicals(data_engine):
     """Test loading radical hints."""
     data_engine.load_radicals()
@@ -39,3 +72,94 @@ def test_missing_file():
     engine = DataEngine()
     with pytest.raises(FileNotFoundError):
         engine.load_level_data(999)
+
+
+def _fresh_engine(data_dir):
+    """An engine with its own registry, so loads go to disk rather than memory."""
+    registry = CorpusRegistry(data_dir, cache_path=data_dir / ".cache")
+    return DataEngine(data_dir=str(data_dir), registry=registry)
+
+
+def test_compiled_cache_reused(tmp_path, monkeypatch, write_level):
+    """A second process loads the level from the compiled cache, not the JSON."""
+    write_level(1, "爱")
+    _fresh_engine(tmp_path).load_level_data(1)
+    assert (tmp_path / ".cache" / "level_1.corpus").exists()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("JSON should not be parsed when the cache is current")
+
+    monkeypatch.setattr(json, "load", fail)
+    engine = _fresh_engine(tmp_path)
+    engine.load_level_data(1)
+    assert [w.hanzi for w in engine.get_words_for_level(1)] == ["爱"]
+
+
+def test_compiled_cache_invalidated_by_source_change(tmp_path, write_level):
+    write_level(1, "爱")
+    _fresh_engine(tmp_path).load_level_data(1)
+
+    write_level(1, "你好")
+    engine = _fresh_engine(tmp_path)
+    engine.load_level_data(1)
+    assert [w.hanzi for w in engine.get_words_for_level(1)] == ["你好"]
+
+
+def test_identical_band_levels_share_parsed_data(tmp_path, write_level):
+    """Byte-identical advanced band files are parsed once and shared."""
+    for level in (7, 8):
+        write_level(level, "哲学")
+    write_level(9, "逻辑")
+
+    engine = DataEngine(data_dir=str(tmp_path))
+    for level in (7, 8, 9):
+        engine.load_level_data(level)
+
+    assert engine.get_words_for_level(8) is engine.get_words_for_level(7)
+    assert engine.canonical_level(8) == 7
+    assert engine.canonical_level(9) == 9
+    assert [w.level for w in engine.get_words_for_level(8)] == [7]
+
+    band = engine.get_words_for_band(9)
+    assert sorted(w.hanzi for w in band) == ["哲学", "逻辑"]
+
+
+def test_concurrent_loads_parse_once(tmp_path, monkeypatch, write_level):
+    """Threads loading the same level share a single parse."""
+    write_level(1, "爱")
+    engine = DataEngine(data_dir=str(tmp_path), use_cache=False)
+
+    calls = []
+    original_parse = engine.registry._parse_level
+
+    def counting_parse(data, level):
+        calls.append(level)
+        time.sleep(0.05)  # Keep the load in flight while the other threads arrive
+        return original_parse(data, level)
+
+    monkeypatch.setattr(engine.registry, "_parse_level", counting_parse)
+
+    threads = [threading.Thread(target=engine.load_level_data, args=(1,)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    engine.load_level_data(1)
+
+    assert calls == [1]
+
+
+def test_reload_picks_up_changed_data(tmp_path, write_level):
+    write_level(1, "爱")
+    engine = DataEngine(data_dir=str(tmp_path), use_cache=False)
+    engine.load_level_data(1)
+
+    write_level(1, "你好")
+    engine.load_level_data(1)
+    assert [w.hanzi for w in engine.get_words_for_level(1)] == ["爱"]
+
+    engine.reload(1)
+    assert [w.hanzi for w in engine.get_words_for_level(1)] == ["你好"]
+
+    engine.invalidate(1)
+    assert engine.get_words_for_level(1) == []
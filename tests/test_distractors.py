@@ -0,0 +1,117 @@
+import random
+
+import pytest
+
+from hsk.data_engine import DataEngine
+from hsk.distractor_table import DistractorTable, write_distractor_table
+from hsk.test_engine import HSKTestEngine
+
+
+def _keywords(word):
+    return set(word.meaning.lower().replace(";", " ").split())
+
+
+def _legacy_t1(engine, target, candidates, count):
+    scored = []
+    for w in candidates:
+        category_score = len(_keywords(target) & _keywords(w)) * 100
+        visual_score = 50 if set(w.radicals) & set(target.radicals) else 0
+        scored.append((w, category_score + visual_score))
+    scored.sort(key=lambda x: x[1], reverse=True)
+    return [w[0].hanzi for w in scored[:count]]
+
+
+def _legacy_t2(engine, target, candidates, count):
+    scored = []
+    for w in candidates:
+        synonym_score = len(_keywords(target) & _keywords(w)) * 150
+        kinship_bonus = 80 if set(w.hanzi) & set(target.hanzi) else 0
+        scored.append((w, synonym_score + kinship_bonus))
+    scored.sort(key=lambda x: x[1], reverse=True)
+    return [w[0].hanzi for w in scored[:count]]
+
+
+def _legacy_t3(engine, target, candidates, count):
+    scored = []
+    for w in candidates:
+        kinship_score = len(set(w.hanzi) & set(target.hanzi)) * 250
+        domain_score = len(_keywords(target) & _keywords(w)) * 100
+        level_bonus = 50 if w.level == engine.target_level else 0
+        scored.append((w, kinship_score + domain_score + level_bonus))
+    scored.sort(key=lambda x: x[1], reverse=True)
+    top_candidates = [x[0] for x in scored if x[1] >= scored[0][1] - 50]
+    if len(top_candidates) >= count:
+        return [w.hanzi for w in random.sample(top_candidates, count)]
+    return [w[0].hanzi for w in scored[:count]]
+
+
+def _legacy_distractors(engine, target, count):
+    candidates = [w for w in engine.words if w.hanzi != target.hanzi]
+    target_pos = set(target.pos)
+    if target_pos:
+        candidates = [w for w in candidates if w.pos and set(w.pos).intersection(target_pos)]
+    candidates = [w for w in candidates if len(w.hanzi) == len(target.hanzi)]
+
+    if engine.level >= 7:
+        return _legacy_t3(engine, target, candidates, count)
+    elif engine.level >= 4:
+        return _legacy_t2(engine, target, candidates, count)
+    return _legacy_t1(engine, target, candidates, count)
+
+
+@pytest.mark.parametrize("level", [2, 5, 9])
+def test_tier_scorers_match_reference(level):
+    """Indexed tier scorers rank exactly like the original per-candidate scoring."""
+    engine = HSKTestEngine(level, DataEngine(), num_questions=1)
+    engine.distractor_rankings = None  # Score live rather than from the offline table
+
+    for target in engine.words[::20]:
+        random.seed(target.hanzi)
+        expected = _legacy_distractors(engine, target, 3)
+        random.seed(target.hanzi)
+        actual = engine._get_distractors(target, 3)
+
+        assert actual == expected
+
+
+@pytest.mark.parametrize("level", [2, 5, 9])
+def test_stored_rankings_match_live_scoring(level):
+    """The offline table reproduces live picks, including T3 sampling over the top tier."""
+    engine = HSKTestEngine(level, DataEngine(), num_questions=1)
+    rankings = engine.distractor_rankings
+    if rankings is None:
+        pytest.skip("distractor table not built for the current level data")
+
+    for target in engine.words[::20]:
+        engine.distractor_rankings = rankings
+        engine.rng = random.Random(target.hanzi)
+        stored = engine._get_distractors(target, 3)
+
+        engine.distractor_rankings = None
+        engine.rng = random.Random(target.hanzi)
+        assert stored == engine._get_distractors(target, 3)
+
+
+def test_truncated_t3_rankings_fall_back_to_live_scoring():
+    engine = HSKTestEngine(9, DataEngine(), num_questions=1)
+    rankings = engine.distractor_rankings
+    if rankings is None:
+        pytest.skip("distractor table not built for the current level data")
+
+    assert rankings.truncated
+    for i in sorted(rankings.truncated)[:20]:
+        target = engine.pool.words[i]
+        assert engine._stored_ranking(target, 3) is None
+        ranked = engine._rank_candidates(target, 3)
+        assert sum(score >= ranked[0][1] - 50 for _, score in ranked) > rankings.top_k
+
+
+def test_stale_distractor_table_is_ignored(tmp_path, write_level):
+    write_level(1, "爱", "八")
+    table = DistractorTable()
+    table.add(["not-the-current-digest"], 1, 1, [[1, 0], [0, 0]])
+    write_distractor_table(table, tmp_path)
+
+    data_engine = DataEngine(data_dir=str(tmp_path), use_cache=False)
+    data_engine.load_level_data(1)
+    assert data_engine.get_distractor_rankings(1) is None
@@ -1,8 +1,11 @@
+import random
+
 import pytest
 
 from hsk.data_engine import DataEngine
+from hsk.exam_cache import ExamCache, get_exam_cache
 from hsk.models import GrammarRule, Question, Word
-from hsk.test_engine import HSKTestEngine, QuestionGenerator
+from hsk.test_engine import HSKTestEngine, QuestionGenerator, generate_exams
 
 
 @pytest.fixture
@@ -68,6 +71,12 @@ def test_radical_hint(mock_data_engine):
     assert "Radical: RadA" in hint
 
 
+def test_find_word(mock_data_engine):
+    engine = HSKTestEngine(1, mock_data_engine)
+    assert engine.find_word("B") is mock_data_engine.words[1][1]
+    assert engine.find_word("Z") is None
+
+
 def test_result_calculation(mock_data_engine):
     engine = HSKTestEngine(1, mock_data_engine)
     # Simulate a perfect score
@@ -79,3 +88,110 @@ def test_result_calculation(mock_data_engine):
     assert result.score == 100
     assert result.passed is True
     assert result.details == "Exam Ready"
+
+
+def test_advanced_band_targets_shared_level():
+    """Every level of a shared advanced band still gets a full exam."""
+    data_engine = DataEngine()
+    for level in (7, 8, 9):
+        engine = HSKTestEngine(level, data_engine, num_questions=5)
+        assert len(engine.questions) == 5
+
+
+@pytest.mark.parametrize("level", [8, 9])
+def test_shared_band_levels_report_the_requested_level(level):
+    """Levels sharing level 7's parsed data still label questions and words as their own."""
+    data_engine = DataEngine()
+    engine = HSKTestEngine(level, data_engine, num_questions=10, seed=1)
+
+    assert data_engine.canonical_level(level) == 7
+    assert all(q.level == level for q in engine.questions)
+    hanzi = engine.pool.target_words(7)[0].hanzi
+    assert data_engine.lookup_word(hanzi, level).level == level
+    assert engine.find_word(hanzi).level == level
+    assert data_engine.lookup_word(hanzi).level == 7
+
+
+def test_generate_exams_is_seeded_per_exam():
+    data_engine = DataEngine()
+    exams = list(generate_exams(4, 3, num_questions=5, seed=10, data_engine=data_engine))
+
+    assert len(exams) == 3
+    assert all(len(questions) == 5 for questions in exams)
+    # Exam i only depends on seed + i, so seed ranges can be generated separately
+    assert list(generate_exams(4, 3, num_questions=5, seed=10, data_engine=data_engine)) == exams
+    assert next(generate_exams(4, 1, num_questions=5, seed=12, data_engine=data_engine)) == exams[2]
+    assert exams[0] != exams[1]
+
+
+def test_empty_engine_leaves_the_global_generator_alone():
+    """An engine built only for its pool (num_questions=0) draws no random numbers."""
+    data_engine = DataEngine()
+    random.seed(5)
+    expected = random.random()
+
+    random.seed(5)
+    engine = HSKTestEngine(4, data_engine, num_questions=0)
+    assert random.random() == expected
+    assert engine.total_questions == 0
+    assert engine.build_exam(5, seed=10) == next(
+        generate_exams(4, 1, num_questions=5, seed=10, data_engine=data_engine)
+    )
+
+
+def test_seeded_exams_are_reproducible():
+    data_engine = DataEngine()
+    get_exam_cache().clear()
+
+    first = HSKTestEngine(5, data_engine, num_questions=8, seed=3)
+    assert get_exam_cache().misses == 1
+    second = HSKTestEngine(5, data_engine, num_questions=8, seed=3)
+    assert get_exam_cache().hits == 1
+    assert second.questions == first.questions
+
+    # An injected generator bypasses the cache but generates the same form
+    injected = HSKTestEngine(5, data_engine, num_questions=8, rng=random.Random(3))
+    assert injected.questions == first.questions
+    assert get_exam_cache().hits == 1
+
+    assert next(generate_exams(5, 1, num_questions=8, seed=3)) == first.questions
+
+
+def test_exam_cache_is_bounded():
+    cache = ExamCache(maxsize=2)
+    for seed in range(3):
+        cache.put((1, 10, seed, ("digest",)), [])
+
+    assert len(cache) == 2
+    assert cache.get((1, 10, 0, ("digest",))) is None
+    assert cache.get((1, 10, 2, ("digest",))) == []
+
+
+def test_question_generator_seed(mock_data_engine):
+    word = mock_data_engine.words[1][0]
+    distractors = mock_data_engine.words[1][1:]
+
+    options = [
+        QuestionGenerator(mock_data_engine, seed=1).generate_mc_question(word, distractors).options
+        for _ in range(2)
+    ]
+    assert options[0] == options[1]
+
+
+@pytest.mark.parametrize("prefetch", [0, 3])
+def test_lazy_exam_matches_eager_exam(prefetch):
+    data_engine = DataEngine()
+    eager = HSKTestEngine(9, data_engine, num_questions=12, rng=random.Random(5))
+    lazy = HSKTestEngine(
+        9, data_engine, num_questions=12, rng=random.Random(5), lazy=True, prefetch=prefetch
+    )
+
+    assert lazy.total_questions == 12
+    if prefetch == 0:
+        assert lazy.questions == []
+
+    asked = []
+    while (q := lazy.get_next_question()) is not None:
+        asked.append(q)
+    assert asked == eager.questions
+    assert lazy.calculate_result().total_questions == 12
@@ -0,0 +1,96 @@
+import json
+
+from hsk.cloze import rank_cloze_sentences
+from scripts.ingest_data import BuildManifest, link_sentences, split_byte_ranges
+
+
+def _levels_data():
+    def vocab(*hanzi):
+        return [{"hanzi": h, "sentences": []} for h in hanzi]
+
+    return {
+        1: {"vocabulary": vocab("我", "是", "学生", "老师"), "grammar": []},
+        2: {"vocabulary": vocab("中国人", "喜欢"), "grammar": []},
+        3: {"vocabulary": vocab("中华人民共和国"), "grammar": []},
+    }
+
+
+def _write_sentences(path):
+    rows = [
+        "1\t我是学生，我是学生。",
+        "2\t我是老师，我是中国人。",
+        "22981\t我是学生，不是老师。",  # Blacklisted
+        "3\t我是。",  # Too short
+        "malformed row",
+        "4\t我喜欢中华人民共和国。",
+    ]
+    rows += [f"{i}\t老师是中国人，我是学生{i}。" for i in range(5, 40)]
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+
+def test_split_byte_ranges_cover_the_file_on_line_starts(tmp_path):
+    path = tmp_path / "sentences.tsv"
+    _write_sentences(path)
+    data = path.read_bytes()
+
+    ranges = split_byte_ranges(path, 7)
+
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+    assert all(data[start - 1 : start] == b"\n" for start, _ in ranges[1:])
+
+
+def test_parallel_linking_matches_serial(tmp_path):
+    path = tmp_path / "sentences.tsv"
+    _write_sentences(path)
+
+    serial = _levels_data()
+    link_sentences(serial, path, workers=1)
+    parallel = _levels_data()
+    link_sentences(parallel, path, workers=3)
+
+    assert json.dumps(parallel, ensure_ascii=False) == json.dumps(serial, ensure_ascii=False)
+    words = {w["hanzi"]: w["sentences"] for data in serial.values() for w in data["vocabulary"]}
+    assert words["学生"][0] == "我是学生，我是学生。"
+    assert words["我"] == ["我是学生，我是学生。"]
+    # The best cloze sentences of every eligible one, not the first five in the file
+    eligible = ["我是老师，我是中国人。"] + [f"老师是中国人，我是学生{i}。" for i in range(5, 40)]
+    assert words["中国人"] == rank_cloze_sentences("中国人", eligible, 8)[:5]
+    assert words["中国人"][0] == "老师是中国人，我是学生10。"
+    # Level 1 words never link a sentence containing a harder word
+    assert "我是老师，我是中国人。" not in words["老师"]
+    assert words["中华人民共和国"] == ["我喜欢中华人民共和国。"]
+
+
+def test_manifest_reuses_stages_whose_inputs_are_unchanged(tmp_path):
+    source = tmp_path / "grammar.csv"
+    source.write_text("a", encoding="utf-8")
+    calls = []
+
+    def build(manifest):
+        first = manifest.run_stage("first", [source], [], lambda: calls.append("first") or [1])
+        second = manifest.run_stage("second", [], ["first"], lambda: calls.append("second") or 2)
+        manifest.save()
+        return first, second
+
+    assert build(BuildManifest(tmp_path)) == ([1], 2)
+    assert build(BuildManifest(tmp_path)) == ([1], 2)
+    assert calls == ["first", "second"]
+
+    # A changed input rebuilds its stage and every stage downstream of it
+    source.write_text("b", encoding="utf-8")
+    build(BuildManifest(tmp_path))
+    assert calls == ["first", "second"] * 2
+    build(BuildManifest(tmp_path, force=True))
+    assert calls == ["first", "second"] * 3
+
+
+def test_manifest_only_rewrites_changed_outputs(tmp_path):
+    manifest = BuildManifest(tmp_path)
+    output = tmp_path / "level_1.json"
+
+    assert manifest.write_output(output, "{}")
+    mtime = output.stat().st_mtime_ns
+    assert not manifest.write_output(output, "{}")
+    assert output.stat().st_mtime_ns == mtime
+    assert manifest.write_output(output, "[]") and output.read_text() == "[]"
@@ -0,0 +1,25 @@
+from hsk.parallel import generate_exams_parallel, split_jobs
+from hsk.test_engine import generate_exams
+
+
+def test_split_jobs_covers_seed_ranges_in_order():
+    jobs = split_jobs([1, 9], 5, seed=100, num_questions=4, chunk_size=2)
+
+    assert jobs == [
+        (1, 100, 2, 4),
+        (1, 102, 2, 4),
+        (1, 104, 1, 4),
+        (9, 100, 2, 4),
+        (9, 102, 2, 4),
+        (9, 104, 1, 4),
+    ]
+
+
+def test_parallel_generation_matches_serial():
+    levels = (2, 9)
+    merged = list(
+        generate_exams_parallel(levels, 3, num_questions=4, seed=7, workers=2, chunk_size=1)
+    )
+
+    serial = [(level, q) for level in levels for q in generate_exams(level, 3, 4, seed=7)]
+    assert merged == serial
@@ -0,0 +1,71 @@
+import os
+import signal
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from hsk.data_engine import DataEngine
+from hsk.prefork import memory_usage, warm_corpus
+
+
+def test_warm_corpus_builds_shared_indexes():
+    data_engine = DataEngine()
+    warm_corpus(data_engine)
+
+    pool = data_engine.get_word_pool(9)
+    assert pool._inverted is not None and pool._positions is not None
+    assert pool._advanced_selection and pool._cloze_candidates
+    assert set(data_engine.words) == set(range(1, 10))
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+def test_memory_usage_reports_private_pages():
+    usage = memory_usage()
+    assert usage is not None
+    assert usage["Rss"] >= usage["Private_Dirty"] > 0
+
+
+WORKER_SCRIPT = """
+import hsk.prefork as prefork
+
+prefork.warm_corpus = lambda data_engine: None  # The corpus is not under test here
+server = prefork.PreforkServer(workers=2, port=0, freeze=False)
+server.report = lambda: print("workers", *server.pids, flush=True)
+server.serve_forever()
+"""
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="pre-fork mode requires os.fork")
+def test_sigterm_stops_workers():
+    parent = subprocess.Popen(
+        [sys.executable, "-c", WORKER_SCRIPT],
+        stdout=subprocess.PIPE,
+        text=True,
+        cwd=Path(__file__).parent.parent,
+    )
+    pids = []
+    try:
+        for line in parent.stdout:
+            if line.startswith("workers"):
+                pids = [int(pid) for pid in line.split()[1:]]
+                break
+        assert len(pids) == 2
+
+        parent.send_signal(signal.SIGTERM)
+        assert parent.wait(timeout=30) == 0
+        assert not any(_alive(pid) for pid in pids)
+    finally:
+        parent.kill()
+        for pid in pids:
+            if _alive(pid):
+                os.kill(pid, signal.SIGKILL)
@@ -0,0 +1,33 @@
+from hsk.segmenter import Segmenter
+
+
+def test_segment_takes_the_longest_match():
+    segmenter = Segmenter(["中国", "中国人", "人", "是"])
+
+    assert segmenter.segment("他是中国人。") == ["他", "是", "中国人", "。"]
+    assert segmenter.segment("中国") == ["中国"]
+    assert segmenter.segment("") == []
+
+
+def test_segment_backs_off_to_the_last_complete_word():
+    # "一举两得" is a prefix path to "一举两得失", which is not a word
+    segmenter = Segmenter(["一举两得", "一举两得失败者", "失"])
+
+    assert segmenter.segment("一举两得失") == ["一举两得", "失"]
+
+
+def test_segment_handles_words_longer_than_four_characters():
+    segmenter = Segmenter(["中华人民共和国", "中华", "人民"])
+
+    assert segmenter.segment("中华人民共和国成立") == ["中华人民共和国", "成", "立"]
+    assert segmenter.max_word_length == 7
+
+
+def test_dictionary_lookups():
+    segmenter = Segmenter(["学生", "学生", ""])
+
+    assert len(segmenter) == 1
+    assert "学生" in segmenter
+    assert "学" not in segmenter and "" not in segmenter
+    assert segmenter.longest_match("我是学生", 2) == "学生"
+    assert segmenter.longest_match("我是学生") == ""
@@ -0,0 +1,99 @@
+import json
+
+import pytest
+
+from hsk.corpus_registry import CorpusRegistry
+from hsk.sentence_store import (
+    STORE_DIGEST_KEY,
+    SentenceStore,
+    build_sentence_store,
+    dumps_level,
+    load_sentence_store,
+    read_level_file,
+    write_sentence_store,
+)
+
+
+def _levels_data():
+    def word(hanzi, sentences):
+        return {"hanzi": hanzi, "pinyin": "p", "meaning": "m [1, 2]", "sentences": sentences}
+
+    band = {"vocabulary": [word("研究", ["我们研究中文。", "他在研究。"])], "grammar": []}
+    return {
+        1: {"vocabulary": [word("我", ["我是学生。"]), word("是", ["我是学生。"])], "grammar": []},
+        7: band,
+        8: band.copy(),
+    }
+
+
+def _migrate(data_dir, levels_data):
+    store, referencing = build_sentence_store(levels_data)
+    write_sentence_store(store, data_dir)
+    for level, data in referencing.items():
+        (data_dir / f"level_{level}.json").write_text(dumps_level(data), encoding="utf-8")
+    return store
+
+
+def test_store_keeps_each_sentence_once(tmp_path):
+    store = SentenceStore(["甲。", "乙。"])
+
+    assert store.add("乙。") == 1 and store.add("丙。") == 2
+    assert store.resolve([2, 0]) == ("丙。", "甲。")
+
+    write_sentence_store(store, tmp_path)
+    loaded, digest = load_sentence_store(tmp_path)
+    assert loaded.sentences == store.sentences and digest == store.digest
+    assert load_sentence_store(tmp_path / "missing") is None
+
+
+def test_levels_reference_sentences_by_id(tmp_path):
+    store = _migrate(tmp_path, _levels_data())
+
+    assert len(store) == 3
+    level_1 = json.loads((tmp_path / "level_1.json").read_text(encoding="utf-8"))
+    assert level_1[STORE_DIGEST_KEY] == store.digest
+    assert [w["sentences"] for w in level_1["vocabulary"]] == [[0], [0]]
+    # The shared band stays byte-identical, and only ID lists are folded onto one line
+    assert (tmp_path / "level_7.json").read_bytes() == (tmp_path / "level_8.json").read_bytes()
+    assert '"sentences": [1, 2]' in (tmp_path / "level_7.json").read_text(encoding="utf-8")
+    expected = {STORE_DIGEST_KEY: store.digest, **_levels_data()[7]}
+    assert read_level_file(tmp_path / "level_7.json") == expected
+
+
+def test_registry_resolves_ids_like_inline_sentences(tmp_path):
+    inline_dir, store_dir = tmp_path / "inline", tmp_path / "store"
+    inline_dir.mkdir()
+    store_dir.mkdir()
+    for level, data in _levels_data().items():
+        (inline_dir / f"level_{level}.json").write_text(json.dumps(data), encoding="utf-8")
+    _migrate(store_dir, _levels_data())
+
+    inline = CorpusRegistry(inline_dir).get_level(1).words
+    words = CorpusRegistry(store_dir).get_level(1).words
+
+    assert words == inline
+    assert words[0].sentences == ("我是学生。",)
+    # Words linked to the same sentence share one string object
+    assert words[0].sentences[0] is words[1].sentences[0]
+
+
+def test_registry_rejects_a_mismatched_store(tmp_path):
+    _migrate(tmp_path, _levels_data())
+    write_sentence_store(SentenceStore(["别的句子。"]), tmp_path)
+
+    with pytest.raises(ValueError, match="sentence store"):
+        CorpusRegistry(tmp_path).get_level(1)
+
+    (tmp_path / "sentence_store.json").unlink()
+    with pytest.raises(FileNotFoundError):
+        CorpusRegistry(tmp_path).get_level(7)
+
+
+def test_compiled_cache_follows_the_sentence_store(tmp_path):
+    """A warm load re-checks the store, even when the level file is unchanged."""
+    _migrate(tmp_path, _levels_data())
+    CorpusRegistry(tmp_path, cache_path=tmp_path / ".cache").get_level(1)
+
+    write_sentence_store(SentenceStore(["别的句子。"]), tmp_path)
+    with pytest.raises(ValueError, match="sentence store"):
+        CorpusRegistry(tmp_path, cache_path=tmp_path / ".cache").get_level(1)
@@ -0,0 +1,122 @@
+import asyncio
+import json
+from http import HTTPStatus
+
+from hsk.constants import MODE_PRACTICE, PRACTICE_QUESTIONS
+from hsk.data_engine import DataEngine
+from hsk.server import ExamServer, HTTPError
+
+
+async def _request(port, method, path, body=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    data = body if isinstance(body, bytes) else json.dumps(body).encode() if body else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+        f"Content-Length: {len(data)}\r\n\r\n".encode()
+        + data
+    )
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(payload)
+
+
+async def _take_exam(port, seed):
+    status, started = await _request(
+        port, "POST", "/exams", {"level": 3, "mode": MODE_PRACTICE, "seed": seed}
+    )
+    assert status == 200
+    session = started["session_id"]
+
+    answered = 0
+    while True:
+        _, question = await _request(port, "GET", f"/exams/{session}/next")
+        if question.get("done"):
+            break
+        assert "correct_answer" not in question
+        # Always pick the first option (or echo a blank for fill-in questions)
+        answer = question["options"][0] if question["options"] else ""
+        status, graded = await _request(
+            port, "POST", f"/exams/{session}/answer", {"answer": answer}
+        )
+        assert status == 200 and isinstance(graded["correct"], bool)
+        answered += 1
+
+    _, result = await _request(port, "GET", f"/exams/{session}/result")
+    return answered, result
+
+
+def test_concurrent_exam_sessions():
+    async def scenario():
+        server = ExamServer(DataEngine())
+        listener = await server.start(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            outcomes = await asyncio.gather(*(_take_exam(port, seed) for seed in range(8)))
+
+            status, error = await _request(port, "POST", "/exams/missing/answer", {"answer": "x"})
+            assert status == 404 and "error" in error
+            status, _ = await _request(port, "POST", "/exams", {"level": 12})
+            assert status == 400
+        return server, outcomes
+
+    server, outcomes = asyncio.run(scenario())
+
+    assert len(server.sessions) == 8
+    for answered, result in outcomes:
+        assert answered == PRACTICE_QUESTIONS
+        assert result["total_questions"] == PRACTICE_QUESTIONS
+        assert result["level"] == 3
+
+
+def test_session_cap_holds_under_concurrent_starts():
+    async def scenario():
+        server = ExamServer(DataEngine(), max_sessions=2)
+        outcomes = await asyncio.gather(
+            *(server.start_exam({"level": 3, "seed": seed}) for seed in range(6)),
+            return_exceptions=True,
+        )
+        return server, outcomes
+
+    server, outcomes = asyncio.run(scenario())
+
+    assert len(server.sessions) == 2
+    rejected = [o for o in outcomes if isinstance(o, HTTPError)]
+    assert len(rejected) == 4
+    assert all(e.status == HTTPStatus.SERVICE_UNAVAILABLE for e in rejected)
+
+
+def test_idle_sessions_expire():
+    async def scenario():
+        server = ExamServer(DataEngine(), max_sessions=1, session_ttl=60)
+        first = await server.start_exam({"level": 3, "seed": 1})
+        server.sessions[first["session_id"]].last_used -= 61  # Abandoned a minute ago
+
+        second = await server.start_exam({"level": 3, "seed": 2})
+        return server, first, second
+
+    server, first, second = asyncio.run(scenario())
+
+    assert list(server.sessions) == [second["session_id"]]
+    assert first["session_id"] not in server.sessions
+
+
+def test_malformed_requests_get_a_response():
+    async def scenario():
+        server = ExamServer(DataEngine())
+
+        async def fail(method, path, body):
+            raise RuntimeError("boom")
+
+        listener = await server.start(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            not_utf8 = await _request(port, "POST", "/exams", '{"level": "\xe9"}'.encode("latin-1"))
+            server.dispatch = fail
+            failed = await _request(port, "GET", "/exams/x/next")
+        return not_utf8, failed
+
+    (status, error), (failed_status, failed_error) = asyncio.run(scenario())
+
+    assert status == 400 and "error" in error
+    assert failed_status == 500 and "error" in failed_error
@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from hsk.data_engine import DataEngine
+from hsk.parallel import generate_exams_parallel
+from hsk.shared_corpus import SharedCorpus, export_corpus
+from hsk.test_engine import HSKTestEngine, generate_exams
+
+
+def _exam(level, data_engine, seed):
+    engine = HSKTestEngine(level, data_engine, num_questions=6, rng=random.Random(seed))
+    return engine.questions
+
+
+@pytest.fixture(scope="module")
+def shared_corpus():
+    corpus = SharedCorpus.create(DataEngine())
+    yield corpus
+    corpus.close()
+    corpus.unlink()
+
+
+@pytest.mark.parametrize("level", [1, 4, 7, 9])
+def test_shared_corpus_generates_identical_exams(shared_corpus, level):
+    attached = SharedCorpus.attach(shared_corpus.name)
+    try:
+        shared_engine = attached.data_engine()
+        for seed in range(3):
+            assert _exam(level, shared_engine, seed) == _exam(level, DataEngine(), seed)
+    finally:
+        attached.close()
+
+
+def test_shared_corpus_serves_levels_without_parsing(shared_corpus):
+    data_engine = shared_corpus.data_engine()
+    regular = DataEngine()
+
+    for level in (3, 8):
+        data_engine.load_level_data(level)
+        regular.load_level_data(level)
+        assert list(data_engine.words[level]) == list(regular.words[level])
+        assert data_engine.grammar_rules[level] == regular.grammar_rules[level]
+        assert data_engine.canonical_level(level) == regular.canonical_level(level)
+    data_engine.load_radicals()
+    regular.load_radicals()
+    assert dict(data_engine.radicals) == dict(regular.radicals)
+    assert data_engine.radicals
+
+
+def test_creator_context_unlinks_the_block():
+    with SharedCorpus.create(DataEngine()) as corpus:
+        name = corpus.name
+        with SharedCorpus.attach(name):
+            pass
+        # Leaving an attached corpus leaves the block in place
+        SharedCorpus.attach(name).close()
+
+    with pytest.raises(FileNotFoundError):
+        SharedCorpus.attach(name)
+
+
+def test_corpus_file_round_trip(tmp_path):
+    path = SharedCorpus.write_file(tmp_path / "corpus.bin")
+    assert path.read_bytes() == export_corpus()
+
+    with SharedCorpus.open_file(path) as corpus:
+        assert corpus.name is None
+        assert _exam(6, corpus.data_engine(), 11) == _exam(6, DataEngine(), 11)
+
+
+def test_parallel_generation_with_shared_corpus_matches_serial():
+    merged = list(
+        generate_exams_parallel(
+            (2, 9), 2, num_questions=4, seed=3, workers=2, mp_context="spawn", shared_corpus=True
+        )
+    )
+
+    serial = [(level, q) for level in (2, 9) for q in generate_exams(level, 2, 4, seed=3)]
+    assert merged == serial
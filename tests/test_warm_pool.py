@@ -0,0 +1,62 @@
+import pytest
+
+from hsk import warm_pool
+from hsk.constants import MODE_EXAM, MODE_PRACTICE, PRACTICE_QUESTIONS
+from hsk.data_engine import DataEngine
+from hsk.warm_pool import ExamWarmPool, questions_for_mode
+
+
+def test_questions_for_mode():
+    assert questions_for_mode(9, MODE_PRACTICE) == PRACTICE_QUESTIONS
+    assert questions_for_mode(9, MODE_EXAM) == 98
+    with pytest.raises(ValueError):
+        questions_for_mode(9, "marathon")
+
+
+def test_warm_pool_hands_out_ready_exams_and_refills():
+    keys = [(1, MODE_PRACTICE), (9, MODE_EXAM)]
+    with ExamWarmPool(DataEngine(), keys, size=2) as pool:
+        assert pool.wait_ready(timeout=30)
+        assert pool.stats()[(9, MODE_EXAM)].ready == 2
+
+        first = pool.acquire(9, MODE_EXAM)
+        second = pool.acquire(9, MODE_EXAM)
+        assert first is not second
+        assert len(first.questions) == 98
+        assert first.questions != second.questions
+
+        # Keys outside the pool are generated on the spot
+        assert len(pool.acquire(2, MODE_PRACTICE).questions) == PRACTICE_QUESTIONS
+
+        assert pool.wait_ready(timeout=30)
+        stats = pool.stats()
+
+    assert (stats[(9, MODE_EXAM)].hits, stats[(9, MODE_EXAM)].misses) == (2, 0)
+    assert stats[(9, MODE_EXAM)].generated == 4
+    assert stats[(9, MODE_EXAM)].ready == 2
+    assert (2, MODE_PRACTICE) not in stats
+    assert stats[(1, MODE_PRACTICE)].hit_rate == 0.0
+
+
+def test_warm_pool_rejects_levels_without_data():
+    with pytest.raises(FileNotFoundError):
+        ExamWarmPool(DataEngine(), [(999, MODE_PRACTICE)])
+
+
+def test_refill_survives_generation_errors(monkeypatch):
+    monkeypatch.setattr(warm_pool, "FAILURE_BACKOFF", 0.01)
+    pool = ExamWarmPool(DataEngine(), [(1, MODE_PRACTICE)], size=2)
+    generate = pool._generate
+    failures = [RuntimeError("corrupt level")]
+
+    def flaky_generate(key):
+        if failures:
+            raise failures.pop()
+        return generate(key)
+
+    monkeypatch.setattr(pool, "_generate", flaky_generate)
+    with pool:
+        assert pool.wait_ready(timeout=30)
+        stats = pool.stats()[(1, MODE_PRACTICE)]
+
+    assert (stats.failed, stats.generated, stats.ready) == (1, 2, 2)
@@ -0,0 +1,71 @@
+import pytest
+
+from hsk.data_engine import DataEngine
+from hsk.models import Word
+from hsk.selection import ACADEMIC_KEYWORDS
+from hsk.word_pool import WordPool
+
+
+def _brute_force_candidates(words, target):
+    """The original linear parallelism filter from HSKTestEngine._get_distractors."""
+    candidates = [w for w in words if w.hanzi != target.hanzi]
+    target_pos = set(target.pos)
+    if target_pos:
+        candidates = [w for w in candidates if w.pos and set(w.pos).intersection(target_pos)]
+    return [w for w in candidates if len(w.hanzi) == len(target.hanzi)]
+
+
+@pytest.mark.parametrize("level", [1, 4, 9])
+def test_parallel_candidates_match_linear_filter(level):
+    data_engine = DataEngine()
+    data_engine.load_level_data(level)
+    pool = data_engine.get_word_pool(level)
+
+    for target in pool.words[::25]:
+        assert pool.parallel_candidates(target) == _brute_force_candidates(pool.words, target)
+
+
+def test_parallel_candidates_without_pos():
+    words = [
+        Word("爱", "ài", "love", 1, pos=["v"]),
+        Word("八", "bā", "eight", 1),
+        Word("爸爸", "bàba", "dad", 1, pos=["n"]),
+    ]
+    pool = WordPool(words)
+
+    assert pool.parallel_candidates(words[1]) == [words[0]]
+    assert pool.parallel_candidates(words[0]) == []
+
+
+def test_word_pool_shared_across_engines():
+    first, second = DataEngine(), DataEngine()
+    first.load_level_data(1)
+    second.load_level_data(1)
+    assert first.get_word_pool(1) is second.get_word_pool(1)
+
+
+def test_advanced_selection_matches_per_exam_ranking():
+    data_engine = DataEngine()
+    for level in (7, 8, 9):
+        data_engine.load_level_data(level)
+    pool = data_engine.get_word_pool(9)
+    target_level = data_engine.canonical_level(9)
+
+    # The original per-exam filter and sort from HSKTestEngine._generate_test
+    expected = [
+        w
+        for w in pool.words
+        if w.level == target_level and not (w.pos and any(p in ["e", "y", "o"] for p in w.pos))
+    ]
+    expected.sort(
+        key=lambda w: (
+            len(w.sentences) > 0,
+            any(k in w.meaning.lower() or k in w.hanzi for k in ACADEMIC_KEYWORDS),
+            len(w.hanzi) >= 2,
+            -w.frequency,
+        ),
+        reverse=True,
+    )
+
+    assert list(pool.advanced_selection(target_level)) == expected
+    assert pool.advanced_selection(target_level) is pool.advanced_selection(target_level)